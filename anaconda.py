@@ -253,6 +253,11 @@ if __name__ == "__main__":
     setup_python_updates()
     setup_python_path()
 
+    # profile the imports on the way to the first screen
+    from pyanaconda.core.import_profile import ImportProfiler
+    import_profiler = ImportProfiler()
+    import_profiler.start()
+
     # init threading before Gtk can do anything and before we start using threads
     from pyanaconda.threading import AnacondaThread, threadMgr
     from pyanaconda.core.i18n import _
@@ -270,9 +275,15 @@ if __name__ == "__main__":
     # Set up logging as early as possible.
     from pyanaconda import anaconda_logging
     from pyanaconda import anaconda_loggers
-    anaconda_logging.init(write_to_journal=conf.target.is_hardware)
+    anaconda_logging.init(write_to_journal=conf.target.is_hardware,
+                          async_logging=opts.asynclog)
     anaconda_logging.logger.setupVirtio(opts.virtiolog)
 
+    # Write the machine-readable progress if requested.
+    if opts.progressstream:
+        from pyanaconda.progress_stream import start_progress_stream
+        start_progress_stream(opts.progressstream)
+
     # Load the remaining configuration after a logging is set up.
     conf.set_from_product(opts.product_name, opts.variant_name)
     conf.set_from_files()
@@ -746,6 +757,12 @@ if __name__ == "__main__":
             sync_run_task(snapshot_task_proxy)
 
     anaconda.intf.setup(ksdata)
+
+    # log the slowest imports of the startup
+    import_profiler.stop()
+    for line in import_profiler.get_report():
+        log.debug(line)
+
     anaconda.intf.run()
 
 # vim:tw=78:ts=4:et:sw=4
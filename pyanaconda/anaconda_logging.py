@@ -19,11 +19,15 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 #
 
+import atexit
+import copy
 import logging
 from logging.handlers import SysLogHandler, SocketHandler
 from systemd.journal import JournalHandler
 import os
+import queue
 import sys
+import threading
 import warnings
 
 from pyanaconda.core import constants
@@ -44,6 +48,12 @@ SENSITIVE_INFO_LOG_FILE = "/tmp/sensitive-info.log"
 ANACONDA_SYSLOG_FACILITY = SysLogHandler.LOG_LOCAL1
 ANACONDA_SYSLOG_IDENTIFIER = "anaconda"
 
+# the maximal time of waiting for the written logs in the crash handler
+CRASH_LOG_FLUSH_TIMEOUT = 5
+
+# the maximal time of waiting for the written logs otherwise
+LOG_FLUSH_TIMEOUT = 30
+
 from threading import Lock
 program_log_lock = Lock()
 
@@ -61,10 +71,24 @@ def autoSetLevel(handler, value):
 
 # all handlers of given logger with autoSetLevel == True are set to level
 def setHandlersLevel(logr, level):
-    for handler in filter(lambda hdlr: hasattr(hdlr, "autoSetLevel") and hdlr.autoSetLevel, logr.handlers):
+    for handler in filter(lambda hdlr: hasattr(hdlr, "autoSetLevel") and hdlr.autoSetLevel,
+                          _get_target_handlers(logr)):
         handler.setLevel(level)
 
 
+def _get_target_handlers(logr):
+    """Return handlers of the given logger including the queued ones."""
+    handlers = []
+
+    for handler in logr.handlers:
+        if isinstance(handler, AnacondaQueueHandler):
+            handlers.extend(handler.targets)
+        else:
+            handlers.append(handler)
+
+    return handlers
+
+
 class _AnacondaLogFixer(object):
     """ A mixin for logging.StreamHandler that does not lock during format.
 
@@ -144,6 +168,186 @@ class AnacondaStreamHandler(_AnacondaLogFixer, logging.StreamHandler):
     pass
 
 
+class AnacondaQueueHandler(logging.Handler):
+    """A handler that passes log records to the log writer.
+
+    The record is prepared on the thread of the caller, so it doesn't
+    reference any mutable arguments, and then enqueued together with
+    the target handlers. The target handlers are called later from
+    the thread of the log writer.
+    """
+
+    def __init__(self, writer):
+        super().__init__(level=logging.NOTSET)
+        self._writer = writer
+        self._exception_formatter = logging.Formatter()
+        self.targets = []
+
+    def prepare(self, record):
+        """Return a copy of the record that is safe to be enqueued."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self._exception_formatter.formatException(record.exc_info)
+
+            record.exc_info = None
+
+        return record
+
+    def handle(self, record):
+        # the queue is thread-safe, so don't acquire the handler lock
+        rv = self.filter(record)
+        if rv:
+            self.emit(record)
+        return rv
+
+    def emit(self, record):
+        try:
+            self._writer.enqueue(self.targets, self.prepare(record))
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+
+
+class AnacondaLogWriter(object):
+    """Write the queued log records in batches from a dedicated thread.
+
+    Log calls only enqueue the records, so the callers are not blocked
+    by writes to the log files or by forwarding to the journal. Stream
+    handlers are flushed once per batch instead of once per record.
+
+    If the writer is not running, the records are written synchronously.
+    """
+
+    # The maximal number of records processed in one batch.
+    BATCH_SIZE = 512
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = None
+
+    @property
+    def is_running(self):
+        """Is the writer thread running?"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start the writer thread."""
+        if self.is_running:
+            return
+
+        # Don't use AnacondaThread here. The thread manager logs.
+        self._thread = threading.Thread(name="AnaLogWriterThread", target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def enqueue(self, handlers, record):
+        """Enqueue a log record for the given handlers.
+
+        :param handlers: a list of target handlers
+        :param record: a prepared log record
+        """
+        if not self.is_running:
+            self._write_batch([(handlers, record)])
+            return
+
+        self._queue.put((handlers, record))
+
+    def flush(self, timeout=None):
+        """Wait until all enqueued records are written.
+
+        :param timeout: a number of seconds to wait or None
+        :return: True if the records were written, otherwise False
+        """
+        if not self.is_running or threading.current_thread() is self._thread:
+            return True
+
+        event = threading.Event()
+        self._queue.put(event)
+        return event.wait(timeout)
+
+    def stop(self, timeout=None):
+        """Write all enqueued records and stop the writer thread.
+
+        :param timeout: a number of seconds to wait or None
+        """
+        if not self.is_running or threading.current_thread() is self._thread:
+            return
+
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _run(self):
+        """Process the queue until the writer is stopped."""
+        while True:
+            batch, events, stop = self._get_batch()
+            self._write_batch(batch)
+
+            for event in events:
+                event.set()
+
+            if stop:
+                break
+
+    def _get_batch(self):
+        """Block until there are some items in the queue and collect them.
+
+        :return: a tuple with a list of records, a list of flush events
+                 and a flag that the writer should stop
+        """
+        batch = []
+        events = []
+        item = self._queue.get()
+
+        while True:
+            if item is None:
+                return batch, events, True
+            elif isinstance(item, threading.Event):
+                events.append(item)
+            else:
+                batch.append(item)
+
+            if len(batch) >= self.BATCH_SIZE:
+                break
+
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+        return batch, events, False
+
+    def _write_batch(self, batch):
+        """Pass the records to their handlers and flush the streams."""
+        streams = []
+
+        for handlers, record in batch:
+            for handler in handlers:
+                if record.levelno < handler.level or not handler.filter(record):
+                    continue
+
+                if isinstance(handler, logging.StreamHandler):
+                    self._write_record(handler, record)
+
+                    if handler not in streams:
+                        streams.append(handler)
+                else:
+                    handler.handle(record)
+
+        for handler in streams:
+            handler.flush()
+
+    @staticmethod
+    def _write_record(handler, record):
+        """Write the record to the stream of the handler without flushing."""
+        try:
+            handler.stream.write(handler.format(record) + handler.terminator)
+        except Exception:  # pylint: disable=broad-except
+            handler.handleError(record)
+
+
 class AnacondaPrefixFilter(logging.Filter):
     """Add a log_prefix field, which is based on the name property,
     but without the "anaconda." prefix.
@@ -167,10 +371,18 @@ class AnacondaPrefixFilter(logging.Filter):
 class AnacondaLog(object):
     SYSLOG_CFGFILE = "/etc/rsyslog.conf"
 
-    def __init__(self, write_to_journal=False):
+    def __init__(self, write_to_journal=False, async_logging=False):
         self.loglevel = DEFAULT_LEVEL
         self.remote_syslog = None
         self.write_to_journal = write_to_journal
+        self.writer = None
+
+        # Write the log files and the journal from a dedicated thread.
+        if async_logging:
+            self.writer = AnacondaLogWriter()
+            self.writer.start()
+            atexit.register(self.writer.stop, LOG_FLUSH_TIMEOUT)
+
         # Rename the loglevels so they are the same as in syslog.
         logging.addLevelName(logging.CRITICAL, "CRT")
         logging.addLevelName(logging.ERROR, "ERR")
@@ -240,13 +452,15 @@ class AnacondaLog(object):
         stdout_logger.setLevel(logging.INFO)
         # Add a handler for the duped stuff.  No fancy formatting, thanks.
         self.addFileHandler(sys.stdout, stdout_logger,
-                            fmtStr=STDOUT_FORMAT, minLevel=logging.INFO)
+                            fmtStr=STDOUT_FORMAT, minLevel=logging.INFO,
+                            queued=False)
 
     # Add a simple handler - file or stream, depending on what we're given.
     def addFileHandler(self, dest, addToLogger, minLevel=DEFAULT_LEVEL,
                        fmtStr=ENTRY_FORMAT,
                        autoLevel=False,
-                       log_filter=None):
+                       log_filter=None,
+                       queued=True):
         try:
             if isinstance(dest, str):
                 logfile_handler = AnacondaFileHandler(dest)
@@ -258,7 +472,7 @@ class AnacondaLog(object):
             logfile_handler.setLevel(minLevel)
             logfile_handler.setFormatter(logging.Formatter(fmtStr, DATE_FORMAT))
             autoSetLevel(logfile_handler, autoLevel)
-            addToLogger.addHandler(logfile_handler)
+            self._add_handler(addToLogger, logfile_handler, queued)
         except IOError:
             pass
 
@@ -280,7 +494,37 @@ class AnacondaLog(object):
             journal_handler.addFilter(log_filter)
         if log_formatter:
             journal_handler.setFormatter(log_formatter)
-        logr.addHandler(journal_handler)
+        self._add_handler(logr, journal_handler)
+
+    def _add_handler(self, logr, handler, queued=True):
+        """Add a handler to the logger.
+
+        If the asynchronous logging is enabled, the handler will be
+        called from the log writer thread.
+        """
+        if not self.writer or not queued:
+            logr.addHandler(handler)
+            return
+
+        for queue_handler in logr.handlers:
+            if isinstance(queue_handler, AnacondaQueueHandler):
+                break
+        else:
+            queue_handler = AnacondaQueueHandler(self.writer)
+            logr.addHandler(queue_handler)
+
+        queue_handler.targets.append(handler)
+
+    def flush(self, timeout=None):
+        """Make sure that all log records are written.
+
+        :param timeout: a number of seconds to wait or None
+        :return: True if the records were written, otherwise False
+        """
+        if self.writer:
+            return self.writer.flush(timeout)
+
+        return True
 
     # pylint: disable=redefined-builtin
     def showwarning(self, message, category, filename, lineno,
@@ -331,9 +575,23 @@ class AnacondaLog(object):
         self.restartSyslog()
 
 
-def init(write_to_journal=False):
+def init(write_to_journal=False, async_logging=False):
     global logger
-    logger = AnacondaLog(write_to_journal=write_to_journal)
+    logger = AnacondaLog(write_to_journal=write_to_journal, async_logging=async_logging)
+
+
+def flush(timeout=None):
+    """Make sure that all log records are written.
+
+    Call this before the logs are collected or copied.
+
+    :param timeout: a number of seconds to wait or None
+    :return: True if the records were written, otherwise False
+    """
+    if logger:
+        return logger.flush(timeout)
+
+    return True
 
 
 logger = None
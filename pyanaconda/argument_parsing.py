@@ -30,7 +30,8 @@ from argparse import ArgumentParser, ArgumentError, HelpFormatter, Namespace, Ac
 
 from pyanaconda.flags import flags as flags_instance
 from pyanaconda.core.kernel import KernelArguments
-from pyanaconda.core.constants import DisplayModes, X_TIMEOUT, VIRTIO_PORT
+from pyanaconda.core.constants import DisplayModes, X_TIMEOUT, VIRTIO_PORT, \
+    PROGRESS_STREAM_FILE
 
 from pyanaconda.anaconda_loggers import get_module_logger
 log = get_module_logger(__name__)
@@ -499,6 +500,10 @@ def getArgumentParser(version_string, boot_cmdline=None):
     ap.add_argument("--remotelog", metavar="HOST:PORT", help=help_parser.help_text("remotelog"))
     ap.add_argument("--virtiolog", metavar="/dev/virtio-ports/NAME", default=VIRTIO_PORT,
                     help=help_parser.help_text("virtiolog"))
+    ap.add_argument("--asynclog", action="store_true", default=False,
+                    help=help_parser.help_text("asynclog"))
+    ap.add_argument("--progressstream", nargs="?", const=PROGRESS_STREAM_FILE, default=None,
+                    metavar="PATH", help=help_parser.help_text("progressstream"))
 
     from pykickstart.constants import SELINUX_DISABLED, SELINUX_ENFORCING
     from pyanaconda.core.constants import SELINUX_DEFAULT
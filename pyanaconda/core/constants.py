@@ -106,6 +106,14 @@ GRAPHICAL_TARGET = 'graphical.target'
 # See: https://3.python-requests.org/user/advanced/#timeouts
 NETWORK_CONNECTION_TIMEOUT = 46  # in seconds
 NETWORK_CONNECTED_CHECK_INTERVAL = 0.1  # in seconds
+NETWORK_DEVICES_CHECK_INTERVAL = 1  # in seconds
+
+# The maximal number of hosts with pooled connections per shared session.
+NETWORK_POOL_HOSTS = 10
+# The maximal number of connections to one host per shared session.
+NETWORK_POOL_CONNECTIONS_PER_HOST = 4
+# The maximal time of waiting for a free pooled connection.
+NETWORK_POOL_TIMEOUT = NETWORK_CONNECTION_TIMEOUT  # in seconds
 
 # DBus
 DEFAULT_DBUS_TIMEOUT = -1       # use default
@@ -123,7 +131,9 @@ THREAD_SOFTWARE_WATCHER = "AnaSoftwareWatcher"
 THREAD_CHECK_SOFTWARE = "AnaCheckSoftwareThread"
 THREAD_SOURCE_WATCHER = "AnaSourceWatcher"
 THREAD_INSTALL = "AnaInstallThread"
+THREAD_PROGRESS_CHANNEL = "AnaProgressChannelThread"
 THREAD_GEOLOCATION_REFRESH = "AnaGeolocationRefreshThread"
+THREAD_GEOLOCATION_PROVIDER = "AnaGeolocationProviderThread"
 THREAD_DATE_TIME = "AnaDateTimeThread"
 THREAD_TIME_INIT = "AnaTimeInitThread"
 THREAD_DASDFMT = "AnaDasdfmtThread"
@@ -133,6 +143,12 @@ THREAD_NTP_SERVER_CHECK = "AnaNTPserver"
 THREAD_DBUS_TASK = "AnaTaskThread"
 THREAD_SUBSCRIPTION = "AnaSubscriptionThread"
 
+# Priorities of pooled threads
+# - threads with a lower value are started first
+THREAD_PRIORITY_HIGH = 0
+THREAD_PRIORITY_NORMAL = 1
+THREAD_PRIORITY_LOW = 2
+
 # Geolocation constants
 
 # geolocation providers
@@ -147,6 +163,16 @@ GEOLOC_DEFAULT_PROVIDER = GEOLOC_PROVIDER_FEDORA_GEOIP
 GEOLOC_DEFAULT_GEOCODER = GEOLOC_GEOCODER_NOMINATIM
 # timeout (in seconds)
 GEOLOC_TIMEOUT = 3
+# a file with the result of the geolocation lookup
+# - it survives restarts of the installer
+GEOLOC_CACHE_FILE = "/run/install/geoloc.json"
+
+# a default file with the machine-readable progress of the installation
+PROGRESS_STREAM_FILE = "/run/install/progress.jsonl"
+
+# a directory with the cached remote resources
+# - it is shared by all processes of the installer
+REMOTE_CACHE_DIR = "/run/install/remote"
 
 
 ANACONDA_ENVIRON = "anaconda"
@@ -317,6 +343,9 @@ NTP_SERVER_QUERY = 2
 # Timeout for the NTP server check
 NTP_SERVER_TIMEOUT = 5
 
+# How long is a result of the NTP server check valid (in seconds)
+NTP_SERVER_STATUS_TTL = 60
+
 # Storage checker constraints
 STORAGE_MIN_RAM = "min_ram"
 STORAGE_ROOT_DEVICE_TYPES = "root_device_types"
@@ -450,6 +479,13 @@ SOURCE_REPO_FILE_TYPES = (
     SOURCE_TYPE_CDN,
 )
 
+# All types that can be set up without the local storage.
+SOURCE_NETWORK_TYPES = (
+    SOURCE_TYPE_URL,
+    SOURCE_TYPE_CLOSEST_MIRROR,
+    SOURCE_TYPE_CDN,
+)
+
 # Payload URL source types.
 URL_TYPE_BASEURL = "BASEURL"
 URL_TYPE_MIRRORLIST = "MIRRORLIST"
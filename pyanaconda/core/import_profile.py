@@ -0,0 +1,188 @@
+#
+# Profiling of imported modules.
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+# This module is imported before the logging is set up, so it shouldn't
+# import anything from pyanaconda.
+#
+import sys
+import threading
+import time
+
+__all__ = ["ImportProfiler"]
+
+
+class ImportProfiler(object):
+    """Profiler of imported modules.
+
+    The profiler measures how long it takes to execute every imported
+    module, similarly to the -X importtime option of Python. The cumulative
+    time of a module includes the time of modules imported by the module.
+    The self time doesn't.
+    """
+
+    def __init__(self):
+        self._times = {}
+        self._loaders = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._start_time = None
+        self._stop_time = None
+
+    @property
+    def times(self):
+        """Times of the imported modules.
+
+        :return: a dictionary of module names and tuples of the self time
+                 and the cumulative time in seconds
+        """
+        return dict(self._times)
+
+    @property
+    def total_time(self):
+        """Time between the start and the stop of the profiler in seconds."""
+        if self._start_time is None:
+            return 0.0
+
+        return (self._stop_time or time.monotonic()) - self._start_time
+
+    def start(self):
+        """Start to profile the imported modules."""
+        if self in sys.meta_path:
+            return
+
+        self._start_time = time.monotonic()
+        self._stop_time = None
+        sys.meta_path.insert(0, self)
+
+    def stop(self):
+        """Stop to profile the imported modules."""
+        if self not in sys.meta_path:
+            return
+
+        self._stop_time = time.monotonic()
+        sys.meta_path.remove(self)
+        self._restore_loaders()
+
+    def find_spec(self, fullname, path, target=None):
+        """Find a spec of the module with the other finders.
+
+        The spec is used to profile the execution of the module.
+        """
+        # Avoid a recursion.
+        if getattr(self._local, "finding", False):
+            return None
+
+        self._local.finding = True
+
+        try:
+            spec = self._find_spec(fullname, path, target)
+        finally:
+            self._local.finding = False
+
+        if spec is None or spec.loader is None:
+            return None
+
+        # Skip loaders shared by multiple modules, for example,
+        # the importers of the built-in and frozen modules.
+        if isinstance(spec.loader, type) or not hasattr(spec.loader, "exec_module"):
+            return spec
+
+        self._profile_loader(spec.loader)
+        return spec
+
+    def _find_spec(self, fullname, path, target):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+
+            spec = finder.find_spec(fullname, path, target)
+
+            if spec is not None:
+                return spec
+
+        return None
+
+    def _profile_loader(self, loader):
+        """Profile the execution of modules by the given loader.
+
+        The loader can be shared by multiple modules, so it is patched
+        only once and the name of the module is taken from the module.
+        """
+        with self._lock:
+            if id(loader) in self._loaders:
+                return
+
+            exec_module = loader.exec_module
+            patched = getattr(loader, "__dict__", {}).get("exec_module")
+
+            def _exec_module(module):
+                stack = self._get_stack()
+                stack.append(0.0)
+                start = time.monotonic()
+
+                try:
+                    exec_module(module)
+                finally:
+                    cumulative = time.monotonic() - start
+                    children = stack.pop()
+
+                    if stack:
+                        stack[-1] += cumulative
+
+                    self._times[module.__name__] = (cumulative - children, cumulative)
+
+            try:
+                loader.exec_module = _exec_module
+            except AttributeError:
+                return
+
+            self._loaders[id(loader)] = (loader, patched)
+
+    def _restore_loaders(self):
+        """Restore the original methods of the patched loaders."""
+        with self._lock:
+            loaders = list(self._loaders.values())
+            self._loaders = {}
+
+        for loader, patched in loaders:
+            if patched is None:
+                del loader.exec_module
+            else:
+                loader.exec_module = patched
+
+    def _get_stack(self):
+        """Get a stack of the modules executed by the current thread."""
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+
+        return self._local.stack
+
+    def get_report(self, limit=20):
+        """Get a report with the slowest imports.
+
+        :param limit: a maximal number of reported modules
+        :return: a list of lines
+        """
+        lines = ["Imported %d modules in %.3f s." % (len(self._times), self.total_time)]
+        items = sorted(self._times.items(), key=lambda item: item[1][1], reverse=True)
+
+        for name, (self_time, cumulative) in items[:limit]:
+            lines.append("  %8.3f s %8.3f s  %s" % (self_time, cumulative, name))
+
+        return lines
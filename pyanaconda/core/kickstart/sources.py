@@ -0,0 +1,81 @@
+#
+# Loading of kickstart sources.
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import shlex
+
+from pykickstart.errors import KickstartError
+from pykickstart.i18n import _
+from pykickstart.parser import KickstartParser
+
+from pyanaconda.core.remote_cache import get_remote_cache, RemoteResourceError
+
+__all__ = ["find_remote_includes", "CachingKickstartParser"]
+
+
+def _is_remote_source(path):
+    """Is the kickstart source a remote one?"""
+    return "://" in path and not path.startswith("file://")
+
+
+def find_remote_includes(content):
+    """Find remote sources included by the given kickstart.
+
+    :param content: a content of the kickstart source
+    :return: a list of URLs
+    """
+    urls = []
+
+    for line in content.splitlines():
+        try:
+            args = shlex.split(line.strip(), comments=True)
+        except ValueError:
+            continue
+
+        if len(args) == 2 and args[0] == "%include" and _is_remote_source(args[1]):
+            urls.append(args[1])
+
+    return urls
+
+
+class CachingKickstartParser(KickstartParser):
+    """Kickstart parser that loads remote sources from the cache.
+
+    Remote kickstart files, including the files from %include, are
+    fetched only once and cached on the disk, so they are shared by
+    all processes of the installer. Local files are read every time,
+    because they can be generated or modified by %pre scripts.
+    """
+
+    def readKickstart(self, f, reset=True):
+        """Process a kickstart file, given by the filename f."""
+        if _is_remote_source(f):
+            try:
+                f = get_remote_cache().fetch(f)
+            except RemoteResourceError as e:
+                raise KickstartError(
+                    _("Unable to open input kickstart file: %s") % str(e), lineno=0
+                ) from e
+
+        super().readKickstart(f, reset=reset)
+
+    def readKickstartFromString(self, s, reset=True):
+        """Process a kickstart file, provided as the string s."""
+        # Fetch the included remote sources in advance.
+        get_remote_cache().prefetch(find_remote_includes(s))
+        super().readKickstartFromString(s, reset=reset)
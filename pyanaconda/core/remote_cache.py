@@ -0,0 +1,279 @@
+#
+# Local cache of remote resources.
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse, unquote
+
+from requests import RequestException
+
+from pyanaconda.core.constants import REMOTE_CACHE_DIR, NETWORK_CONNECTION_TIMEOUT
+from pyanaconda.core.session_pool import get_shared_session
+from pyanaconda.anaconda_loggers import get_module_logger
+
+log = get_module_logger(__name__)
+
+__all__ = ["RemoteResourceError", "RemoteResourceCache", "get_remote_cache"]
+
+# Maximal number of concurrently prefetched resources.
+REMOTE_CACHE_MAX_WORKERS = 8
+
+
+class RemoteResourceError(Exception):
+    """The remote resource can't be fetched."""
+
+    def __init__(self, message, status_code=None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class RemoteResourceCache(object):
+    """Local cache of remote resources.
+
+    The remote resources fetched during the installation are stored in
+    a directory under /run/install, so they are shared by all processes
+    of the installer. The resources are keyed by their URLs. The ETag
+    and Last-Modified validators are stored with them, so a cached
+    resource can be revalidated with a conditional request.
+    """
+
+    def __init__(self, cache_dir=REMOTE_CACHE_DIR):
+        """Create a new cache.
+
+        :param cache_dir: a path to the directory with the cache
+        """
+        self._cache_dir = cache_dir
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    @property
+    def cache_dir(self):
+        """A path to the directory with the cache."""
+        return self._cache_dir
+
+    def _get_paths(self, url):
+        """Get paths to the content and the metadata of the resource."""
+        key = hashlib.sha256(url.encode("utf-8", "surrogateescape")).hexdigest()
+        path = os.path.join(self._cache_dir, key)
+        return path, path + ".json"
+
+    def _get_url_lock(self, url):
+        """Get a lock of the given URL."""
+        with self._lock:
+            return self._locks.setdefault(url, threading.Lock())
+
+    def get_cached_path(self, url):
+        """Get a path to the cached resource.
+
+        :param url: an URL of the resource
+        :return: a path or None if the resource is not cached
+        """
+        path, _metadata_path = self._get_paths(url)
+
+        if not os.path.exists(path):
+            return None
+
+        return path
+
+    def fetch(self, url, session=None, headers=None, revalidate=False):
+        """Fetch the remote resource.
+
+        The cached resource is used if it exists. If it should be
+        revalidated, the server is asked if the resource has changed.
+        The local files are not cached.
+
+        :param url: an URL of the resource
+        :param session: a requests session or None for the shared session
+        :param headers: a dictionary of additional headers or None
+        :param revalidate: should be the cached resource revalidated?
+        :return: a path to the local copy of the resource
+        :raise: RemoteResourceError if the resource can't be fetched
+        """
+        if url.startswith("file://"):
+            return self._get_local_path(url)
+
+        with self._get_url_lock(url):
+            return self._fetch(url, session, headers, revalidate)
+
+    @staticmethod
+    def _get_local_path(url):
+        """Get a path of the local file."""
+        path = unquote(urlparse(url).path)
+
+        if not os.path.exists(path):
+            raise RemoteResourceError("File {} doesn't exist.".format(path), 404)
+
+        return path
+
+    def _fetch(self, url, session, headers, revalidate):
+        path, metadata_path = self._get_paths(url)
+        cached = os.path.exists(path)
+
+        if cached and not revalidate:
+            log.debug("Using the cached %s.", url)
+            return path
+
+        request_headers = dict(headers or {})
+
+        if cached:
+            validators = self._load_validators(metadata_path)
+
+            if "etag" in validators:
+                request_headers["If-None-Match"] = validators["etag"]
+
+            if "last-modified" in validators:
+                request_headers["If-Modified-Since"] = validators["last-modified"]
+
+        session = session or get_shared_session()
+
+        try:
+            response = session.get(url, headers=request_headers,
+                                   timeout=NETWORK_CONNECTION_TIMEOUT)
+        except RequestException as e:
+            raise RemoteResourceError("Error accessing URL {}: {}".format(url, e)) from e
+
+        if cached and response.status_code == 304:
+            log.debug("The cached %s is up to date.", url)
+            return path
+
+        if not response.ok:
+            raise RemoteResourceError(
+                "Server returned {} for {}.".format(response.status_code, url),
+                response.status_code
+            )
+
+        validators = {
+            name: response.headers[name]
+            for name in ("etag", "last-modified")
+            if response.headers.get(name)
+        }
+
+        try:
+            self._store(path, metadata_path, url, response.content, validators)
+        except OSError as e:
+            raise RemoteResourceError("Can't store {}: {}".format(url, e)) from e
+
+        log.debug("Fetched and cached %s.", url)
+        return path
+
+    def _load_validators(self, metadata_path):
+        """Load the validators of the cached resource."""
+        try:
+            with open(metadata_path, "r") as f:
+                return json.load(f).get("validators", {})
+        except (OSError, ValueError, AttributeError) as e:
+            log.debug("Unable to load the metadata %s: %s", metadata_path, e)
+            return {}
+
+    def _store(self, path, metadata_path, url, content, validators):
+        """Store the resource and its metadata.
+
+        The files are replaced atomically, so other processes never
+        read a partial file. The content is stored first, so the stored
+        validators are never newer than the content.
+        """
+        os.makedirs(self._cache_dir, exist_ok=True)
+
+        self._write_file(path, content)
+        self._write_file(metadata_path, json.dumps({
+            "url": url,
+            "validators": validators
+        }).encode("utf-8"))
+
+    def _write_file(self, path, data):
+        fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir)
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+            raise
+
+    def load_to_str(self, url, session=None, headers=None, revalidate=False):
+        """Fetch the remote resource and return its content.
+
+        :param url: an URL of the resource
+        :param session: a requests session or None for the shared session
+        :param headers: a dictionary of additional headers or None
+        :param revalidate: should be the cached resource revalidated?
+        :return: a string with the content
+        :raise: RemoteResourceError if the resource can't be fetched
+        """
+        path = self.fetch(url, session, headers, revalidate)
+
+        try:
+            with open(path, "r", encoding="utf-8", errors="surrogateescape") as f:
+                return f.read()
+        except OSError as e:
+            raise RemoteResourceError("Can't read {}: {}".format(url, e)) from e
+
+    def prefetch(self, urls, session=None):
+        """Fetch the remote resources concurrently in the background.
+
+        The resources that are already cached are skipped. The errors
+        are ignored, the consumers will get them when they fetch the
+        resources again.
+
+        :param urls: a list of URLs
+        :param session: a requests session or None for the shared session
+        """
+        urls = [url for url in dict.fromkeys(urls)
+                if not url.startswith("file://") and not self.get_cached_path(url)]
+
+        if not urls:
+            return
+
+        log.debug("Prefetching %s.", ", ".join(urls))
+        executor = ThreadPoolExecutor(
+            max_workers=min(len(urls), REMOTE_CACHE_MAX_WORKERS),
+            thread_name_prefix="AnaPrefetchThread"
+        )
+
+        for url in urls:
+            executor.submit(self._prefetch, url, session)
+
+        executor.shutdown(wait=False)
+
+    def _prefetch(self, url, session):
+        try:
+            self.fetch(url, session)
+        except RemoteResourceError as e:
+            log.debug("Failed to prefetch %s: %s", url, e)
+
+
+_remote_cache = RemoteResourceCache()
+
+
+def get_remote_cache():
+    """Get the cache of remote resources.
+
+    :return: an instance of RemoteResourceCache
+    """
+    return _remote_cache
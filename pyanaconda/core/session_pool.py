@@ -0,0 +1,283 @@
+#
+# Shared pool of requests sessions.
+#
+# Copyright (C) 2026  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import EmptyPoolError
+from requests_file import FileAdapter
+from requests_ftp import FTPAdapter
+
+from pyanaconda.core.constants import NETWORK_POOL_HOSTS, NETWORK_POOL_CONNECTIONS_PER_HOST, \
+    NETWORK_POOL_TIMEOUT
+from pyanaconda.anaconda_loggers import get_module_logger
+
+log = get_module_logger(__name__)
+
+__all__ = ["SessionPool", "SessionStatistics", "get_session_pool", "get_shared_session"]
+
+
+class SessionStatistics(object):
+    """Thread-safe counters of the pooled sessions."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._bytes = 0
+        self._connections = 0
+        self._connection_time = 0.0
+
+    @property
+    def requests(self):
+        """Number of sent HTTP requests."""
+        with self._lock:
+            return self._requests
+
+    @property
+    def bytes(self):
+        """Number of received bytes of response bodies.
+
+        The size of a streamed response is taken from its
+        Content-Length header.
+        """
+        with self._lock:
+            return self._bytes
+
+    @property
+    def connections(self):
+        """Number of established connections."""
+        with self._lock:
+            return self._connections
+
+    @property
+    def connection_time(self):
+        """Time spent by establishing connections including TLS handshakes."""
+        with self._lock:
+            return self._connection_time
+
+    def add_request(self, size):
+        """Count a finished request.
+
+        :param size: a number of received bytes
+        """
+        with self._lock:
+            self._requests += 1
+            self._bytes += size
+
+    def add_connection(self, elapsed_time):
+        """Count a new connection.
+
+        :param elapsed_time: a number of seconds spent by connecting
+        """
+        with self._lock:
+            self._connections += 1
+            self._connection_time += elapsed_time
+
+    def __str__(self):
+        with self._lock:
+            return "{} requests, {} bytes, {} connections in {:.2f} s".format(
+                self._requests, self._bytes, self._connections, self._connection_time
+            )
+
+
+def _get_timed_pool_class(pool_class, statistics, pool_timeout):
+    """Get a connection pool class that measures new connections.
+
+    The requests library doesn't set the time of waiting for a free
+    connection of a blocking pool, so it is set by the pool.
+
+    :param pool_class: a class of urllib3 connection pools
+    :param statistics: an instance of SessionStatistics
+    :param pool_timeout: a maximal number of seconds to wait for a connection
+    :return: a subclass of the pool class
+    """
+    class TimedConnectionPool(pool_class):
+
+        def _get_conn(self, timeout=None):
+            return super()._get_conn(timeout=timeout or pool_timeout)
+
+        def _new_conn(self):
+            connection = super()._new_conn()
+            connect = connection.connect
+
+            def timed_connect():
+                start = time.monotonic()
+                connect()
+                statistics.add_connection(time.monotonic() - start)
+
+            connection.connect = timed_connect
+            return connection
+
+    return TimedConnectionPool
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTP adapter with limited connection pools and statistics."""
+
+    def __init__(self, statistics, pool_hosts=NETWORK_POOL_HOSTS,
+                 connections_per_host=NETWORK_POOL_CONNECTIONS_PER_HOST,
+                 pool_timeout=NETWORK_POOL_TIMEOUT):
+        """Create a new adapter.
+
+        :param statistics: an instance of SessionStatistics
+        :param pool_hosts: a maximal number of pooled hosts
+        :param connections_per_host: a maximal number of connections to one host
+        :param pool_timeout: a maximal number of seconds to wait for a free connection
+        """
+        self._statistics = statistics
+        self._pool_timeout = pool_timeout
+        self._timed_managers = set()
+        super().__init__(
+            pool_connections=pool_hosts,
+            pool_maxsize=connections_per_host,
+            pool_block=True
+        )
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self._set_timed_pools(self.poolmanager)
+
+    def proxy_manager_for(self, *args, **kwargs):
+        manager = super().proxy_manager_for(*args, **kwargs)
+        self._set_timed_pools(manager)
+        return manager
+
+    def _set_timed_pools(self, manager):
+        """Measure connections created by the given pool manager."""
+        # The proxy managers are cached, so patch them only once.
+        if manager in self._timed_managers:
+            return
+
+        manager.pool_classes_by_scheme = {
+            scheme: _get_timed_pool_class(pool_class, self._statistics, self._pool_timeout)
+            for scheme, pool_class in manager.pool_classes_by_scheme.items()
+        }
+        self._timed_managers.add(manager)
+
+    def send(self, request, stream=False, *args, **kwargs):  # pylint: disable=arguments-differ
+        try:
+            response = super().send(request, stream, *args, **kwargs)
+        except EmptyPoolError as e:
+            raise requests.ConnectionError(e, request=request) from e
+
+        if stream:
+            size = int(response.headers.get("content-length") or 0)
+        else:
+            size = len(response.content or b"")
+
+        self._statistics.add_request(size)
+        return response
+
+
+class SessionPool(object):
+    """A thread-safe pool of shared requests sessions.
+
+    The sessions are keyed by the proxy and TLS settings, so requests
+    with the same settings reuse the kept-alive connections. The number
+    of connections to one host is limited.
+    """
+
+    def __init__(self):
+        self._sessions = {}
+        self._lock = threading.Lock()
+        self._statistics = SessionStatistics()
+
+    @property
+    def statistics(self):
+        """Statistics of all sessions in the pool.
+
+        :return: an instance of SessionStatistics
+        """
+        return self._statistics
+
+    def get_session(self, proxies=None, verify=True, cert=None):
+        """Get a shared session for the given settings.
+
+        :param proxies: a dictionary of proxies or None
+        :param verify: a bool or a path to a CA bundle
+        :param cert: a path to a client certificate or a tuple
+                     with paths to a certificate and a key
+        :return: an instance of requests.Session
+        """
+        key = self._get_key(proxies, verify, cert)
+
+        with self._lock:
+            if key not in self._sessions:
+                log.debug("Creating a new shared session.")
+                self._sessions[key] = self._create_session(proxies, verify, cert)
+
+            return self._sessions[key]
+
+    def close(self):
+        """Close all sessions in the pool."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions = {}
+
+        for session in sessions:
+            session.close()
+
+        log.debug("Closed the shared sessions: %s", self._statistics)
+
+    @staticmethod
+    def _get_key(proxies, verify, cert):
+        """Get a hashable key of the given settings."""
+        if isinstance(cert, list):
+            cert = tuple(cert)
+
+        return tuple(sorted((proxies or {}).items())), verify, cert
+
+    def _create_session(self, proxies, verify, cert):
+        """Create a new session with file and ftp support."""
+        session = requests.Session()
+        session.proxies.update(proxies or {})
+        session.verify = verify
+        session.cert = cert
+
+        adapter = PooledHTTPAdapter(self._statistics)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.mount("file://", FileAdapter())
+        session.mount("ftp://", FTPAdapter())
+        return session
+
+
+_session_pool = SessionPool()
+
+
+def get_session_pool():
+    """Get the shared pool of sessions of this process.
+
+    :return: an instance of SessionPool
+    """
+    return _session_pool
+
+
+def get_shared_session(proxies=None, verify=True, cert=None):
+    """Get a shared session for the given settings.
+
+    :param proxies: a dictionary of proxies or None
+    :param verify: a bool or a path to a CA bundle
+    :param cert: a path to a client certificate or a tuple
+                 with paths to a certificate and a key
+    :return: an instance of requests.Session
+    """
+    return _session_pool.get_session(proxies, verify, cert)
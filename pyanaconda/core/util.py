@@ -1229,6 +1229,47 @@ def collect(module_pattern, path, pred):
        :type pred: function with one argument returning True or False
     """
 
+    classes = _get_collected_classes(module_pattern, path)
+    return [obj for obj in classes if pred(obj)]
+
+
+# Classes collected from the directories.
+_collected_classes = {}
+
+
+def _get_collected_classes(module_pattern, path):
+    """Get all classes collected from the directory.
+
+    The directory is traversed only once for the given module pattern.
+    The classes are collected again if the directory is modified.
+
+    :param module_pattern: the full name pattern of the modules
+    :param path: the directory we are picking up modules from
+    :return: a list of classes
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return []
+
+    key = (module_pattern, path)
+    cached = _collected_classes.get(key)
+
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    classes = _collect_classes(module_pattern, path)
+    _collected_classes[key] = (mtime, classes)
+    return classes
+
+
+def _collect_classes(module_pattern, path):
+    """Import all files in the directory and find all classes.
+
+    :param module_pattern: the full name pattern of the modules
+    :param path: the directory we are picking up modules from
+    :return: a list of classes
+    """
     retval = []
     try:
         contents = os.listdir(path)
@@ -1329,15 +1370,13 @@ def collect(module_pattern, path, pred):
             if mod_info and mod_info[0]:  # pylint: disable=unsubscriptable-object
                 mod_info[0].close()  # pylint: disable=unsubscriptable-object
 
-        p = lambda obj: inspect.isclass(obj) and pred(obj)
-
         # if __all__ is defined in the module, use it
         if not hasattr(module, "__all__"):
-            members = inspect.getmembers(module, p)
+            members = inspect.getmembers(module, inspect.isclass)
         else:
             members = [(name, getattr(module, name))
                        for name in module.__all__
-                       if p(getattr(module, name))]
+                       if inspect.isclass(getattr(module, name))]
 
         for (_name, val) in members:
             retval.append(val)
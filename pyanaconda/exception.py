@@ -33,6 +33,7 @@ from meh import Config
 from meh.dump import ReverseExceptionDump
 from meh.handler import ExceptionHandler
 
+from pyanaconda import anaconda_logging
 from pyanaconda import kickstart
 from pyanaconda.core import util
 from pyanaconda import product
@@ -138,6 +139,10 @@ class AnacondaExceptionHandler(ExceptionHandler):
         exception_lines = traceback.format_exception(*dump_info.exc_info)
         log.critical("\n".join(exception_lines))
 
+        # make sure the logs are complete before they are collected,
+        # but don't let a stuck writer block the crash dump
+        anaconda_logging.flush(timeout=anaconda_logging.CRASH_LOG_FLUSH_TIMEOUT)
+
         ty = dump_info.exc_info.type
         value = dump_info.exc_info.value
 
@@ -40,6 +40,10 @@ How to use the geolocation module
    look-up is currently in progress or failed to return any results, all
    properties will return None.
 
+   A successful result is saved to a file in /run/install and reused by
+   the next lookup, so restarts of the installer don't query the providers
+   again.
+
 ====================
 Geolocation backends
 ====================
@@ -88,6 +92,10 @@ lack official documentation.
 
 As a result its long-term stability might not be guaranteed.
 
+Hedged lookup
+   If more providers are specified, they are queried concurrently. The first
+   valid result is used and the remaining lookups are cancelled, so a slow
+   provider doesn't delay the installation.
 
 
 Possible issues with GeoIP
@@ -113,10 +121,13 @@ Backends that could possibly be used in the future
    * cell tower geolocation
 
 """
-from pyanaconda.core.util import requests_session
+from pyanaconda.core.session_pool import get_shared_session
 import requests
 import urllib.parse
 import dbus
+import json
+import os
+import tempfile
 import threading
 import time
 from pyanaconda import network
@@ -154,17 +165,17 @@ class Geolocation(object):
         """
         self._geolocation_enabled = self._check_if_geolocation_should_be_used(geoloc_option,
                                                                               options_override)
-        provider_id = constants.GEOLOC_DEFAULT_PROVIDER
+        provider_ids = [constants.GEOLOC_DEFAULT_PROVIDER]
 
-        # check if a provider was specified by an option
+        # check if providers were specified by an option
         if geoloc_option is not None and self._geolocation_enabled:
-            parsed_id = self._get_provider_id_from_option(geoloc_option)
-            if parsed_id is None:
+            parsed_ids = self._get_provider_ids_from_option(geoloc_option)
+            if not parsed_ids:
                 log.error('geoloc: wrong provider id specified: %s', geoloc_option)
             else:
-                provider_id = parsed_id
+                provider_ids = parsed_ids
 
-        self._location_info = LocationInfo(provider_id=provider_id)
+        self._location_info = LocationInfo(provider_ids=provider_ids)
 
     def _check_if_geolocation_should_be_used(self, geoloc_option, options_override):
         """Check if geolocation can be used during this installation run.
@@ -264,22 +275,32 @@ class Geolocation(object):
         """
         return self._location_info.result
 
-    def _get_provider_id_from_option(self, option_string):
-        """Get a valid provider id from a string.
+    def _get_provider_ids_from_option(self, option_string):
+        """Get valid provider ids from a string.
 
         This function is used to parse command line
         arguments/boot options for the geolocation module.
 
-        :param str option_string: option specifying the provider
-        :return: provider id
+        More providers can be specified as a comma separated list.
+        Invalid provider ids are ignored.
+
+        :param str option_string: option specifying the providers
+        :return: a list of provider ids
         """
+        provider_ids = []
+
         # normalize the option string, just in case
-        option_string = option_string.lower()
-        if option_string.lower() in OFFICIALLY_SUPPORTED_GEOLOCATION_PROVIDER_IDS:
-            return option_string
-        else:
-            # fall back to the default provider
-            return None
+        for provider_id in option_string.lower().split(","):
+            provider_id = provider_id.strip()
+
+            if provider_id not in OFFICIALLY_SUPPORTED_GEOLOCATION_PROVIDER_IDS:
+                log.error("geoloc: ignoring invalid provider id: %s", provider_id)
+                continue
+
+            if provider_id not in provider_ids:
+                provider_ids.append(provider_id)
+
+        return provider_ids
 
 
 class LocationInfo(object):
@@ -289,17 +310,26 @@ class LocationInfo(object):
     nearby WiFi access points (depending on what backend is used)
     """
 
-    def __init__(self, provider_id=constants.GEOLOC_DEFAULT_PROVIDER):
+    def __init__(self, provider_ids=(constants.GEOLOC_DEFAULT_PROVIDER, )):
         """
-        :param str provider_id: GeoIP provider id
+        :param provider_ids: a list of GeoIP provider ids
         """
         available_providers = {
             constants.GEOLOC_PROVIDER_FEDORA_GEOIP: FedoraGeoIPProvider,
             constants.GEOLOC_PROVIDER_HOSTIP: HostipGeoIPProvider,
             constants.GEOLOC_PROVIDER_GOOGLE_WIFI: GoogleWiFiLocationProvider
         }
-        provider = available_providers.get(provider_id, FedoraGeoIPProvider)
-        self._provider = provider()
+        providers = [
+            available_providers.get(provider_id, FedoraGeoIPProvider)()
+            for provider_id in provider_ids
+        ]
+
+        if len(providers) > 1:
+            self._provider = HedgedGeolocationProvider(providers)
+        elif providers:
+            self._provider = providers[0]
+        else:
+            self._provider = FedoraGeoIPProvider()
 
     @property
     def result(self):
@@ -311,6 +341,8 @@ class LocationInfo(object):
         # check if a refresh is already in progress
         if threadMgr.get(constants.THREAD_GEOLOCATION_REFRESH):
             log.debug("Geoloc: refresh already in progress")
+        elif self._provider.load_cached_result():
+            log.info("Geoloc: using the cached result from %s", constants.GEOLOC_CACHE_FILE)
         else:  # wait for Internet connectivity
             if network.wait_for_connectivity():
                 threadMgr.add(AnacondaThread(
@@ -373,6 +405,34 @@ class LocationResult(object):
     def city(self):
         return self._city
 
+    @property
+    def is_valid(self):
+        """Is the result usable?
+
+        At least the territory code is required.
+        """
+        return bool(self.territory_code)
+
+    def to_dict(self):
+        """Return a dictionary that can be cached.
+
+        The public IP address and the city are not cached.
+        """
+        return {
+            "territory_code": self._territory_code,
+            "timezone": self._timezone,
+            "timezone_source": self._timezone_source,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a new result from a cached dictionary."""
+        return cls(
+            territory_code=data.get("territory_code"),
+            timezone=data.get("timezone"),
+            timezone_source=data.get("timezone_source", "unknown"),
+        )
+
     def __str__(self):
         if self.territory_code:
             result_string = "territory: %s" % self.territory_code
@@ -395,9 +455,10 @@ class GeolocationBackend(object):
     def __init__(self):
         self._result = LocationResult()
         self._result_lock = threading.Lock()
-        self._session = requests_session()
+        self._session = get_shared_session()
         self._refresh_condition = threading.Condition()
         self._refresh_in_progress = False
+        self._cancelled = threading.Event()
 
     @property
     def name(self):
@@ -408,19 +469,28 @@ class GeolocationBackend(object):
         """
         pass
 
-    def refresh(self):
-        """Refresh the geolocation data."""
+    def refresh(self, save_result=True):
+        """Refresh the geolocation data.
+
+        :param save_result: should be a valid result saved for the next lookups?
+        """
         # check if refresh is needed
         log.info("Starting geolocation lookup")
         log.info("Geolocation provider: %s", self.name)
         with self._refresh_condition:
             self._refresh_in_progress = True
 
+        self._cancelled.clear()
+
         start_time = time.time()
         self._refresh()
         log.info("Geolocation lookup finished in %1.1f seconds",
                  time.time() - start_time)
 
+        # save the result before the waiting threads are notified
+        if save_result and self.result.is_valid and not self._cancelled.is_set():
+            self._save_result()
+
         with self._refresh_condition:
             self._refresh_in_progress = False
             self._refresh_condition.notify_all()
@@ -434,6 +504,67 @@ class GeolocationBackend(object):
     def _refresh(self):
         pass
 
+    def cancel(self):
+        """Cancel the lookup.
+
+        A lookup in progress can't be interrupted, but its result
+        will be ignored and the remaining queries will be skipped.
+        """
+        self._cancelled.set()
+
+    @property
+    def cancelled(self):
+        """Was the lookup cancelled?"""
+        return self._cancelled.is_set()
+
+    def load_cached_result(self):
+        """Load a result of a previous lookup.
+
+        :return: True if a valid result was loaded, otherwise False
+        """
+        if not os.path.exists(constants.GEOLOC_CACHE_FILE):
+            return False
+
+        try:
+            with open(constants.GEOLOC_CACHE_FILE, "r") as f:
+                result = LocationResult.from_dict(json.load(f))
+        except (OSError, ValueError, AttributeError) as e:
+            log.debug("Geoloc: Unable to load the cached result:\n%s", e)
+            return False
+
+        if not result.is_valid:
+            return False
+
+        self._set_result(result)
+        return True
+
+    def _save_result(self):
+        """Save the result for the next lookups.
+
+        The file is replaced atomically, so other processes never
+        read a partially written result.
+        """
+        cache_dir = os.path.dirname(constants.GEOLOC_CACHE_FILE)
+
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir)
+        except OSError as e:
+            log.debug("Geoloc: Unable to save the result:\n%s", e)
+            return
+
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self.result.to_dict(), f)
+
+            os.replace(tmp_path, constants.GEOLOC_CACHE_FILE)
+        except OSError as e:
+            log.debug("Geoloc: Unable to save the result:\n%s", e)
+
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
     @property
     def refresh_in_progress(self):
         """Report if location refresh is in progress."""
@@ -456,6 +587,10 @@ class GeolocationBackend(object):
             return self._result
 
     def _set_result(self, new_result):
+        # ignore results of cancelled lookups
+        if self.cancelled:
+            return
+
         with self._result_lock:
             self._result = new_result
 
@@ -463,6 +598,64 @@ class GeolocationBackend(object):
         return self.name
 
 
+class HedgedGeolocationProvider(GeolocationBackend):
+    """Query more providers concurrently and use the first valid result."""
+
+    def __init__(self, providers):
+        """
+        :param providers: a list of GeolocationBackend instances
+        """
+        super().__init__()
+        self._providers = providers
+        self._finished = threading.Condition()
+        self._winner = None
+        self._running = 0
+
+    @property
+    def name(self):
+        return "Hedged ({})".format(", ".join(p.name for p in self._providers))
+
+    def _refresh(self):
+        with self._finished:
+            self._winner = None
+            self._running = len(self._providers)
+
+        for provider in self._providers:
+            threadMgr.add(AnacondaThread(
+                prefix=constants.THREAD_GEOLOCATION_PROVIDER,
+                target=self._run_provider,
+                args=(provider, )
+            ))
+
+        with self._finished:
+            self._finished.wait_for(lambda: self._winner or not self._running)
+            winner = self._winner
+
+        # cancel the remaining lookups
+        for provider in self._providers:
+            if provider is not winner:
+                provider.cancel()
+
+        if winner:
+            log.info("Geoloc: using the result from %s", winner.name)
+            self._set_result(winner.result)
+
+    def _run_provider(self, provider):
+        """Run the lookup of the given provider.
+
+        Only the hedged result is saved, not the results of the providers.
+        """
+        provider.refresh(save_result=False)
+
+        with self._finished:
+            self._running -= 1
+
+            if not self._winner and not provider.cancelled and provider.result.is_valid:
+                self._winner = provider
+
+            self._finished.notify_all()
+
+
 class FedoraGeoIPProvider(GeolocationBackend):
     """The Fedora GeoIP service provider."""
 
@@ -558,6 +751,11 @@ class GoogleWiFiLocationProvider(GeolocationBackend):
                     lat = result_dict['location']['lat']
                     lon = result_dict['location']['lng']
                     log.info("Found current location.")
+
+                    # don't query the geocoder if the lookup was cancelled
+                    if self.cancelled:
+                        return
+
                     coords = Coordinates(lat=lat, lon=lon)
                     geocoder = Geocoder()
                     geocoding_result = geocoder.reverse_geocode_coords(coords)
@@ -643,9 +841,9 @@ class Geocoder(object):
             coordinates.latitude,
             coordinates.longitude)
         try:
-            reply = requests_session().get(url,
-                                           timeout=constants.NETWORK_CONNECTION_TIMEOUT,
-                                           verify=True)
+            reply = get_shared_session().get(url,
+                                             timeout=constants.NETWORK_CONNECTION_TIMEOUT,
+                                             verify=True)
             if reply.status_code == requests.codes.ok:
                 reply_dict = reply.json()
                 territory_code = reply_dict['address']['country_code'].upper()
@@ -27,8 +27,11 @@ from pyanaconda.modules.common.structures.requirement import Requirement
 from pyanaconda.modules.common.task import sync_run_task
 from pyanaconda.modules.common.util import is_module_available
 from pyanaconda.progress import progress_message, progress_step, progress_complete, progress_init
+from pyanaconda.progress_stream import get_progress_stream
 from pyanaconda import flags
+from pyanaconda import anaconda_logging
 from pyanaconda.core import util
+from pyanaconda.core.session_pool import get_session_pool
 from pyanaconda import timezone
 from pyanaconda import network
 from pyanaconda.core.i18n import N_
@@ -391,8 +394,26 @@ def run_installation(payload, ksdata):
                             next(task_completed_counter), x.elapsed_time)
     )
 
+    # write the queues and tasks to the progress stream
+    progress_stream = get_progress_stream()
+
+    if progress_stream:
+        progress_stream.watch_task_queue(queue)
+
     # start the task queue
-    queue.start()
+    try:
+        queue.start()
+    except Exception as e:
+        if progress_stream:
+            progress_stream.report_error(e)
+        raise
+
+    # log the network usage of the shared sessions
+    log.debug("Shared HTTP sessions: %s", get_session_pool().statistics)
+
+    # make sure the logs are written before the installation is reported as done
+    if not anaconda_logging.flush(timeout=anaconda_logging.LOG_FLUSH_TIMEOUT):
+        log.warning("Timed out waiting for the logs to be written.")
 
     # done
     progress_complete()
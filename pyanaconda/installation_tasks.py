@@ -508,6 +508,8 @@ class DBusTask(Task):
         super().__init__(task_proxy.Name)
         self._task_proxy = task_proxy
         self._msg_counter = 0
+        # triggered when the DBus task reports a progress
+        self.progress_changed = Signal()
 
     def run_task(self):
         """Run the DBus task."""
@@ -536,6 +538,7 @@ class DBusTask(Task):
 
         FIXME: Drop the ugly workaround for the first message.
         """
+        self.progress_changed.emit(self, step, msg)
         self._msg_counter += 1
 
         if self._msg_counter > 1:
@@ -34,6 +34,7 @@ from contextlib import contextmanager
 from pyanaconda.core import util
 from pyanaconda.core.configuration.anaconda import conf
 from pyanaconda.core.kickstart import VERSION, commands as COMMANDS
+from pyanaconda.core.kickstart.sources import CachingKickstartParser
 from pyanaconda.addons import AddonSection, AddonData, AddonRegistry
 from pyanaconda.core.constants import IPMI_ABORTED
 from pyanaconda.errors import ScriptError, errorHandler
@@ -435,7 +436,7 @@ class AnacondaKSHandler(superclass):
         return super().__str__() + "\n" + modules + "\n\n" + str(self.addons) + str(self.anaconda)
 
 
-class AnacondaPreParser(KickstartParser):
+class AnacondaPreParser(CachingKickstartParser):
     # A subclass of KickstartParser that only looks for %pre scripts and
     # sets them up to be run.  All other scripts and commands are ignored.
     def __init__(self, handler, followIncludes=True, errorsAreFatal=True,
@@ -456,7 +457,7 @@ class AnacondaPreParser(KickstartParser):
         self.registerSection(NullSection(self.handler.anaconda, sectionOpen="%anaconda"))
 
 
-class AnacondaKSParser(KickstartParser):
+class AnacondaKSParser(CachingKickstartParser):
     def __init__(self, handler, followIncludes=True, errorsAreFatal=True,
                  missingIncludeIsFatal=True, scriptClass=AnacondaKSScript):
         self.scriptClass = scriptClass
@@ -578,6 +579,11 @@ def runPostScripts(scripts):
         return
 
     script_log.info("Running kickstart %%post script(s)")
+
+    # some of the scripts might copy the logs
+    if not anaconda_logging.flush(timeout=anaconda_logging.LOG_FLUSH_TIMEOUT):
+        script_log.warning("Timed out waiting for the logs to be written.")
+
     for script in postScripts:
         script.run(conf.target.system_root)
     script_log.info("All kickstart %%post script(s) have been run")
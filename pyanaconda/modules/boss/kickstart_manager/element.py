@@ -148,6 +148,9 @@ class KickstartElements(object):
 
     def __init__(self):
         self._elements = []
+        self._commands = {}
+        self._sections = {}
+        self._addons = {}
 
     def append(self, element):
         """Appends KickstartElement to the container.
@@ -155,6 +158,14 @@ class KickstartElements(object):
         :param element: element object to be appended to the container
         :type name: KickstartElement
         """
+        if element.is_command():
+            index = self._commands
+        elif element.is_addon():
+            index = self._addons
+        else:
+            index = self._sections
+
+        index.setdefault(element.name, []).append(len(self._elements))
         self._elements.append(element)
 
     @property
@@ -181,18 +192,15 @@ class KickstartElements(object):
         :rtype: list(KickstartElement)
         """
 
-        filtered_elements = []
-        for element in self._elements:
-            if element.is_command():
-                if commands and element.name in commands:
-                    filtered_elements.append(element)
-            elif element.is_addon():
-                if addons and element.name in addons:
-                    filtered_elements.append(element)
-            elif element.is_section():
-                if sections and element.name in sections:
-                    filtered_elements.append(element)
-        return filtered_elements
+        positions = []
+
+        for names, index in ((commands, self._commands),
+                             (sections, self._sections),
+                             (addons, self._addons)):
+            for name in set(names or []):
+                positions.extend(index.get(name, []))
+
+        return [self._elements[position] for position in sorted(positions)]
 
     @staticmethod
     def get_kickstart_from_elements(elements=None):
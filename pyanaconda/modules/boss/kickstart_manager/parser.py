@@ -18,9 +18,9 @@
 
 __all__ = ["SplitKickstartParser", "VALID_SECTIONS_ANACONDA"]
 
-from pykickstart.parser import KickstartParser
 from pykickstart.sections import Section
 
+from pyanaconda.core.kickstart.sources import CachingKickstartParser
 from pyanaconda.modules.boss.kickstart_manager.element import KickstartElement,\
     TrackedKickstartElements
 
@@ -80,7 +80,7 @@ class StoreSection(Section):
         self.lines = []
 
 
-class SplitKickstartParser(KickstartParser):
+class SplitKickstartParser(CachingKickstartParser):
     """Kickstart parser for storing kickstart elements.
 
     Stores kickstart elements (commands, sections, addons) with their line
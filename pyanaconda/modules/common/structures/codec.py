@@ -0,0 +1,176 @@
+#
+# Compiled codecs of DBus structures
+#
+# Copyright (C) 2026 Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import threading
+
+from dasbus.structure import DBusDataField, DBusDataListField, DBusStructureError, \
+    get_fields
+from dasbus.typing import Variant, get_dbus_type, unwrap_variant
+
+__all__ = ["StructureCodec", "get_structure_codec"]
+
+# Compiled codecs of data classes.
+_codecs = {}
+_codecs_lock = threading.RLock()
+
+
+def get_structure_codec(data_type):
+    """Get a compiled codec of the given data class.
+
+    The codec is compiled only once per class.
+
+    :param data_type: a subclass of DBusData
+    :return: an instance of StructureCodec
+    """
+    codec = _codecs.get(data_type)
+
+    if codec is None:
+        with _codecs_lock:
+            codec = _codecs.get(data_type)
+
+            if codec is None:
+                codec = StructureCodec(data_type)
+                _codecs[data_type] = codec
+
+    return codec
+
+
+class StructureCodec(object):
+    """Compiled codec of a DBus structure.
+
+    The conversion methods of DBusData compute the DBus type of every
+    field from its type hint on every call. The codec computes the DBus
+    types only once, so large lists of structures are converted faster.
+    The results are the same as the results of the DBusData methods.
+    """
+
+    def __init__(self, data_type):
+        """Compile a codec for the given data class.
+
+        :param data_type: a subclass of DBusData
+        """
+        self._data_type = data_type
+        self._fields = {}
+
+        for name, field in get_fields(data_type).items():
+            self._fields[name] = self._compile_field(field)
+
+    @staticmethod
+    def _compile_field(field):
+        """Compile the given field.
+
+        :return: a tuple of the data name, the DBus type, a codec of
+                 the nested structure or None and a flag of a list
+        """
+        if isinstance(field, DBusDataListField):
+            return (field.data_name, get_dbus_type(field.type_hint),
+                    get_structure_codec(field.data_type), True)
+
+        if isinstance(field, DBusDataField):
+            return (field.data_name, get_dbus_type(field.type_hint),
+                    get_structure_codec(field.data_type), False)
+
+        return field.data_name, get_dbus_type(field.type_hint), None, False
+
+    @property
+    def data_type(self):
+        """The data class of the codec."""
+        return self._data_type
+
+    def to_structure(self, data):
+        """Convert a data object to a DBus structure.
+
+        :param data: an instance of the data class
+        :return: a DBus structure
+        """
+        if not isinstance(data, self._data_type):
+            raise TypeError(
+                "Invalid type '{}'.".format(type(data).__name__)
+            )
+
+        structure = {}
+
+        for name, (data_name, type_string, codec, is_list) in self._fields.items():
+            value = getattr(data, data_name)
+
+            if codec and is_list:
+                value = codec.to_structure_list(value)
+            elif codec:
+                value = codec.to_structure(value)
+
+            if value is None:
+                raise TypeError("Invalid DBus value 'None'.")
+
+            structure[name] = Variant(type_string, value)
+
+        return structure
+
+    def to_structure_list(self, objects):
+        """Convert data objects to DBus structures.
+
+        :param objects: a list of data objects
+        :return: a list of DBus structures
+        """
+        return list(map(self.to_structure, objects))
+
+    def from_structure(self, structure):
+        """Convert a DBus structure to a data object.
+
+        :param structure: a DBus structure
+        :return: an instance of the data class
+        """
+        if not isinstance(structure, dict):
+            raise TypeError(
+                "Invalid type '{}'.".format(type(structure).__name__)
+            )
+
+        data = self._data_type()
+
+        for name, variant in structure.items():
+            field = self._fields.get(name)
+
+            if not field:
+                raise DBusStructureError(
+                    "Field '{}' doesn't exist.".format(name)
+                )
+
+            data_name, _type_string, codec, is_list = field
+            value = unwrap_variant(variant)
+
+            if codec and is_list:
+                value = codec.from_structure_list(value)
+            elif codec:
+                value = codec.from_structure(value)
+
+            setattr(data, data_name, value)
+
+        return data
+
+    def from_structure_list(self, structures):
+        """Convert DBus structures to data objects.
+
+        :param structures: a list of DBus structures
+        :return: a list of data objects
+        """
+        if not isinstance(structures, list):
+            raise TypeError(
+                "Invalid type '{}'.".format(type(structures).__name__)
+            )
+
+        return list(map(self.from_structure, structures))
@@ -19,6 +19,7 @@
 #
 
 import copy
+import itertools
 
 from pyanaconda.core.regexes import IBFT_CONFIGURED_DEVICE_NAME
 from pyanaconda.core.signal import Signal
@@ -97,17 +98,92 @@ class DeviceConfigurations(object):
     }
 
     def __init__(self, nm_client=None):
+        # Configurations by their positions, in the order they were added.
         self._device_configurations = None
+        self._positions = itertools.count()
+        # Positions of the configurations by their identities.
+        self._object_index = {}
+        # Positions of the configurations by device names and uuids.
+        self._device_index = {}
+        self._uuid_index = {}
+        # Changes collected during a reload.
+        self._pending_changes = None
         self.nm_client = nm_client or NM.Client.new()
         self.configurations_changed = Signal()
 
     def reload(self):
-        """Reload the state from the system."""
-        self._device_configurations = []
-        for device in self.nm_client.get_devices():
-            self.add_device(device)
-        for connection in self.nm_client.get_connections():
-            self.add_connection(connection)
+        """Reload the state from the system.
+
+        The changes are reported at once when the reload is finished.
+        """
+        self._device_configurations = {}
+        self._object_index = {}
+        self._device_index = {}
+        self._uuid_index = {}
+        self._pending_changes = []
+
+        try:
+            for device in self.nm_client.get_devices():
+                self.add_device(device)
+            for connection in self.nm_client.get_connections():
+                self.add_connection(connection)
+        finally:
+            changes, self._pending_changes = self._pending_changes, None
+
+        if changes:
+            self.configurations_changed.emit(changes)
+
+    def _emit_change(self, old_dev_cfg, new_dev_cfg):
+        """Report a change of the configuration."""
+        if self._pending_changes is None:
+            self.configurations_changed.emit([(old_dev_cfg, new_dev_cfg)])
+        else:
+            # The configuration can change again during the reload.
+            self._pending_changes.append((old_dev_cfg, copy.deepcopy(new_dev_cfg)))
+
+    @staticmethod
+    def _index_add(index, key, position):
+        # The positions are kept in a dictionary, so they can be removed
+        # quickly even if many configurations share the key.
+        index.setdefault(key, {})[position] = None
+
+    @staticmethod
+    def _index_remove(index, key, position):
+        positions = index.get(key, {})
+        positions.pop(position, None)
+
+        if not positions:
+            index.pop(key, None)
+
+    @staticmethod
+    def _index_get(index, key):
+        return sorted(index.get(key, {}))
+
+    def _find_position(self, dev_cfg):
+        """Find the position of the configuration object."""
+        return self._object_index.get(id(dev_cfg))
+
+    def _set_device_name(self, dev_cfg, device_name):
+        """Set the device name of the configuration and update the index."""
+        position = self._find_position(dev_cfg)
+        self._index_remove(self._device_index, dev_cfg.device_name, position)
+        dev_cfg.device_name = device_name
+        self._index_add(self._device_index, device_name, position)
+
+    def _set_connection_uuid(self, dev_cfg, connection_uuid):
+        """Set the connection uuid of the configuration and update the index."""
+        position = self._find_position(dev_cfg)
+        self._index_remove(self._uuid_index, dev_cfg.connection_uuid, position)
+        dev_cfg.connection_uuid = connection_uuid
+        self._index_add(self._uuid_index, connection_uuid, position)
+
+    def _remove(self, dev_cfg):
+        """Remove the configuration and report the change."""
+        position = self._object_index.pop(id(dev_cfg))
+        self._device_configurations.pop(position)
+        self._index_remove(self._device_index, dev_cfg.device_name, position)
+        self._index_remove(self._uuid_index, dev_cfg.connection_uuid, position)
+        self._emit_change(dev_cfg, NetworkDeviceConfiguration())
 
     def connect(self):
         """Connect to NetworkManager for devices and connections updates."""
@@ -139,9 +215,13 @@ class DeviceConfigurations(object):
             new_dev_cfg.connection_uuid = connection_uuid
         if device_type is not None:
             new_dev_cfg.device_type = device_type
-        self._device_configurations.append(new_dev_cfg)
+        position = next(self._positions)
+        self._device_configurations[position] = new_dev_cfg
+        self._object_index[id(new_dev_cfg)] = position
+        self._index_add(self._device_index, new_dev_cfg.device_name, position)
+        self._index_add(self._uuid_index, new_dev_cfg.connection_uuid, position)
         log.debug("added %s", new_dev_cfg)
-        self.configurations_changed.emit([(NetworkDeviceConfiguration(), new_dev_cfg)])
+        self._emit_change(NetworkDeviceConfiguration(), new_dev_cfg)
 
     def attach(self, dev_cfg, device_name=None, connection_uuid=None):
         """Attach device or connection to existing NetworkDeviceConfiguration."""
@@ -149,12 +229,12 @@ class DeviceConfigurations(object):
             return
         old_dev_cfg = copy.deepcopy(dev_cfg)
         if device_name:
-            dev_cfg.device_name = device_name
+            self._set_device_name(dev_cfg, device_name)
             log.debug("attached device name to %s", dev_cfg)
         if connection_uuid:
-            dev_cfg.connection_uuid = connection_uuid
+            self._set_connection_uuid(dev_cfg, connection_uuid)
             log.debug("attached connection uuid to %s", dev_cfg)
-        self.configurations_changed.emit([(old_dev_cfg, dev_cfg)])
+        self._emit_change(old_dev_cfg, dev_cfg)
 
     def _should_add_device(self, device):
         """Should the network device be added ?
@@ -426,15 +506,15 @@ class DeviceConfigurations(object):
         return True
 
     def get_for_device(self, device_name):
-        return [cfg for cfg in self._device_configurations
-                if cfg.device_name == device_name]
+        return [self._device_configurations[position]
+                for position in self._index_get(self._device_index, device_name)]
 
     def get_for_uuid(self, connection_uuid):
-        return [cfg for cfg in self._device_configurations
-                if cfg.connection_uuid == connection_uuid]
+        return [self._device_configurations[position]
+                for position in self._index_get(self._uuid_index, connection_uuid)]
 
     def get_all(self):
-        return list(self._device_configurations)
+        return list(self._device_configurations.values())
 
     def _device_added_cb(self, client, device, *args):
         # We need to wait for valid state before adding the device
@@ -459,13 +539,11 @@ class DeviceConfigurations(object):
         for cfg in dev_cfgs:
             if cfg.connection_uuid and cfg.device_type in virtual_device_types:
                 old_cfg = copy.deepcopy(cfg)
-                cfg.device_name = ""
-                self.configurations_changed.emit([(old_cfg, cfg)])
+                self._set_device_name(cfg, "")
+                self._emit_change(old_cfg, cfg)
                 log.debug("device name %s removed from %s", iface, cfg)
             else:
-                empty_cfg = NetworkDeviceConfiguration()
-                self._device_configurations.remove(cfg)
-                self.configurations_changed.emit([(cfg, empty_cfg)])
+                self._remove(cfg)
                 log.debug("%s removed", cfg)
 
     def _connection_added_cb(self, client, connection):
@@ -492,17 +570,15 @@ class DeviceConfigurations(object):
         for cfg in dev_cfgs:
             if cfg.device_name:
                 old_cfg = copy.deepcopy(cfg)
-                cfg.connection_uuid = ""
-                self.configurations_changed.emit([(old_cfg, cfg)])
+                self._set_connection_uuid(cfg, "")
+                self._emit_change(old_cfg, cfg)
                 log.debug("connection uuid %s removed from %s", uuid, cfg)
             else:
-                empty_cfg = NetworkDeviceConfiguration()
-                self._device_configurations.remove(cfg)
-                self.configurations_changed.emit([(cfg, empty_cfg)])
+                self._remove(cfg)
                 log.debug("%s removed", cfg)
 
     def __str__(self):
-        return str(self._device_configurations)
+        return str(self.get_all())
 
     def __repr__(self):
         return "DeviceConfigurations({})".format(self.nm_client)
@@ -21,6 +21,7 @@ from dasbus.server.interface import dbus_interface
 from dasbus.typing import *  # pylint: disable=wildcard-import
 
 from pyanaconda.modules.common.constants.interfaces import PAYLOAD_DNF
+from pyanaconda.modules.common.structures.codec import get_structure_codec
 from pyanaconda.modules.common.structures.payload import RepoConfigurationData
 from pyanaconda.modules.payloads.payload.payload_base_interface import PayloadBaseInterface
 
@@ -34,6 +35,6 @@ class DNFInterface(PayloadBaseInterface):
 
         FIXME: This is a temporary solution. Will be removed after DNF payload logic is moved.
         """
-        return RepoConfigurationData.to_structure_list(
+        return get_structure_codec(RepoConfigurationData).to_structure_list(
             self.implementation.get_repo_configurations()
         )
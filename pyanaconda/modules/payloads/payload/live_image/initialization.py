@@ -150,28 +150,30 @@ class SetupInstallationSourceImageTask(Task):
             with open(image_path, "wb") as f:
                 ssl_verify = not self._noverifyssl
                 proxies = get_proxies_from_option(self._proxy)
-                response = session.get(url, proxies=proxies, verify=ssl_verify, stream=True,
-                                       timeout=NETWORK_CONNECTION_TIMEOUT)
-                total_length = response.headers.get('content-length')
-                if total_length is None:
-                    # just download the file in one go and fake the progress reporting once done
-                    log.warning("content-length header is missing for the installation image, "
-                                "download progress reporting will not be available")
-                    f.write(response.content)
-                    size = f.tell()
-                    progress = DownloadProgress(self._url, size, self.report_progress)
-                    progress.end()
-                else:
-                    # requests return headers as strings, so convert total_length to int
-                    progress = DownloadProgress(self._url, int(total_length), self.report_progress)
-                    bytes_read = 0
-                    for buf in response.iter_content(1024 * 1024):
-                        if buf:
-                            f.write(buf)
-                            f.flush()
-                            bytes_read += len(buf)
-                            progress.update(bytes_read)
-                    progress.end()
+                with session.get(url, proxies=proxies, verify=ssl_verify, stream=True,
+                                 timeout=NETWORK_CONNECTION_TIMEOUT) as response:
+                    total_length = response.headers.get('content-length')
+                    if total_length is None:
+                        # just download the file in one go and fake the progress
+                        # reporting once done
+                        log.warning("content-length header is missing for the installation image, "
+                                    "download progress reporting will not be available")
+                        f.write(response.content)
+                        size = f.tell()
+                        progress = DownloadProgress(self._url, size, self.report_progress)
+                        progress.end()
+                    else:
+                        # requests return headers as strings, so convert total_length to int
+                        progress = DownloadProgress(self._url, int(total_length),
+                                                    self.report_progress)
+                        bytes_read = 0
+                        for buf in response.iter_content(1024 * 1024):
+                            if buf:
+                                f.write(buf)
+                                f.flush()
+                                bytes_read += len(buf)
+                                progress.update(bytes_read)
+                        progress.end()
                 log.info("Image download finished")
         except RequestException as e:
             error = "Error downloading liveimg: {}".format(e)
@@ -20,7 +20,7 @@
 import os
 
 from pyanaconda.core.signal import Signal
-from pyanaconda.core.util import requests_session
+from pyanaconda.core.session_pool import get_shared_session
 from pyanaconda.core.configuration.anaconda import conf
 from pyanaconda.core.constants import INSTALL_TREE
 
@@ -179,9 +179,8 @@ class LiveImageModule(PayloadBase):
     @property
     def requests_session(self):
         """Get requests session."""
-        # FIXME: share in Payload module?
         if not self._requests_session:
-            self._requests_session = requests_session()
+            self._requests_session = get_shared_session()
         return self._requests_session
 
     def update_kernel_version_list(self):
@@ -39,7 +39,163 @@ from pyanaconda.modules.storage.platform import platform
 from pyanaconda.anaconda_loggers import get_module_logger
 log = get_module_logger(__name__)
 
+# Inputs of the storage checks.
+CHECK_INPUT_MOUNTPOINTS = "mountpoints"
+CHECK_INPUT_BOOTLOADER = "bootloader"
+CHECK_INPUT_SWAP = "swap"
+CHECK_INPUT_LUKS = "luks"
+CHECK_INPUT_DISKS = "disks"
+CHECK_INPUT_DEVICES = "devices"
 
+
+def depends_on(*inputs):
+    """Declare inputs of a storage check.
+
+    The storage checker can reuse results of the check in the incremental
+    mode if none of its inputs has changed since the last run. Checks with
+    no declared inputs are always run. Don't declare inputs of checks with
+    side effects, for example checks that update the bootloader errors.
+
+    :param inputs: names of the inputs
+    :return: a decorator of the check
+    """
+    def decorator(check):
+        check.inputs = frozenset(inputs)
+        return check
+
+    return decorator
+
+
+def _get_device_state(device):
+    """Get a hashable state of the device."""
+    device_format = device.format
+    return (
+        device.id,
+        device.name,
+        device.exists,
+        device.size,
+        device.protected,
+        tuple(parent.id for parent in device.parents),
+        device_format.id,
+        device_format.type,
+        device_format.exists,
+        getattr(device_format, "mountpoint", None),
+        getattr(device_format, "uuid", None),
+    )
+
+
+def _get_luks_state(device):
+    """Get a hashable state of the LUKS device."""
+    device_format = device.format
+    return _get_device_state(device) + (
+        device_format.has_key,
+        device_format.luks_version,
+        device_format.pbkdf_args is None,
+        device_format.map_name,
+        tuple(child.name for child in device.children),
+    )
+
+
+class StorageCheckerSnapshot(object):
+    """A snapshot of the storage for one run of the storage checker.
+
+    The snapshot is passed to the checks instead of the storage. The
+    properties that are expensive to compute are computed only once per
+    run. All other attributes are provided by the storage.
+    """
+
+    def __init__(self, storage):
+        """Create a new snapshot.
+
+        :param storage: a storage to check
+        """
+        self._storage = storage
+        self._cache = {}
+
+    def __getattr__(self, name):
+        return getattr(self._storage, name)
+
+    def _get_cached(self, name, getter):
+        if name not in self._cache:
+            self._cache[name] = getter()
+
+        return self._cache[name]
+
+    @property
+    def mountpoints(self):
+        """A dictionary of mount points and devices."""
+        return self._get_cached("mountpoints", lambda: self._storage.mountpoints)
+
+    @property
+    def devices(self):
+        """A list of devices."""
+        return self._get_cached("devices", lambda: self._storage.devices)
+
+    @property
+    def disks(self):
+        """A list of disks."""
+        return self._get_cached("disks", lambda: self._storage.disks)
+
+    @property
+    def partitions(self):
+        """A list of partitions."""
+        return self._get_cached("partitions", lambda: self._storage.partitions)
+
+    def get_fingerprint(self, name):
+        """Get a fingerprint of the given input.
+
+        :param name: a name of the input
+        :return: a hashable value that changes with the input
+        """
+        getters = {
+            CHECK_INPUT_MOUNTPOINTS: self._get_mountpoints_fingerprint,
+            CHECK_INPUT_BOOTLOADER: self._get_bootloader_fingerprint,
+            CHECK_INPUT_SWAP: self._get_swap_fingerprint,
+            CHECK_INPUT_LUKS: self._get_luks_fingerprint,
+            CHECK_INPUT_DISKS: self._get_disks_fingerprint,
+            CHECK_INPUT_DEVICES: self._get_devices_fingerprint,
+        }
+        return self._get_cached("fingerprint-" + name, getters[name])
+
+    def _get_mountpoints_fingerprint(self):
+        return tuple(sorted(
+            (mount, _get_device_state(device)) for mount, device in self.mountpoints.items()
+        ))
+
+    def _get_bootloader_fingerprint(self):
+        bootloader = self._storage.bootloader
+
+        if not bootloader or bootloader.skip_bootloader:
+            return None
+
+        stage1 = bootloader.stage1_device
+        stage2 = bootloader.stage2_device
+        stage1_disk = bootloader.stage1_disk
+
+        return (
+            type(bootloader).__name__,
+            _get_device_state(stage1) if stage1 else None,
+            _get_device_state(stage2) if stage2 else None,
+            _get_device_state(stage1_disk) if stage1_disk else None,
+        )
+
+    def _get_swap_fingerprint(self):
+        return tuple(_get_device_state(d) for d in self._storage.fsset.swap_devices)
+
+    def _get_luks_fingerprint(self):
+        return tuple(_get_luks_state(d) for d in self.devices if d.format.type == "luks")
+
+    def _get_disks_fingerprint(self):
+        return tuple(_get_device_state(d) for d in self.disks + self.partitions)
+
+    def _get_devices_fingerprint(self):
+        return (
+            tuple(_get_device_state(d) for d in self.devices),
+            tuple(action.id for action in self._storage.devicetree.actions),
+        )
+
+
+@depends_on(CHECK_INPUT_MOUNTPOINTS)
 def verify_root(storage, constraints, report_error, report_warning):
     """ Verify the root.
 
@@ -66,6 +222,7 @@ def verify_root(storage, constraints, report_error, report_warning):
                          % ", ".join(DEVICE_TEXT_MAP[t] for t in device_types))
 
 
+@depends_on(CHECK_INPUT_MOUNTPOINTS, CHECK_INPUT_DISKS, CHECK_INPUT_DEVICES)
 def verify_s390_constraints(storage, constraints, report_error, report_warning):
     """ Verify constraints for s390x.
 
@@ -101,6 +258,7 @@ def verify_s390_constraints(storage, constraints, report_error, report_warning):
                          .format(name="/dev/" + disk.name, busid=disk.busid))
 
 
+@depends_on(CHECK_INPUT_MOUNTPOINTS)
 def verify_partition_formatting(storage, constraints, report_error, report_warning):
     """ Verify partitions that should be reformatted by default.
 
@@ -122,6 +280,7 @@ def verify_partition_formatting(storage, constraints, report_error, report_warni
                          "%(mount)s partition.") % {'mount': mount})
 
 
+@depends_on(CHECK_INPUT_MOUNTPOINTS)
 def verify_partition_sizes(storage, constraints, report_error, report_warning):
     """ Verify the minimal and required partition sizes.
 
@@ -147,6 +306,7 @@ def verify_partition_sizes(storage, constraints, report_error, report_warning):
                          % {'mount': mount, 'size': size})
 
 
+@depends_on(CHECK_INPUT_MOUNTPOINTS)
 def verify_partition_format_sizes(storage, constraints, report_error, report_warning):
     """ Verify that the size of the device is allowed by the format used.
 
@@ -215,6 +375,7 @@ def verify_bootloader(storage, constraints, report_error, report_warning):
                     report_error(msg)
 
 
+@depends_on(CHECK_INPUT_BOOTLOADER, CHECK_INPUT_DEVICES)
 def verify_gpt_biosboot(storage, constraints, report_error, report_warning):
     """ Verify that GPT boot disk on BIOS system has a BIOS boot partition.
 
@@ -242,6 +403,7 @@ def verify_gpt_biosboot(storage, constraints, report_error, report_warning):
                                "'biosboot' type partition."))
 
 
+@depends_on(CHECK_INPUT_SWAP)
 def verify_swap(storage, constraints, report_error, report_warning):
     """ Verify the existence of swap.
 
@@ -277,6 +439,7 @@ def verify_swap(storage, constraints, report_error, report_warning):
                                  "for most installations."))
 
 
+@depends_on(CHECK_INPUT_SWAP)
 def verify_swap_uuid(storage, constraints, report_error, report_warning):
     """ Verify swap uuid.
 
@@ -298,6 +461,7 @@ def verify_swap_uuid(storage, constraints, report_error, report_warning):
                          "circumstances. "))
 
 
+@depends_on(CHECK_INPUT_MOUNTPOINTS)
 def verify_mountpoints_on_root(storage, constraints, report_error, report_warning):
     """ Verify mountpoints on the root.
 
@@ -312,6 +476,7 @@ def verify_mountpoints_on_root(storage, constraints, report_error, report_warnin
                            "be on the / file system.") % mountpoint)
 
 
+@depends_on(CHECK_INPUT_MOUNTPOINTS)
 def verify_mountpoints_not_on_root(storage, constraints, report_error, report_warning):
     """ Verify mountpoints not on the root.
 
@@ -328,6 +493,7 @@ def verify_mountpoints_not_on_root(storage, constraints, report_error, report_wa
                          % mountpoint)
 
 
+@depends_on(CHECK_INPUT_MOUNTPOINTS)
 def verify_mountpoints_on_linuxfs(storage, constraints, report_error, report_warning):
     """ Verify mountpoints on linuxfs.
 
@@ -344,6 +510,7 @@ def verify_mountpoints_on_linuxfs(storage, constraints, report_error, report_war
             report_error(_("The mount point %s must be on a linux file system.") % mountpoint)
 
 
+@depends_on(CHECK_INPUT_LUKS)
 def verify_unlocked_devices_have_key(storage, constraints, report_error, report_warning):
     """ Verify that existing unlocked LUKS devices have some way of obtaining a key.
 
@@ -371,6 +538,7 @@ def verify_unlocked_devices_have_key(storage, constraints, report_error, report_
                        "this device. Please, rescan the storage.").format(dev.name))
 
 
+@depends_on(CHECK_INPUT_LUKS)
 def verify_luks_devices_have_key(storage, constraints, report_error, report_warning):
     """ Verify that all non-existant LUKS devices have some way of obtaining a key.
 
@@ -440,6 +608,7 @@ def verify_mounted_partitions(storage, constraints, report_error, report_warning
                                "installation. Please unmount it and retry.") % part.path)
 
 
+@depends_on(CHECK_INPUT_DISKS, CHECK_INPUT_DEVICES)
 def verify_lvm_destruction(storage, constraints, report_error, report_warning):
     """Verify that destruction of LVM devices is correct.
 
@@ -550,6 +719,7 @@ class StorageChecker(object):
     def __init__(self):
         self.checks = list()
         self.constraints = dict()
+        self._results = dict()
 
     def add_check(self, callback):
         """ Add a callback for storage checking.
@@ -596,22 +766,33 @@ class StorageChecker(object):
 
         self.constraints[name] = value
 
-    def check(self, storage, constraints=None, skip=None):
+    def check(self, storage, constraints=None, skip=None, incremental=False):
         """ Run a series of tests to verify the storage configuration.
 
         This function is called at the end of partitioning so that we can make
         sure you don't have anything silly (like no /, a really small /, etc).
 
+        All checks get the same snapshot of the storage, so the expensive
+        properties of the storage are computed only once per run.
+
+        In the incremental mode, the results of checks with declared inputs
+        are reused if the inputs and the constraints haven't changed since
+        the last run of the check.
+
         :param storage: the storage object to check
         :param constraints: an dictionary of constraints that will be used by
                checks or None if we want to use the storage checker's constraints
         :param skip: a collection of checks we want to skip or None if we don't
                want to skip any
+        :param incremental: should we reuse results of unaffected checks?
         :return an instance of StorageCheckerReport with reported errors and warnings
         """
         if constraints is None:
             constraints = self.constraints
 
+        if storage is not None:
+            storage = StorageCheckerSnapshot(storage)
+
         # Report the constraints.
         result = StorageCheckerReport()
         result.add_info("Storage check started with constraints %s."
@@ -624,9 +805,34 @@ class StorageChecker(object):
                 result.add_info("Skipped sanity check %s." % check.__name__)
                 continue
 
+            # Reuse results of the check.
+            fingerprint = None
+
+            if incremental:
+                fingerprint = self._get_fingerprint(check, storage, constraints)
+
+            previous = self._results.get(check)
+
+            if fingerprint is not None and previous and previous[0] == fingerprint:
+                result.add_info("Reused sanity check %s." % check.__name__)
+                self._report_messages(result, previous[1])
+                continue
+
             # Run the check.
             result.add_info("Run sanity check %s." % check.__name__)
-            check(storage, constraints, result.add_error, result.add_warning)
+            messages = []
+
+            check(
+                storage,
+                constraints,
+                lambda msg, m=messages: m.append((True, msg)),
+                lambda msg, m=messages: m.append((False, msg))
+            )
+
+            self._report_messages(result, messages)
+
+            if fingerprint is not None:
+                self._results[check] = (fingerprint, messages)
 
         # Report the result.
         if result.success:
@@ -636,6 +842,26 @@ class StorageChecker(object):
 
         return result
 
+    def _get_fingerprint(self, check, storage, constraints):
+        """Get a fingerprint of the check inputs or None."""
+        inputs = getattr(check, "inputs", None)
+
+        if not inputs or storage is None:
+            return None
+
+        return (
+            repr(constraints),
+            tuple(storage.get_fingerprint(name) for name in sorted(inputs))
+        )
+
+    def _report_messages(self, result, messages):
+        """Report the errors and warnings of a check."""
+        for is_error, msg in messages:
+            if is_error:
+                result.add_error(msg)
+            else:
+                result.add_warning(msg)
+
     def get_default_constraint_names(self):
         """Get a list of default constraint names."""
         return [
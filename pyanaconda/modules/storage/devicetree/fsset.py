@@ -517,6 +517,10 @@ class FSSet(object):
                         self.proc, self.selinux, self.usb, self.run])
         if isinstance(platform, EFI):
             devices.append(self.efivars)
+
+        # Sorting by the mount point string puts every parent before its
+        # children. The devices are set up in one thread on purpose, since
+        # device.setup() and format.setup() are serialized by blivet_lock.
         devices.sort(key=lambda d: getattr(d.format, "mountpoint", ""))
 
         for device in devices:
@@ -27,7 +27,7 @@ from bytesize.bytesize import ROUND_HALF_UP
 
 from pykickstart.errors import KickstartError
 
-from pyanaconda.core import util
+from pyanaconda.core.session_pool import get_shared_session
 from pyanaconda.core.i18n import _
 from pyanaconda.modules.common.constants.services import NETWORK
 
@@ -71,7 +71,7 @@ def download_escrow_certificate(url):
     log.info("Downloading an escrow certificate from: %s", url)
 
     try:
-        request = util.requests_session().get(url, verify=True)
+        request = get_shared_session().get(url, verify=True)
     except requests.exceptions.SSLError as e:
         raise KickstartError(_("SSL error while downloading the escrow certificate:\n\n%s") % e) \
             from e
@@ -112,6 +112,15 @@ class DeviceTreeViewer(ABC):
         data.attrs = self._prune_attributes(data.attrs)
         return data
 
+    def get_devices_data(self, names):
+        """Get the data of the devices.
+
+        :param names: a list of device names
+        :return: a list of DeviceData instances
+        :raise: UnknownDeviceError if a device is not found
+        """
+        return list(map(self.get_device_data, names))
+
     def _set_device_data(self, device, data):
         """Set data for a device of any type."""
         data.type = device.type
@@ -171,6 +180,14 @@ class DeviceTreeViewer(ABC):
         device = self._get_device(device_name)
         return self._get_format_data(device.format)
 
+    def get_formats_data(self, device_names):
+        """Get the format data of the devices.
+
+        :param device_names: a list of device names
+        :return: a list of DeviceFormatData instances
+        """
+        return list(map(self.get_format_data, device_names))
+
     def get_format_type_data(self, format_name):
         """Get the format type data.
 
@@ -21,6 +21,7 @@ from dasbus.server.interface import dbus_interface
 from pyanaconda.modules.common.base.base_template import InterfaceTemplate
 from dasbus.typing import *  # pylint: disable=wildcard-import
 from pyanaconda.modules.common.constants.interfaces import DEVICE_TREE_VIEWER
+from pyanaconda.modules.common.structures.codec import get_structure_codec
 from pyanaconda.modules.common.structures.storage import DeviceData, DeviceActionData, \
     DeviceFormatData, OSData
 
@@ -68,7 +69,20 @@ class DeviceTreeViewerInterface(InterfaceTemplate):
         :return: a structure with device data
         :raise: UnknownDeviceError if the device is not found
         """
-        return DeviceData.to_structure(self.implementation.get_device_data(name))
+        return get_structure_codec(DeviceData).to_structure(
+            self.implementation.get_device_data(name)
+        )
+
+    def GetDevicesData(self, names: List[Str]) -> List[Structure]:
+        """Get the data of the devices.
+
+        :param names: a list of device names
+        :return: a list of structures with device data
+        :raise: UnknownDeviceError if a device is not found
+        """
+        return get_structure_codec(DeviceData).to_structure_list(
+            self.implementation.get_devices_data(names)
+        )
 
     def GetFormatData(self, name: Str) -> Structure:
         """Get the device format data.
@@ -76,7 +90,19 @@ class DeviceTreeViewerInterface(InterfaceTemplate):
         :param name: a name of the device
         :return: a structure with format data
         """
-        return DeviceFormatData.to_structure(self.implementation.get_format_data(name))
+        return get_structure_codec(DeviceFormatData).to_structure(
+            self.implementation.get_format_data(name)
+        )
+
+    def GetFormatsData(self, names: List[Str]) -> List[Structure]:
+        """Get the format data of the devices.
+
+        :param names: a list of device names
+        :return: a list of structures with format data
+        """
+        return get_structure_codec(DeviceFormatData).to_structure_list(
+            self.implementation.get_formats_data(names)
+        )
 
     def GetFormatTypeData(self, name: Str) -> Structure:
         """Get the format type data.
@@ -86,14 +112,18 @@ class DeviceTreeViewerInterface(InterfaceTemplate):
         :param name: a name of the format type
         :return: a structure with format data
         """
-        return DeviceFormatData.to_structure(self.implementation.get_format_type_data(name))
+        return get_structure_codec(DeviceFormatData).to_structure(
+            self.implementation.get_format_type_data(name)
+        )
 
     def GetActions(self) -> List[Structure]:
         """Get the device actions.
 
         :return: a list of structures with device action data
         """
-        return DeviceActionData.to_structure_list(self.implementation.get_actions())
+        return get_structure_codec(DeviceActionData).to_structure_list(
+            self.implementation.get_actions()
+        )
 
     def ResolveDevice(self, dev_spec: Str) -> Str:
         """Get the device matching the provided device specification.
@@ -185,4 +215,6 @@ class DeviceTreeViewerInterface(InterfaceTemplate):
 
         :return: a list of data about found installations
         """
-        return OSData.to_structure_list(self.implementation.get_existing_systems())
+        return get_structure_codec(OSData).to_structure_list(
+            self.implementation.get_existing_systems()
+        )
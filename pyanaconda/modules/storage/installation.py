@@ -159,6 +159,10 @@ class CreateStorageLayoutTask(Task):
         :type callbacks: return value of the :func:`blivet.callbacks.create_new_callbacks_register`
         """
         storage.devicetree.teardown_all()
+
+        # The actions are executed by Blivet one by one. Executing independent
+        # actions concurrently wouldn't help, because all methods of Blivet's
+        # actions, devices and formats hold the global blivet_lock.
         storage.do_it(callbacks)
         self._setup_bootable_devices(storage)
         storage.dump_state("final")
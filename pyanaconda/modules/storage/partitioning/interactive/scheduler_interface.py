@@ -21,6 +21,7 @@ from dasbus.server.interface import dbus_interface
 from dasbus.typing import *  # pylint: disable=wildcard-import
 from pyanaconda.modules.common.constants.interfaces import DEVICE_TREE_SCHEDULER
 from pyanaconda.modules.common.containers import TaskContainer
+from pyanaconda.modules.common.structures.codec import get_structure_codec
 from pyanaconda.modules.common.structures.device_factory import DeviceFactoryRequest, \
     DeviceFactoryPermissions
 from pyanaconda.modules.common.structures.partitioning import PartitioningRequest
@@ -217,7 +218,7 @@ class DeviceTreeSchedulerInterface(DeviceTreeInterface):
 
         :return: a list of data about found installations
         """
-        return OSData.to_structure_list(
+        return get_structure_codec(OSData).to_structure_list(
             self.implementation.collect_supported_systems()
         )
 
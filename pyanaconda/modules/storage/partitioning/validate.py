@@ -56,7 +56,7 @@ class StorageValidateTask(ValidationTask):
         :param storage: an instance of Blivet
         :return: a validation report
         """
-        result = storage_checker.check(storage)
+        result = storage_checker.check(storage, incremental=True)
 
         for message in result.info:
             log.debug(message)
@@ -363,6 +363,68 @@ def _set_ntp_servers_from_dhcp():
         )
 
 
+class NetworkStateWatcher(object):
+    """Watcher of the network state.
+
+    The waiters are woken up when the Network module reports a change
+    of its properties or device configurations, so they don't have to
+    wait for the next check.
+    The state is still checked periodically, because the signals are
+    not delivered if the main loop of the process is not running.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._changes = 0
+        self._proxy = None
+
+    @property
+    def proxy(self):
+        """The proxy of the Network module."""
+        with self._condition:
+            if self._proxy is None:
+                self._proxy = NETWORK.get_proxy()
+                self._proxy.PropertiesChanged.connect(self._state_changed)
+                self._proxy.DeviceConfigurationChanged.connect(self._state_changed)
+
+            return self._proxy
+
+    def _state_changed(self, *args):
+        with self._condition:
+            self._changes += 1
+            self._condition.notify_all()
+
+    def wait(self, check, timeout, interval):
+        """Wait until the check passes.
+
+        :param check: a function that returns True if the wait is over
+        :param timeout: a number of seconds to wait
+        :param interval: the maximal number of seconds between two checks
+        :return: True if the check passed, otherwise False
+        """
+        deadline = time.monotonic() + timeout
+
+        while True:
+            with self._condition:
+                changes = self._changes
+
+            if check():
+                return True
+
+            remaining = deadline - time.monotonic()
+
+            if remaining <= 0:
+                return False
+
+            with self._condition:
+                # Don't wait if something has changed during the check.
+                if changes == self._changes:
+                    self._condition.wait(min(interval, remaining))
+
+
+_network_state_watcher = NetworkStateWatcher()
+
+
 def wait_for_connected_NM(timeout=constants.NETWORK_CONNECTION_TIMEOUT, only_connecting=False):
     """Wait for NM being connected.
 
@@ -378,7 +440,7 @@ def wait_for_connected_NM(timeout=constants.NETWORK_CONNECTION_TIMEOUT, only_con
     :rtype: bool
     """
 
-    network_proxy = NETWORK.get_proxy()
+    network_proxy = _network_state_watcher.proxy
     if network_proxy.Connected:
         return True
 
@@ -390,34 +452,40 @@ def wait_for_connected_NM(timeout=constants.NETWORK_CONNECTION_TIMEOUT, only_con
     else:
         log.debug("waiting for connected NM, timeout=%d", timeout)
 
-    i = 0
-    while i < timeout:
-        i += constants.NETWORK_CONNECTED_CHECK_INTERVAL
-        time.sleep(constants.NETWORK_CONNECTED_CHECK_INTERVAL)
+    def check():
         if network_proxy.Connected:
-            log.debug("NM connected, waited %d seconds", i)
             return True
-        elif only_connecting:
-            if not network_proxy.IsConnecting():
-                break
 
-    log.debug("NM not connected, waited %d seconds", i)
+        return only_connecting and not network_proxy.IsConnecting()
+
+    start = time.monotonic()
+    _network_state_watcher.wait(check, timeout, constants.NETWORK_CONNECTED_CHECK_INTERVAL)
+    waited = time.monotonic() - start
+
+    if network_proxy.Connected:
+        log.debug("NM connected, waited %.2f seconds", waited)
+        return True
+
+    log.debug("NM not connected, waited %.2f seconds", waited)
     return False
 
 
 def wait_for_network_devices(devices, timeout=constants.NETWORK_CONNECTION_TIMEOUT):
     """Wait for network devices to be activated with a connection."""
     devices = set(devices)
-    i = 0
+    network_proxy = _network_state_watcher.proxy
     log.debug("waiting for connection of devices %s for iscsi", devices)
-    while i < timeout:
-        network_proxy = NETWORK.get_proxy()
-        activated_devices = network_proxy.GetActivatedInterfaces()
-        if not devices - set(activated_devices):
-            return True
-        i += 1
-        time.sleep(1)
-    return False
+
+    def check():
+        return not devices - set(network_proxy.GetActivatedInterfaces())
+
+    start = time.monotonic()
+    activated = _network_state_watcher.wait(
+        check, timeout, constants.NETWORK_DEVICES_CHECK_INTERVAL
+    )
+    log.debug("devices %s %s activated, waited %.2f seconds", devices,
+              "are" if activated else "are not", time.monotonic() - start)
+    return activated
 
 
 def wait_for_connecting_NM_thread():
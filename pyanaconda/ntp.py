@@ -21,16 +21,19 @@ Module facilitating the work with NTP servers and NTP daemon's configuration
 
 """
 
+import asyncio
 import re
 import os
+import socket
 import tempfile
+import time
 import shutil
 
 from pyanaconda.anaconda_loggers import get_module_logger
 from pyanaconda.core.i18n import N_, _
 from pyanaconda.core.constants import NTP_SERVER_TIMEOUT, NTP_SERVER_QUERY, \
-    THREAD_NTP_SERVER_CHECK, NTP_SERVER_OK, NTP_SERVER_NOK
-from pyanaconda.core.util import execWithRedirect
+    THREAD_NTP_SERVER_CHECK, NTP_SERVER_OK, NTP_SERVER_NOK, NTP_SERVER_STATUS_TTL, \
+    THREAD_PRIORITY_LOW
 from pyanaconda.modules.common.structures.timezone import TimeSourceData
 from pyanaconda.threading import threadMgr, AnacondaThread
 
@@ -45,6 +48,25 @@ SRV_ARG_OPTIONS = ["key", "minpoll", "maxpoll"]
 #treat pools as four servers with the same name
 SERVERS_PER_POOL = 4
 
+# Ports of the NTP and NTS-KE services.
+NTP_PORT = 123
+NTS_KE_PORT = 4460
+
+# The size of the NTP packet without extensions.
+NTP_PACKET_SIZE = 48
+
+# The first byte of the NTP client request: LI = 0, VN = 4, Mode = 3 (client).
+NTP_CLIENT_HEADER = 0x23
+
+# The mode of the NTP server response.
+NTP_SERVER_MODE = 4
+
+# The leap indicator of an unsynchronized server.
+NTP_LEAP_UNSYNCHRONIZED = 3
+
+# The maximal valid stratum.
+NTP_MAX_STRATUM = 15
+
 # Description of an NTP server status.
 NTP_SERVER_STATUS_DESCRIPTIONS = {
     NTP_SERVER_OK: N_("status: working"),
@@ -105,13 +127,217 @@ def ntp_server_working(server_hostname, nts_enabled):
     :return: True if the given server is reachable and working, False otherwise
     :rtype: bool
     """
-    directive = ["server", server_hostname, "iburst", "maxsamples", "1"]
+    server = TimeSourceData()
+    server.hostname = server_hostname
+    server.options = ["nts"] if nts_enabled else []
+
+    results = check_ntp_servers([server])
+    return results[_get_server_key(server)]
+
+
+def check_ntp_servers(servers, timeout=NTP_SERVER_TIMEOUT, ntp_port=NTP_PORT,
+                      nts_port=NTS_KE_PORT):
+    """Check if the given NTP servers appear to be working.
+
+    All servers are checked concurrently on one event loop. A server
+    without NTS is checked with an SNTP request over UDP, a server with
+    NTS with a TCP connection to the NTS-KE port. The servers that don't
+    respond before the deadline are considered not working.
+
+    :param servers: a list of NTP servers
+    :type servers: a list of TimeSourceData
+    :param timeout: a number of seconds to wait for all results
+    :param ntp_port: a port of the NTP service
+    :param nts_port: a port of the NTS-KE service
+    :return: a dictionary of server keys and results
+    """
+    loop = asyncio.new_event_loop()
+
+    try:
+        return loop.run_until_complete(
+            _check_ntp_servers(servers, timeout, ntp_port, nts_port)
+        )
+    finally:
+        loop.close()
+
+
+def _get_server_key(server):
+    """Get a key of the NTP server.
+
+    :param TimeSourceData server: an NTP server
+    :return: a tuple with the hostname and the NTS flag
+    """
+    return server.hostname, "nts" in server.options
+
+
+async def _check_ntp_servers(servers, timeout, ntp_port, nts_port):
+    """Check the NTP servers concurrently."""
+    tasks = {}
+
+    for server in servers:
+        key = _get_server_key(server)
+
+        if key in tasks:
+            continue
+
+        hostname, nts_enabled = key
+
+        if nts_enabled:
+            coroutine = _probe_nts_server(hostname, nts_port)
+        else:
+            coroutine = _probe_ntp_server(hostname, ntp_port)
+
+        tasks[key] = asyncio.ensure_future(coroutine)
+
+    if not tasks:
+        return {}
+
+    done, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+
+    for task in pending:
+        task.cancel()
+
+    # Let the cancelled tasks finish.
+    if pending:
+        await asyncio.wait(pending)
+
+    results = {}
+
+    for key, task in tasks.items():
+        results[key] = task in done and not task.exception() and task.result()
+
+    return results
+
+
+async def _probe_nts_server(hostname, port):
+    """Try to make a TCP connection to the NTS-KE port of the server.
+
+    :return: True if the connection was successful, otherwise False
+    """
+    try:
+        _reader, writer = await asyncio.open_connection(hostname, port)
+    except OSError as e:
+        log.debug("Failed to connect to the NTS-KE server %s: %s", hostname, e)
+        return False
+
+    writer.close()
+    return True
 
-    if nts_enabled:
-        directive.append("nts")
 
-    arguments = ["-Q", " ".join(directive), "-t", str(NTP_SERVER_TIMEOUT)]
-    return execWithRedirect("chronyd", arguments) == 0
+async def _probe_ntp_server(hostname, port):
+    """Send an SNTP request to all addresses of the server.
+
+    Pools are resolved to multiple addresses, so the first valid
+    response is enough.
+
+    :return: True if a valid response was received, otherwise False
+    """
+    loop = asyncio.get_event_loop()
+
+    try:
+        addresses = await loop.getaddrinfo(
+            hostname, port, type=socket.SOCK_DGRAM, proto=socket.IPPROTO_UDP
+        )
+    except OSError as e:
+        log.debug("Failed to resolve the NTP server %s: %s", hostname, e)
+        return False
+
+    probes = [
+        asyncio.ensure_future(_send_ntp_request(family, address))
+        for family, _type, _proto, _name, address in addresses
+    ]
+
+    try:
+        for probe in asyncio.as_completed(probes):
+            if await probe:
+                return True
+    finally:
+        for probe in probes:
+            probe.cancel()
+
+    return False
+
+
+async def _send_ntp_request(family, address):
+    """Send an SNTP request to the given address and wait for a response.
+
+    :return: True if a valid response was received, otherwise False
+    """
+    loop = asyncio.get_event_loop()
+    request = _create_ntp_request()
+    result = loop.create_future()
+
+    try:
+        transport, _protocol = await loop.create_datagram_endpoint(
+            lambda: _NTPClientProtocol(request, result),
+            remote_addr=address,
+            family=family
+        )
+    except OSError as e:
+        log.debug("Failed to send the NTP request to %s: %s", address[0], e)
+        return False
+
+    try:
+        return await result
+    finally:
+        transport.close()
+
+
+def _create_ntp_request():
+    """Create an SNTP client request.
+
+    A random transmit timestamp is used as a nonce to match
+    the response with the request.
+
+    :return: bytes of the request
+    """
+    return bytes([NTP_CLIENT_HEADER]) + bytes(39) + os.urandom(8)
+
+
+def _is_valid_ntp_response(request, response):
+    """Is the response a valid reply of a synchronized server to the request?
+
+    :param bytes request: an SNTP request
+    :param bytes response: a received packet
+    :return: True or False
+    """
+    if len(response) < NTP_PACKET_SIZE:
+        return False
+
+    leap = response[0] >> 6
+    mode = response[0] & 0x7
+    stratum = response[1]
+
+    if mode != NTP_SERVER_MODE or leap == NTP_LEAP_UNSYNCHRONIZED:
+        return False
+
+    # The stratum 0 means a kiss-o'-death packet.
+    if not 1 <= stratum <= NTP_MAX_STRATUM:
+        return False
+
+    # The originate timestamp should be our transmit timestamp.
+    return response[24:32] == request[40:48]
+
+
+class _NTPClientProtocol(asyncio.DatagramProtocol):
+    """The protocol for the SNTP request."""
+
+    def __init__(self, request, result):
+        self._request = request
+        self._result = result
+
+    def connection_made(self, transport):
+        transport.sendto(self._request)
+
+    def datagram_received(self, data, addr):
+        if not self._result.done() and _is_valid_ntp_response(self._request, data):
+            self._result.set_result(True)
+
+    def error_received(self, exc):
+        log.debug("Failed to receive the NTP response: %s", exc)
+
+        if not self._result.done():
+            self._result.set_result(False)
 
 
 def get_servers_from_config(conf_file_path=NTP_CONFIG_FILE):
@@ -230,10 +456,19 @@ def save_servers_to_config(servers, conf_file_path=NTP_CONFIG_FILE, out_file_pat
 
 
 class NTPServerStatusCache(object):
-    """The cache of NTP server states."""
+    """The cache of NTP server states.
+
+    The results of the checks are valid for the given number of seconds.
+    Servers with a valid result are not checked again.
+    """
+
+    def __init__(self, ttl=NTP_SERVER_STATUS_TTL):
+        """Create a new cache.
 
-    def __init__(self):
+        :param ttl: a number of seconds a result is valid
+        """
         self._cache = {}
+        self._ttl = ttl
 
     def get_status(self, server):
         """Get the status of the given NTP server.
@@ -241,10 +476,11 @@ class NTPServerStatusCache(object):
         :param TimeSourceData server: an NTP server
         :return int: a status of the NTP server
         """
-        return self._cache.get(
-            server.hostname,
-            NTP_SERVER_QUERY
+        status, _timestamp = self._cache.get(
+            _get_server_key(server),
+            (NTP_SERVER_QUERY, None)
         )
+        return status
 
     def get_status_description(self, server):
         """Get the status description of the given NTP server.
@@ -260,39 +496,75 @@ class NTPServerStatusCache(object):
 
         :param TimeSourceData server: an NTP server
         """
-        # Get a hostname and NTS option.
-        hostname = server.hostname
-        nts_enabled = "nts" in server.options
+        self.check_statuses([server])
+
+    def check_statuses(self, servers):
+        """Asynchronously check if the given NTP servers appear to be working.
+
+        The servers are checked concurrently in one thread. Servers
+        with a valid result or a running check are skipped.
+
+        :param servers: a list of NTP servers
+        :type servers: a list of TimeSourceData
+        """
+        servers = [s for s in servers if self._needs_check(s)]
+
+        if not servers:
+            return
 
         # Reset the current status.
-        self._set_status(hostname, NTP_SERVER_QUERY)
+        for server in servers:
+            self._set_status(_get_server_key(server), NTP_SERVER_QUERY)
 
         # Start the check.
         threadMgr.add(AnacondaThread(
             prefix=THREAD_NTP_SERVER_CHECK,
-            target=self._check_status,
-            args=(hostname, nts_enabled))
-        )
+            target=self._check_statuses,
+            args=(servers, ),
+            pooled=True,
+            priority=THREAD_PRIORITY_LOW
+        ))
 
-    def _set_status(self, hostname, status):
-        """Set the status of the given NTP server.
+    def _needs_check(self, server):
+        """Should the given NTP server be checked?
 
-        :param str hostname: a hostname of an NTP server
-        :return int: a status of the NTP server
+        :param TimeSourceData server: an NTP server
+        :return bool: True or False
         """
-        self._cache[hostname] = status
+        key = _get_server_key(server)
+
+        if key not in self._cache:
+            return True
+
+        status, timestamp = self._cache[key]
 
-    def _check_status(self, hostname, nts_enabled):
-        """Check if an NTP server appears to be working.
+        if status == NTP_SERVER_QUERY:
+            return False
 
-        :param str hostname: a hostname of an NTP server
+        return time.monotonic() - timestamp >= self._ttl
+
+    def _set_status(self, key, status):
+        """Set the status of the given NTP server.
+
+        :param key: a key of an NTP server
+        :param int status: a status of the NTP server
         """
-        log.debug("Checking NTP server %s", hostname)
-        result = ntp_server_working(hostname, nts_enabled)
+        self._cache[key] = (status, time.monotonic())
 
-        if result:
-            log.debug("NTP server %s appears to be working.", hostname)
-            self._set_status(hostname, NTP_SERVER_OK)
-        else:
-            log.debug("NTP server %s appears not to be working.", hostname)
-            self._set_status(hostname, NTP_SERVER_NOK)
+    def _check_statuses(self, servers):
+        """Check if the NTP servers appear to be working.
+
+        :param servers: a list of NTP servers
+        """
+        log.debug("Checking NTP servers %s", ", ".join(s.hostname for s in servers))
+        results = check_ntp_servers(servers)
+
+        for key, result in results.items():
+            hostname, _nts_enabled = key
+
+            if result:
+                log.debug("NTP server %s appears to be working.", hostname)
+                self._set_status(key, NTP_SERVER_OK)
+            else:
+                log.debug("NTP server %s appears not to be working.", hostname)
+                self._set_status(key, NTP_SERVER_NOK)
@@ -22,6 +22,7 @@ from abc import ABCMeta, abstractmethod
 from pyanaconda.core.configuration.anaconda import conf
 from pyanaconda.core import util
 from pyanaconda.core.kernel import kernel_arguments
+from pyanaconda.core.session_pool import get_shared_session
 from pyanaconda.payload.requirement import PayloadRequirements
 from pyanaconda.anaconda_loggers import get_module_logger
 
@@ -42,7 +43,7 @@ class Payload(metaclass=ABCMeta):
         # A list of verbose error strings from the subclass
         self.verbose_errors = []
 
-        self._session = util.requests_session()
+        self._session = get_shared_session()
 
         # Additional packages required by installer based on used features
         self.requirements = PayloadRequirements()
@@ -100,6 +101,17 @@ class Payload(metaclass=ABCMeta):
     def needs_network(self):
         return False
 
+    def needs_storage(self, checkmount=True):
+        """Does the set up of the payload need the storage?
+
+        If it doesn't, the payload can be set up while the storage
+        is still being discovered.
+
+        :param bool checkmount: whether the set up checks for a mounted media
+        :return: True or False
+        """
+        return True
+
     def language_groups(self):
         return []
 
@@ -0,0 +1,116 @@
+#
+# Copyright (C) 2026  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+from pyanaconda.anaconda_loggers import get_packaging_logger
+
+log = get_packaging_logger()
+
+__all__ = ["CompsIndex"]
+
+
+class CompsIndex(object):
+    """Index of environments and groups of comps.
+
+    The pattern lookups of comps go through all environments or groups
+    every time. The index is built once for a comps object and finds
+    them by their ids and names directly. Other patterns are looked up
+    in comps.
+
+    The translated names and descriptions are not stored, because they
+    depend on the current language. The index returns the comps objects
+    that provide them.
+    """
+
+    def __init__(self, comps):
+        """Build an index of the given comps.
+
+        :param comps: an instance of dnf.comps.Comps
+        """
+        self._comps = comps
+        self._environments = {}
+        self._environment_names = {}
+        self._groups = {}
+        self._group_names = {}
+        self._options = {}
+
+        for env in comps.environments:
+            self._environments[env.id] = env
+            self._add_name(self._environment_names, env)
+            self._options[env.id] = {
+                option.name: option.default for option in env.option_ids
+            }
+
+        for grp in comps.groups_iter():
+            self._groups[grp.id] = grp
+            self._add_name(self._group_names, grp)
+
+        log.debug("Indexed %d environments and %d groups.",
+                  len(self._environments), len(self._groups))
+
+    @staticmethod
+    def _add_name(names, obj):
+        """Add the name of the object to the name lookup."""
+        if obj.name is not None:
+            names.setdefault(obj.name, obj)
+
+    def is_index_of(self, comps):
+        """Is this an index of the given comps?"""
+        return self._comps is comps
+
+    @property
+    def environments(self):
+        """A list of environment ids in the comps order."""
+        return list(self._environments)
+
+    @property
+    def groups(self):
+        """A list of group ids in the comps order."""
+        return list(self._groups)
+
+    def find_environment(self, pattern):
+        """Find an environment by its id, name or a pattern.
+
+        :param str pattern: an id, a name or a pattern
+        :return: an environment or None
+        """
+        env = self._environments.get(pattern) or self._environment_names.get(pattern)
+
+        if env is None:
+            env = self._comps.environment_by_pattern(pattern)
+
+        return env
+
+    def find_group(self, pattern):
+        """Find a group by its id, name or a pattern.
+
+        :param str pattern: an id, a name or a pattern
+        :return: a group or None
+        """
+        grp = self._groups.get(pattern) or self._group_names.get(pattern)
+
+        if grp is None:
+            grp = self._comps.group_by_pattern(pattern)
+
+        return grp
+
+    def get_options(self, environment_id):
+        """Get the optional groups of the environment.
+
+        :param str environment_id: an id of the environment
+        :return: a dictionary of group ids and their default flags
+        """
+        return self._options.get(environment_id, {})
@@ -62,6 +62,7 @@ class DownloadProgress(dnf.callback.DownloadProgress):
             'total_size': self.total_size
         }
         progressQ.send_message(msg % vals)
+        progressQ.send_download(int(downloaded), int(self.total_size))
 
     def end(self, dnf_payload, status, msg):  # pylint: disable=arguments-differ
         nevra = str(dnf_payload)
@@ -23,6 +23,7 @@ import os
 import shutil
 import sys
 import threading
+import time
 import dnf
 import dnf.logging
 import dnf.exceptions
@@ -55,7 +56,7 @@ from pyanaconda.core.configuration.anaconda import conf
 from pyanaconda.core.constants import INSTALL_TREE, ISO_DIR, PAYLOAD_TYPE_DNF, \
     DNF_DEFAULT_SOURCE_TYPE, SOURCE_TYPE_HMC, SOURCE_TYPE_URL, SOURCE_TYPE_CDROM, \
     URL_TYPE_BASEURL, URL_TYPE_MIRRORLIST, URL_TYPE_METALINK, SOURCE_REPO_FILE_TYPES, \
-    SOURCE_TYPE_CDN
+    SOURCE_TYPE_CDN, SOURCE_NETWORK_TYPES
 from pyanaconda.core.i18n import N_, _
 from pyanaconda.core.kernel import kernel_arguments
 from pyanaconda.core.payload import ProxyString, ProxyStringError
@@ -71,11 +72,13 @@ from pyanaconda.modules.common.errors.storage import DeviceSetupError, MountFile
 from pyanaconda.modules.common.util import is_module_available
 from pyanaconda.payload import utils as payload_utils
 from pyanaconda.payload.base import Payload
+from pyanaconda.payload.dnf.comps import CompsIndex
 from pyanaconda.payload.dnf.utils import DNF_CACHE_DIR, DNF_PLUGINCONF_DIR, REPO_DIRS, \
     DNF_LIBREPO_LOG, DNF_PACKAGE_CACHE_DIR_SUFFIX, BONUS_SIZE_ON_FILE, YUM_REPOS_DIR, \
-    go_to_failure_limbo, do_transaction, get_df_map, pick_mount_point
+    go_to_failure_limbo, do_transaction, get_df_map, pick_mount_point, prune_metadata_cache
 from pyanaconda.payload.dnf.download_progress import DownloadProgress
-from pyanaconda.payload.dnf.repomd import RepoMDMetaHash
+from pyanaconda.payload.dnf.repomd import RepoMDMetaHash, store_repoMD_hashes, \
+    verify_repoMD_hashes
 from pyanaconda.payload.errors import MetadataError, PayloadError, NoSuchGroup, DependencyError, \
     PayloadInstallError, PayloadSetupError
 from pyanaconda.payload.image import find_first_iso_image, mountImage, find_optical_install_media
@@ -105,6 +108,10 @@ class DNFPayload(Payload):
 
         self.tx_id = None
         self._install_tree_metadata = None
+
+        # The transaction id, the selection key and the error
+        # of the last check of the software selection.
+        self._checked_selection = None
         self._rpm_macros = []
 
         # Used to determine which add-ons to display for each environment.
@@ -114,6 +121,9 @@ class DNFPayload(Payload):
         # environment.
         self._environment_addons = {}
 
+        # The index of the current comps.
+        self._comps_index = None
+
         self._base = None
         self._download_location = None
         self._updates_enabled = True
@@ -233,6 +243,24 @@ class DNFPayload(Payload):
         return (self.proxy.IsNetworkRequired() or
                 any(self._repo_needs_network(repo) for repo in self.data.repo.dataList()))
 
+    def needs_storage(self, checkmount=True):
+        """Does the set up of the payload need the storage?
+
+        Only the network sources can be set up without the storage. The
+        default source needs the storage to look for an optical media and
+        the additional repositories on a hard drive need it to find the
+        device.
+        """
+        source_type = self.source_type
+
+        if source_type not in SOURCE_NETWORK_TYPES:
+            return True
+
+        if checkmount and source_type == DNF_DEFAULT_SOURCE_TYPE:
+            return True
+
+        return any(repo.is_harddrive_based() for repo in self.data.repo.dataList())
+
     def _repo_needs_network(self, repo):
         """Returns True if the ksdata repo requires networking."""
         urls = [repo.baseurl]
@@ -314,8 +342,12 @@ class DNFPayload(Payload):
                       "or modules are missing or broken:\n%s", e)
             self._payload_setup_error(e)
 
-    def _apply_selections(self):
-        log.debug("applying DNF package/group/module selection")
+    def _get_selection_specs(self):
+        """Get specs of the selected packages, groups and modules.
+
+        :return: a tuple of lists of specs to include and exclude
+        """
+        log.debug("collecting DNF package/group/module selection")
 
         # note about package/group/module spec formatting:
         # - leading @ signifies a group or module
@@ -406,6 +438,29 @@ class DNFPayload(Payload):
         # add packages
         include_list.extend(self._req_packages)
 
+        return include_list, exclude_list
+
+    def _get_selection_key(self, include_list, exclude_list):
+        """Get a key that identifies the software selection.
+
+        The check of the software selection gives the same result
+        for the same key unless the payload is reset. The specs are
+        sorted, because the required packages are kept in a set.
+        """
+        modules = tuple(
+            (module.name, module.stream, module.enable)
+            for module in self.data.module.dataList()
+        )
+
+        with self._repos_lock:
+            repos = tuple(sorted(repo.id for repo in self._base.repos.iter_enabled()))
+
+        return (tuple(sorted(include_list)), tuple(sorted(exclude_list)), modules, repos,
+                self._base.conf.strict, self.data.packages.handleMissing)
+
+    def _apply_selections(self, include_list, exclude_list):
+        log.debug("applying DNF package/group/module selection")
+
         # log the resulting set
         log.debug("transaction include list")
         log.debug(include_list)
@@ -533,6 +588,9 @@ class DNFPayload(Payload):
         self._base = dnf.Base()
         config = self._base.conf
         config.cachedir = DNF_CACHE_DIR
+        # The metadata cache survives resets of the payload. Check the
+        # repomd.xml every time, so only unchanged metadata are reused.
+        config.metadata_expire = 0
         config.pluginconfpath = DNF_PLUGINCONF_DIR
         config.logdir = '/tmp/'
         # enable depsolver debugging if in debug mode
@@ -639,6 +697,94 @@ class DNFPayload(Payload):
 
         return pkgdir
 
+    def _get_local_repos(self):
+        """Get ids of the enabled repositories with local files only."""
+        local_repos = set()
+
+        with self._repos_lock:
+            for repo in self._base.repos.iter_enabled():
+                if repo.mirrorlist or repo.metalink or not repo.baseurl:
+                    continue
+
+                if all(url.startswith("file://") for url in repo.baseurl):
+                    local_repos.add(repo.id)
+
+        return local_repos
+
+    def _reuse_local_packages(self, packages):
+        """Reuse packages that are available in local repositories.
+
+        A package from a remote repository doesn't have to be downloaded
+        if a local repository, for example the installation media, has
+        a package with the same NEVRA and checksum. The local file is
+        copied to the download location instead.
+
+        :param packages: a list of packages to download
+        :return: a list of packages that still have to be downloaded
+        """
+        local_repos = self._get_local_repos()
+        remote_packages = [pkg for pkg in packages if pkg.reponame not in local_repos]
+
+        if not local_repos or not remote_packages:
+            return list(packages)
+
+        # Index the matching packages of the local repositories.
+        query = self._base.sack.query().available().filter(
+            reponame=list(local_repos),
+            name=list({pkg.name for pkg in remote_packages})
+        )
+        local_files = {}
+
+        for pkg in query:
+            if pkg.chksum:
+                local_files[(pkg.name, pkg.evr, pkg.arch, pkg.chksum)] = pkg.localPkg()
+
+        reused = set()
+
+        for pkg in remote_packages:
+            path = local_files.get((pkg.name, pkg.evr, pkg.arch, pkg.chksum))
+
+            if path and self._copy_local_package(path, pkg.localPkg()):
+                reused.add(pkg)
+
+        log.info("Reusing %d of %d remote packages from local repositories.",
+                 len(reused), len(remote_packages))
+
+        return [pkg for pkg in packages if pkg not in reused]
+
+    @staticmethod
+    def _copy_local_package(path, target):
+        """Copy the local package to the download location.
+
+        The package is hard-linked if possible, otherwise it is copied.
+        The downloaded package mustn't refer to the local repository,
+        because the repository can be unmounted before the transaction
+        is finished.
+
+        :param path: a path to the local package
+        :param target: a path to the downloaded package
+        :return: True on success, otherwise False
+        """
+        try:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+
+            try:
+                os.link(path, target)
+            except OSError:
+                shutil.copyfile(path, target)
+
+        except OSError as e:
+            log.warning("Failed to reuse the local package %s: %s", path, e)
+
+            # Remove a partial copy.
+            if os.path.exists(target):
+                os.unlink(target)
+
+            return False
+
+        log.debug("Reusing the local package %s.", path)
+        return True
+
     def _package_name_installable(self, package_name):
         """Check if the given package name looks instalable."""
         subj = dnf.subject.Subject(package_name)
@@ -735,9 +881,22 @@ class DNFPayload(Payload):
     # METHODS FOR WORKING WITH ENVIRONMENTS
     ###
 
+    @property
+    def _comps(self):
+        """The index of the current comps.
+
+        The index is built again if the comps were read again.
+        """
+        comps = self._base.comps
+
+        if self._comps_index is None or not self._comps_index.is_index_of(comps):
+            self._comps_index = CompsIndex(comps)
+
+        return self._comps_index
+
     @property
     def environments(self):
-        return [env.id for env in self._base.comps.environments]
+        return self._comps.environments
 
     def select_environment(self, environment_id):
         if environment_id not in self.environments:
@@ -755,8 +914,7 @@ class DNFPayload(Payload):
 
     @property
     def groups(self):
-        groups = self._base.comps.groups_iter()
-        return [g.id for g in groups]
+        return self._comps.groups
 
     def selected_groups(self):
         """Return list of selected group names from kickstart.
@@ -1086,17 +1244,33 @@ class DNFPayload(Payload):
         return total_space
 
     def _is_group_visible(self, grpid):
-        grp = self._base.comps.group_by_pattern(grpid)
+        grp = self._comps.find_group(grpid)
         if grp is None:
             raise NoSuchGroup(grpid)
         return grp.visible
 
     def check_software_selection(self):
         log.info("checking software selection")
-        self._bump_tx_id()
+        include_list, exclude_list = self._get_selection_specs()
+        selection_key = self._get_selection_key(include_list, exclude_list)
+
+        # Don't resolve the same selection again.
+        if self._checked_selection and self._checked_selection[:2] == (self.tx_id, selection_key):
+            log.info("software selection has not changed since the last check")
+            error = self._checked_selection[2]
+
+            if error:
+                raise DependencyError(error)
+
+            return
+
+        self._checked_selection = None
+        tx_id = self._bump_tx_id()
+        start_time = time.monotonic()
+
         self._base.reset(goal=True)
         self._process_module_command()
-        self._apply_selections()
+        self._apply_selections(include_list, exclude_list)
 
         try:
             if self._base.resolve():
@@ -1106,8 +1280,12 @@ class DNFPayload(Payload):
         except dnf.exceptions.DepsolveError as e:
             msg = str(e)
             log.warning(msg)
+            self._checked_selection = (tx_id, selection_key, msg)
             raise DependencyError(msg) from e
+        finally:
+            log.info("checking dependencies took %.2f s", time.monotonic() - start_time)
 
+        self._checked_selection = (tx_id, selection_key, None)
         log.info("%d packages selected totalling %s",
                  len(self._base.transaction), self.space_required)
 
@@ -1153,7 +1331,7 @@ class DNFPayload(Payload):
             repo.enabled = True
 
     def environment_description(self, environment_id):
-        env = self._base.comps.environment_by_pattern(environment_id)
+        env = self._comps.find_environment(environment_id)
         if env is None:
             raise NoSuchGroup(environment_id)
         return (env.ui_name, env.ui_description)
@@ -1165,7 +1343,7 @@ class DNFPayload(Payload):
             log.warning("environment_id() called with non-string "
                         "argument: %s", environment)
 
-        env = self._base.comps.environment_by_pattern(environment)
+        env = self._comps.find_environment(environment)
 
         if env is None:
             raise NoSuchGroup(environment)
@@ -1173,23 +1351,23 @@ class DNFPayload(Payload):
         return env.id
 
     def environment_has_option(self, environment_id, grpid):
-        env = self._base.comps.environment_by_pattern(environment_id)
+        env = self._comps.find_environment(environment_id)
         if env is None:
             raise NoSuchGroup(environment_id)
-        return grpid in (id_.name for id_ in env.option_ids)
+        return grpid in self._comps.get_options(env.id)
 
     def environment_option_is_default(self, environment_id, grpid):
-        env = self._base.comps.environment_by_pattern(environment_id)
+        env = self._comps.find_environment(environment_id)
         if env is None:
             raise NoSuchGroup(environment_id)
 
         # Look for a group in the optionlist that matches the group_id and has
         # default set
-        return any(grp for grp in env.option_ids if grp.name == grpid and grp.default)
+        return bool(self._comps.get_options(env.id).get(grpid))
 
     def group_description(self, grpid):
         """Return name/description tuple for the group specified by id."""
-        grp = self._base.comps.group_by_pattern(grpid)
+        grp = self._comps.find_group(grpid)
         if grp is None:
             raise NoSuchGroup(grpid)
         return (grp.ui_name, grp.ui_description or "")
@@ -1202,7 +1380,7 @@ class DNFPayload(Payload):
         :raise NoSuchGroup: If group_name doesn't exists.
         :raise PayloadError: When Yum's groups are not available.
         """
-        grp = self._base.comps.group_by_pattern(group_name)
+        grp = self._comps.find_group(group_name)
         if grp is None:
             raise NoSuchGroup(group_name)
         return grp.id
@@ -1218,17 +1396,18 @@ class DNFPayload(Payload):
     def _refresh_environment_addons(self):
         log.info("Refreshing environment_addons")
         self._environment_addons = {}
+        comps = self._comps
+        visible_groups = [grp for grp in comps.groups if self._is_group_visible(grp)]
 
-        for environment in self.environments:
-            self._environment_addons[environment] = ([], [])
+        for environment in comps.environments:
+            options = comps.get_options(environment)
 
             # Determine which groups are specific to this environment and which other groups
             # are available in this environment.
-            for grp in self.groups:
-                if self.environment_has_option(environment, grp):
-                    self._environment_addons[environment][0].append(grp)
-                elif self._is_group_visible(grp):
-                    self._environment_addons[environment][1].append(grp)
+            self._environment_addons[environment] = (
+                [grp for grp in comps.groups if grp in options],
+                [grp for grp in visible_groups if grp not in options]
+            )
 
     @property
     def rpm_macros(self):
@@ -1360,7 +1539,7 @@ class DNFPayload(Payload):
             log.info("Removing existing package download "
                      "location: %s", self._download_location)
             shutil.rmtree(self._download_location)
-        pkgs_to_download = self._base.transaction.install_set
+        pkgs_to_download = self._reuse_local_packages(self._base.transaction.install_set)
         log.info('Downloading packages to %s.', self._download_location)
         progressQ.send_message(_('Downloading packages'))
         progress = DownloadProgress()
@@ -1390,6 +1569,8 @@ class DNFPayload(Payload):
             if token == 'install':
                 msg = _("Installing %s") % msg
                 progressQ.send_message(msg)
+            elif token == 'packages':
+                progressQ.send_packages(*msg)
             elif token == 'configure':
                 msg = _("Configuring %s") % msg
                 progressQ.send_message(msg)
@@ -1452,11 +1633,7 @@ class DNFPayload(Payload):
         if not self._repoMD_list:
             return False
 
-        for repo in self._repoMD_list:
-            if not repo.verify_repoMD():
-                log.debug("Can't reach repo %s", repo.id)
-                return False
-        return True
+        return verify_repoMD_hashes(self._repoMD_list)
 
     def language_groups(self):
         localization_proxy = LOCALIZATION.get_proxy()
@@ -1474,10 +1651,13 @@ class DNFPayload(Payload):
         tear_down_sources(self.proxy)
         self.reset_additional_repos()
 
-        shutil.rmtree(DNF_CACHE_DIR, ignore_errors=True)
+        # Keep the metadata cache, so repositories with the same
+        # repomd.xml don't have to download their metadata again.
+        prune_metadata_cache(DNF_CACHE_DIR)
         shutil.rmtree(DNF_PLUGINCONF_DIR, ignore_errors=True)
 
         self.tx_id = None
+        self._checked_selection = None
         self._base.reset(sack=True, repos=True)
         self._configure_proxy()
         self._repoMD_list = []
@@ -1535,6 +1715,10 @@ class DNFPayload(Payload):
         # to use that instead of the default repos.
         self._base.read_all_repos()
 
+        # Don't trust the expiration of metadata from the repo files.
+        for repo in self._base.repos.values():
+            repo.metadata_expire = 0
+
         # Enable or disable updates.
         self.set_updates_enabled(self._updates_enabled)
 
@@ -2000,13 +2184,12 @@ class DNFPayload(Payload):
         Save repomd hash to test if the repositories can be reached.
         """
         super().post_setup()
-        self._repoMD_list = []
         proxy_url = self._get_proxy_url()
 
-        for repo in self._base.repos.iter_enabled():
-            repoMD = RepoMDMetaHash(repo, proxy_url)
-            repoMD.store_repoMD_hash()
-            self._repoMD_list.append(repoMD)
+        self._repoMD_list = [
+            RepoMDMetaHash(repo, proxy_url) for repo in self._base.repos.iter_enabled()
+        ]
+        store_repoMD_hashes(self._repoMD_list)
 
     def post_install(self):
         """Perform post-installation tasks."""
@@ -16,22 +16,107 @@
 # Red Hat, Inc.
 #
 import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from requests import RequestException
 
 from pyanaconda.anaconda_loggers import get_packaging_logger
-from pyanaconda.core import util, constants
+from pyanaconda.core import constants
 from pyanaconda.core.payload import ProxyString, ProxyStringError
+from pyanaconda.core.session_pool import get_shared_session
 from pyanaconda.payload.dnf.utils import USER_AGENT
 
 log = get_packaging_logger()
 
-__all__ = ["RepoMDMetaHash"]
+__all__ = ["RepoMDMetaHash", "store_repoMD_hashes", "verify_repoMD_hashes"]
+
+# Maximal number of concurrent requests for repomd.xml files.
+REPOMD_MAX_WORKERS = 8
+
+# Size of the chunks the repomd.xml file is hashed in.
+REPOMD_CHUNK_SIZE = 64 * 1024
+
+
+def _get_first_result(function, items, accept):
+    """Call the function for all items concurrently and return the first accepted result.
+
+    The remaining calls are cancelled if they haven't started yet. The running
+    calls are not waited for.
+
+    :param function: a function with one argument
+    :param items: a list of arguments
+    :param accept: a function that decides if the result is accepted
+    :return: a tuple of the item and the result or (None, None)
+    """
+    if not items:
+        return None, None
+
+    executor = ThreadPoolExecutor(
+        max_workers=min(len(items), REPOMD_MAX_WORKERS),
+        thread_name_prefix="AnaRepoMDThread"
+    )
+    futures = {executor.submit(function, item): item for item in items}
+
+    try:
+        for future in as_completed(futures):
+            result = future.result()
+
+            if accept(result):
+                return futures[future], result
+
+        return None, None
+    finally:
+        for future in futures:
+            future.cancel()
+
+        executor.shutdown(wait=False)
+
+
+def store_repoMD_hashes(repomd_list):
+    """Download and store hashes of the repomd.xml files of the given repositories.
+
+    :param repomd_list: a list of RepoMDMetaHash instances
+    """
+    if not repomd_list:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(len(repomd_list), REPOMD_MAX_WORKERS),
+                            thread_name_prefix="AnaRepoMDThread") as executor:
+        list(executor.map(lambda repo: repo.store_repoMD_hash(), repomd_list))
+
+
+def verify_repoMD_hashes(repomd_list):
+    """Verify the repomd.xml files of the given repositories.
+
+    The repositories are verified concurrently and the verification stops
+    at the first repository that can't be reached.
+
+    :param repomd_list: a list of RepoMDMetaHash instances
+    :return: True if all repositories are available, otherwise False
+    """
+    repo, _result = _get_first_result(
+        lambda repo: repo.verify_repoMD(),
+        repomd_list,
+        lambda result: not result
+    )
+
+    if repo:
+        log.debug("Can't reach repo %s", repo.id)
+        return False
+
+    return True
 
 
 class RepoMDMetaHash(object):
     """Class that holds hash of a repomd.xml file content from a repository.
     This class can test availability of this repository by comparing hashes.
+
+    The base URLs of the repository are tried concurrently and the first
+    successful response is used. The mirrors can serve different versions
+    of the file, so the verification accepts only a response that matches
+    the stored hash. The ETag and Last-Modified validators of
+    that response are remembered, so the next verification can ask the
+    server whether the file has changed instead of downloading it again.
     """
     def __init__(self, repo, proxy_url):
         self._repoId = repo.id
@@ -39,6 +124,7 @@ class RepoMDMetaHash(object):
         self._ssl_verify = repo.sslverify
         self._urls = repo.baseurl
         self._repomd_hash = ""
+        self._validators = {}
 
     @property
     def repoMD_hash(self):
@@ -52,53 +138,123 @@ class RepoMDMetaHash(object):
 
     def store_repoMD_hash(self):
         """Download and store hash of the repomd.xml file content."""
-        repomd = self._download_repoMD()
-        self._repomd_hash = self._calculate_hash(repomd)
+        self._validators = {}
+        url, result = self._download_repoMD()
+
+        if not url:
+            self._repomd_hash = ""
+            return
+
+        self._repomd_hash, validators = result
+        self._validators[url] = validators
 
     def verify_repoMD(self):
         """Download and compare with stored repomd.xml file."""
-        new_repomd = self._download_repoMD()
-        new_repomd_hash = self._calculate_hash(new_repomd)
-        return new_repomd_hash == self._repomd_hash
+        url, result = self._download_repoMD(
+            lambda result: result is not None and result[0] == self._repomd_hash
+        )
 
-    def _calculate_hash(self, data):
+        if not url:
+            return False
+
+        # The content of this URL matches the stored hash,
+        # so we can use its validators the next time.
+        _repomd_hash, validators = result
+        self._validators[url] = validators
+        return True
+
+    def _calculate_hash(self, chunks):
         m = hashlib.sha256()
-        m.update(data.encode('ascii', 'backslashreplace'))
+
+        for chunk in chunks:
+            m.update(chunk)
+
         return m.digest()
 
-    def _download_repoMD(self):
-        proxies = {}
-        repomd = ""
+    def _get_proxies(self):
+        if self._proxy_url is None:
+            return {}
+
+        try:
+            proxy = ProxyString(self._proxy_url)
+            return {"http": proxy.url,
+                    "https": proxy.url}
+        except ProxyStringError as e:
+            log.info("Failed to parse proxy for test if repo available %s: %s",
+                     self._proxy_url, e)
+
+        return {}
+
+    def _get_request_headers(self, url):
         headers = {"user-agent": USER_AGENT}
+        etag, last_modified = self._validators.get(url, (None, None))
+
+        if etag:
+            headers["if-none-match"] = etag
+
+        if last_modified:
+            headers["if-modified-since"] = last_modified
 
-        if self._proxy_url is not None:
-            try:
-                proxy = ProxyString(self._proxy_url)
-                proxies = {"http": proxy.url,
-                           "https": proxy.url}
-            except ProxyStringError as e:
-                log.info("Failed to parse proxy for test if repo available %s: %s",
-                         self._proxy_url, e)
-
-        session = util.requests_session()
-
-        # Test all urls for this repo. If any of these is working it is enough.
-        for url in self._urls:
-            try:
-                result = session.get("%s/repodata/repomd.xml" % url, headers=headers,
-                                     proxies=proxies, verify=self._ssl_verify,
-                                     timeout=constants.NETWORK_CONNECTION_TIMEOUT)
-                if result.ok:
-                    repomd = result.text
-                    result.close()
-                    break
-                else:
+        return headers
+
+    def _download_repoMD(self, accept=None):
+        """Download the repomd.xml file from the first working URL.
+
+        Test all urls for this repo. If any of these is working it is enough.
+
+        :param accept: a function that decides if the result of the URL is
+                       accepted or None to accept any downloaded file
+        :return: a tuple of the URL and a result of the _fetch_repoMD method
+                 or (None, None) if no URL is working
+        """
+        proxies = self._get_proxies()
+        session = get_shared_session(proxies, self._ssl_verify)
+
+        return _get_first_result(
+            lambda url: self._fetch_repoMD(session, proxies, url),
+            self._urls,
+            accept or (lambda result: result is not None)
+        )
+
+    def _fetch_repoMD(self, session, proxies, url):
+        """Download and hash the repomd.xml file from the given URL.
+
+        :return: a tuple of the hash and the validators of the file or None
+        """
+        try:
+            with session.get("%s/repodata/repomd.xml" % url,
+                             headers=self._get_request_headers(url),
+                             proxies=proxies, verify=self._ssl_verify,
+                             timeout=constants.NETWORK_CONNECTION_TIMEOUT,
+                             stream=True) as result:
+
+                if result.status_code == 304:
+                    validators = self._validators.get(url)
+
+                    # Nothing was requested conditionally.
+                    if not validators or not any(validators):
+                        log.debug("Server returned 304 code for an unconditional request")
+                        return None
+
+                    log.debug("The repomd.xml file at %s hasn't changed", url)
+                    return self._repomd_hash, validators
+
+                if not result.ok:
                     log.debug("Server returned %i code when downloading repomd",
                               result.status_code)
-                    result.close()
-                    continue
-            except RequestException as e:
-                log.debug("Can't download new repomd.xml from %s with proxy: %s. Error: %s",
-                          url, proxies, e)
+                    return None
+
+                repomd_hash = self._calculate_hash(
+                    result.iter_content(REPOMD_CHUNK_SIZE)
+                )
+                validators = (
+                    result.headers.get("ETag"),
+                    result.headers.get("Last-Modified")
+                )
+                return repomd_hash, validators
+
+        except RequestException as e:
+            log.debug("Can't download new repomd.xml from %s with proxy: %s. Error: %s",
+                      url, proxies, e)
 
-        return repomd
+        return None
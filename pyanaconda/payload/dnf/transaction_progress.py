@@ -43,6 +43,7 @@ class TransactionProgress(dnf.callback.TransactionProgress):
                 (package.name, package.arch, ts_done, ts_total)
             self.cnt += 1
             self._queue.put(('install', msg))
+            self._queue.put(('packages', (ts_done, ts_total)))
 
             # Log the exact package nevra, build time and checksum
             nevra = "%s-%s.%s" % (package.name, package.evr, package.arch)
@@ -17,6 +17,7 @@
 #
 import os
 import operator
+import shutil
 import time
 
 from blivet.size import Size
@@ -32,6 +33,7 @@ log = get_packaging_logger()
 
 
 DNF_CACHE_DIR = '/tmp/dnf.cache'
+DNF_CACHE_MAX_SIZE = Size("1 GiB")
 DNF_PLUGINCONF_DIR = '/tmp/dnf.pluginconf'
 DNF_PACKAGE_CACHE_DIR_SUFFIX = 'dnf.package.cache'
 DNF_LIBREPO_LOG = '/tmp/dnf.librepo.log'
@@ -56,6 +58,78 @@ def go_to_failure_limbo():
         time.sleep(10000)
 
 
+def get_metadata_cache_size(path):
+    """Get the size of a file or a directory in the metadata cache.
+
+    :param str path: a path to the file or the directory
+    :return int: a number of bytes
+    """
+    if not os.path.isdir(path) or os.path.islink(path):
+        return os.lstat(path).st_size
+
+    size = 0
+
+    for root, _dirs, files in os.walk(path):
+        for name in files:
+            try:
+                size += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                continue
+
+    return size
+
+
+def prune_metadata_cache(cache_dir=DNF_CACHE_DIR, max_size=DNF_CACHE_MAX_SIZE):
+    """Remove the least recently used entries of the metadata cache.
+
+    DNF keeps the metadata of every repository in a separate directory
+    of the cache and checks the cached repomd.xml before it uses them.
+    The cache is kept between resets of the payload, so it is pruned to
+    the given size instead.
+
+    :param str cache_dir: a path to the cache
+    :param max_size: a maximal size of the cache
+    :return: a list of removed paths
+    """
+    entries = []
+
+    try:
+        names = os.listdir(cache_dir)
+    except FileNotFoundError:
+        return []
+
+    for name in names:
+        path = os.path.join(cache_dir, name)
+
+        try:
+            entries.append((os.lstat(path).st_mtime, get_metadata_cache_size(path), path))
+        except OSError:
+            continue
+
+    # Remove the oldest entries first.
+    entries.sort(reverse=True)
+    total_size = sum(size for _mtime, size, _path in entries)
+    removed = []
+
+    while entries and total_size > max_size:
+        _mtime, size, path = entries.pop()
+        log.debug("Removing %s from the metadata cache.", path)
+
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            try:
+                os.unlink(path)
+            except OSError as e:
+                log.warning("Failed to remove %s from the metadata cache: %s", path, e)
+                continue
+
+        total_size -= size
+        removed.append(path)
+
+    return removed
+
+
 def get_df_map():
     """Return (mountpoint -> size available) mapping."""
     output = util.execWithCapture('df', ['--output=target,avail'])
@@ -21,6 +21,9 @@ import os
 import os.path
 import stat
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, \
+    as_completed, wait
 
 import blivet.util
 import blivet.arch
@@ -35,6 +38,7 @@ from pyanaconda.modules.common.errors.storage import MountFilesystemError
 from pyanaconda.modules.common.structures.storage import DeviceData, DeviceFormatData
 from pyanaconda.payload import utils as payload_utils
 from pyanaconda.payload.install_tree_metadata import InstallTreeMetadata
+from pyanaconda.payload.iso9660 import ISO9660Image, ISO9660Error
 
 from productmd.discinfo import DiscInfo
 
@@ -43,6 +47,18 @@ log = get_module_logger(__name__)
 
 _arch = blivet.arch.get_arch()
 
+# Metadata of the checked ISO images by their paths.
+_iso_images_metadata = {}
+
+# Maximal number of optical media probed at once.
+OPTICAL_MEDIA_MAX_WORKERS = 8
+
+# Maximal time of probing all optical media in seconds.
+OPTICAL_MEDIA_TIMEOUT = 60
+
+# Maximal time of waiting for the mounting probes in seconds.
+OPTICAL_MEDIA_CANCEL_TIMEOUT = 10
+
 
 def find_first_iso_image(path, mount_path="/mnt/install/cdimage"):
     """Find the first iso image in path.
@@ -64,7 +80,6 @@ def find_first_iso_image(path, mount_path="/mnt/install/cdimage"):
         return None
 
     arch = _arch
-    discinfo_path = os.path.join(mount_path, ".discinfo")
 
     if os.path.isfile(path) and path.endswith(".iso"):
         files = [os.path.basename(path)]
@@ -78,40 +93,21 @@ def find_first_iso_image(path, mount_path="/mnt/install/cdimage"):
         if not isys.isIsoImage(what):
             continue
 
-        log.debug("Mounting %s on %s", what, mount_path)
-        try:
-            blivet.util.mount(what, mount_path, fstype="iso9660", options="ro")
-        except OSError:
-            continue
+        disc_arch, has_repodata = _get_iso_image_metadata(what, mount_path)
 
-        if not os.access(discinfo_path, os.R_OK):
-            blivet.util.umount(mount_path)
-            continue
-
-        log.debug("Reading .discinfo")
-        disc_info = DiscInfo()
-
-        # TODO replace next 2 blocks with:
-        #   pyanaconda.modules.payloads.source.utils.is_valid_install_disk
-        try:
-            disc_info.load(discinfo_path)
-            disc_arch = disc_info.arch
-        except Exception as ex:  # pylint: disable=broad-except
-            log.warning(".discinfo file can't be loaded: %s", ex)
+        if not disc_arch:
             continue
 
         log.debug("discArch = %s", disc_arch)
         if disc_arch != arch:
             log.warning("Architectures mismatch in find_first_iso_image: %s != %s",
                         disc_arch, arch)
-            blivet.util.umount(mount_path)
             continue
 
         # If there's no repodata, there's no point in trying to
         # install from it.
-        if not _check_repodata(mount_path):
+        if not has_repodata:
             log.warning("%s doesn't have a valid repodata, skipping", what)
-            blivet.util.umount(mount_path)
             continue
 
         # warn user if images appears to be wrong size
@@ -122,25 +118,130 @@ def find_first_iso_image(path, mount_path="/mnt/install/cdimage"):
                 raise exn
 
         log.info("Found disc at %s", fn)
-        blivet.util.umount(mount_path)
         return fn
 
     return None
 
 
+def _get_iso_image_metadata(image_path, mount_path):
+    """Get metadata of the ISO image.
+
+    The metadata are cached until the size or the modification
+    time of the image changes.
+
+    :param str image_path: a path to the ISO image
+    :param str mount_path: a path for mounting the ISO image if it can't be read
+    :return: a tuple of the architecture from .discinfo or None and
+             a flag of a valid repodata
+    """
+    image_stat = os.stat(image_path)
+    stamp = (image_stat.st_size, image_stat.st_mtime_ns)
+    cached = _iso_images_metadata.get(image_path)
+
+    if cached and cached[0] == stamp:
+        log.debug("Using cached metadata of %s", image_path)
+        return cached[1]
+
+    try:
+        metadata = _read_iso_image_metadata(image_path)
+    except (OSError, ISO9660Error) as e:
+        log.debug("Can't read %s: %s", image_path, e)
+        metadata = _read_mounted_iso_image_metadata(image_path, mount_path)
+
+    _iso_images_metadata[image_path] = (stamp, metadata)
+    return metadata
+
+
+def _read_iso_image_metadata(image_path):
+    """Read metadata of the ISO image without mounting it."""
+    with ISO9660Image(image_path) as image:
+        discinfo = image.read_file(".discinfo")
+
+        if discinfo is None:
+            return None, False
+
+        log.debug("Reading .discinfo")
+        disc_arch = _load_disc_arch(discinfo.decode("utf-8", errors="replace"))
+
+        if not disc_arch:
+            return None, False
+
+        treeinfo = image.read_file(".treeinfo") or image.read_file("treeinfo")
+        install_tree_meta = InstallTreeMetadata()
+
+        if treeinfo is None:
+            log.warning("Can't read install tree metadata!")
+        else:
+            try:
+                install_tree_meta.load_data(treeinfo.decode("utf-8", errors="replace"))
+            except Exception as ex:  # pylint: disable=broad-except
+                log.warning("Can't read install tree metadata: %s", ex)
+                return disc_arch, False
+
+        repo_md = _find_install_root_repository(install_tree_meta)
+
+        if not repo_md:
+            return disc_arch, False
+
+        repomd_path = os.path.join(repo_md.relative_path, "repodata", "repomd.xml")
+        if image.exists(repomd_path):
+            return disc_arch, True
+
+        log.debug("There is no valid repository available.")
+        return disc_arch, False
+
+
+def _read_mounted_iso_image_metadata(image_path, mount_path):
+    """Read metadata of the ISO image from its mount point."""
+    log.debug("Mounting %s on %s", image_path, mount_path)
+    try:
+        blivet.util.mount(image_path, mount_path, fstype="iso9660", options="ro")
+    except OSError:
+        return None, False
+
+    try:
+        discinfo_path = os.path.join(mount_path, ".discinfo")
+
+        if not os.access(discinfo_path, os.R_OK):
+            return None, False
+
+        log.debug("Reading .discinfo")
+        with open(discinfo_path, "r") as f:
+            disc_arch = _load_disc_arch(f.read())
+
+        if not disc_arch:
+            return None, False
+
+        return disc_arch, _check_repodata(mount_path)
+    finally:
+        blivet.util.umount(mount_path)
+
+
+def _load_disc_arch(content):
+    """Get the architecture from the content of .discinfo.
+
+    :return: an architecture or None
+    """
+    disc_info = DiscInfo()
+
+    # TODO replace with:
+    #   pyanaconda.modules.payloads.source.utils.is_valid_install_disk
+    try:
+        disc_info.loads(content)
+        return disc_info.arch
+    except Exception as ex:  # pylint: disable=broad-except
+        log.warning(".discinfo file can't be loaded: %s", ex)
+        return None
+
+
 def _check_repodata(mount_path):
     install_tree_meta = InstallTreeMetadata()
     if not install_tree_meta.load_file(mount_path):
         log.warning("Can't read install tree metadata!")
 
-    repo_md = install_tree_meta.get_base_repo_metadata()
-
-    if not repo_md:
-        repo_mds = install_tree_meta.get_metadata_repos()
-        repo_md = _search_for_install_root_repository(repo_mds)
+    repo_md = _find_install_root_repository(install_tree_meta)
 
     if not repo_md:
-        log.debug("There is no usable repository available")
         return False
 
     if repo_md.is_valid():
@@ -150,6 +251,19 @@ def _check_repodata(mount_path):
     return False
 
 
+def _find_install_root_repository(install_tree_meta):
+    repo_md = install_tree_meta.get_base_repo_metadata()
+
+    if not repo_md:
+        repo_mds = install_tree_meta.get_metadata_repos()
+        repo_md = _search_for_install_root_repository(repo_mds)
+
+    if not repo_md:
+        log.debug("There is no usable repository available")
+
+    return repo_md
+
+
 def _search_for_install_root_repository(repos):
     for repo in repos:
         if repo.relative_path == ".":
@@ -186,38 +300,158 @@ def mountImage(isodir, tree):
             break
 
 
-def find_optical_install_media():
+def find_optical_install_media(timeout=OPTICAL_MEDIA_TIMEOUT):
     """Find a device with a valid optical install media.
 
     Return the first device containing a valid optical install
     media for this product.
 
+    The devices are probed concurrently. The devices that are not
+    probed before the timeout are skipped. The remaining probes are
+    cancelled, so they don't mount any other devices, and only the
+    probes that have already mounted their devices are waited for.
+
     FIXME: This is duplicated in SetUpCdromSourceTask.run
 
+    :param timeout: a maximal number of seconds to probe the devices
     :return: a device name or None
     """
     device_tree = STORAGE.get_proxy(DEVICE_TREE)
+    device_names = device_tree.FindOpticalMedia()
+
+    if not device_names:
+        return None
+
+    devices_data = DeviceData.from_structure_list(
+        device_tree.GetDevicesData(device_names)
+    )
+
+    executor = ThreadPoolExecutor(
+        max_workers=min(len(device_names), OPTICAL_MEDIA_MAX_WORKERS),
+        thread_name_prefix="AnaOpticalMediaThread"
+    )
+    cancellation = _OpticalMediaCancellation()
+    futures = {
+        executor.submit(_probe_optical_media, data.name, data.path, cancellation): data.name
+        for data in devices_data
+    }
+    results = {}
+
+    try:
+        for future in as_completed(futures, timeout=timeout):
+            results[futures[future]] = future.result()
+
+            # Keep the order of the devices.
+            for dev in device_names:
+                if dev not in results:
+                    break
+
+                if results[dev]:
+                    return dev
+
+    except FuturesTimeoutError:
+        log.warning("Probing of the optical media timed out after %s seconds.", timeout)
+
+    finally:
+        mounting = cancellation.cancel()
+
+        for future in futures:
+            future.cancel()
+
+        # Wait a while for the mounting probes to unmount their devices.
+        wait([f for f, dev in futures.items() if dev in mounting],
+             timeout=OPTICAL_MEDIA_CANCEL_TIMEOUT)
+        executor.shutdown(wait=False)
+
+    for dev in device_names:
+        if results.get(dev):
+            return dev
+
+    return None
+
+
+class _OpticalMediaCancellation(object):
+    """Cancellation of the optical media probes."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._mounting = set()
+
+    def start_mount(self, device_name):
+        """Register a device that is going to be mounted.
+
+        :param device_name: a device name
+        :return: False if the probes are cancelled, otherwise True
+        """
+        with self._lock:
+            if self._cancelled:
+                return False
+
+            self._mounting.add(device_name)
+            return True
+
+    def cancel(self):
+        """Cancel the probes.
 
-    for dev in device_tree.FindOpticalMedia():
-        mountpoint = tempfile.mkdtemp()
+        :return: a set of names of the devices that were mounted
+        """
+        with self._lock:
+            self._cancelled = True
+            return set(self._mounting)
 
+
+def _probe_optical_media(device_name, device_path, cancellation=None):
+    """Is the optical media a valid install media?
+
+    Read the media without mounting it if possible.
+
+    :param device_name: a device name
+    :param device_path: a device path
+    :param cancellation: an instance of _OpticalMediaCancellation or None
+    :return: True or False
+    """
+    try:
+        return _is_valid_optical_media(device_path)
+    except (OSError, ISO9660Error) as e:
+        # Fall back to mounting the media.
+        log.debug("Can't read the optical media %s: %s", device_name, e)
+
+    if cancellation and not cancellation.start_mount(device_name):
+        log.debug("The probe of the optical media %s was cancelled.", device_name)
+        return False
+
+    mountpoint = tempfile.mkdtemp()
+
+    try:
         try:
-            try:
-                payload_utils.mount_device(dev, mountpoint)
-            except MountFilesystemError:
-                continue
-            try:
-                from pyanaconda.modules.payloads.source.utils import is_valid_install_disk
-                if not is_valid_install_disk(mountpoint):
-                    continue
-            finally:
-                payload_utils.unmount_device(dev, mountpoint)
+            payload_utils.mount_device(device_name, mountpoint)
+        except MountFilesystemError:
+            return False
+        try:
+            from pyanaconda.modules.payloads.source.utils import is_valid_install_disk
+            return is_valid_install_disk(mountpoint)
         finally:
-            os.rmdir(mountpoint)
+            payload_utils.unmount_device(device_name, mountpoint)
+    finally:
+        os.rmdir(mountpoint)
 
-        return dev
 
-    return None
+def _is_valid_optical_media(device_path):
+    """Is the optical media a valid install media?
+
+    Read .discinfo of the media without mounting it.
+
+    :param device_path: a device path
+    :return: True or False
+    """
+    with ISO9660Image(device_path) as image:
+        discinfo = image.read_file(".discinfo")
+
+    if discinfo is None:
+        return False
+
+    return _load_disc_arch(discinfo.decode("utf-8", errors="replace")) == _arch
 
 
 def find_potential_hdiso_sources():
@@ -239,18 +473,42 @@ def get_hdiso_source_info(device_tree, device_name):
     :param device_name: a device name
     :return: a dictionary with a device info
     """
-    device_data = DeviceData.from_structure(
-        device_tree.GetDeviceData(device_name)
-    )
+    return get_hdiso_sources_info(device_tree, [device_name])[0]
+
 
-    format_data = DeviceFormatData.from_structure(
-        device_tree.GetFormatData(device_name)
+def get_hdiso_sources_info(device_tree, device_names):
+    """Get info about potential HDISO sources.
+
+    The data of all devices are requested at once.
+
+    :param device_tree: a proxy of a device tree
+    :param device_names: a list of device names
+    :return: a list of dictionaries with a device info
+    """
+    if not device_names:
+        return []
+
+    devices_data = DeviceData.from_structure_list(
+        device_tree.GetDevicesData(device_names)
     )
 
-    disk_data = DeviceData.from_structure(
-        device_tree.GetDeviceData(device_data.parents[0])
+    formats_data = DeviceFormatData.from_structure_list(
+        device_tree.GetFormatsData(device_names)
     )
 
+    disk_names = list(dict.fromkeys(data.parents[0] for data in devices_data))
+    disks_data = dict(zip(disk_names, DeviceData.from_structure_list(
+        device_tree.GetDevicesData(disk_names)
+    )))
+
+    return [
+        _get_hdiso_source_info(device_data, format_data, disks_data[device_data.parents[0]])
+        for device_data, format_data in zip(devices_data, formats_data)
+    ]
+
+
+def _get_hdiso_source_info(device_data, format_data, disk_data):
+    """Get info about a potential HDISO source from its data."""
     return {
         "model": disk_data.attrs.get("model", "").replace("_", " "),
         "path": device_data.path,
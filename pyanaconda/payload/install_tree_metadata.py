@@ -18,12 +18,13 @@
 #
 
 import time
-import requests
 import os
 
 from productmd.treeinfo import TreeInfo
 from pyanaconda.core import util, constants
 from pyanaconda.core.payload import split_protocol
+from pyanaconda.core.remote_cache import get_remote_cache, RemoteResourceError
+from pyanaconda.core.session_pool import get_shared_session
 
 from pyanaconda.anaconda_loggers import get_packaging_logger
 log = get_packaging_logger()
@@ -58,6 +59,18 @@ class InstallTreeMetadata(object):
 
         return True
 
+    def load_data(self, data, root_path=""):
+        """Loads installation tree metadata from a string.
+
+        :param data: Content of the .treeinfo file.
+        :type data: str
+        :param root_path: Path to the installation root.
+        :type root_path: str
+        """
+        self._clear()
+        self._path = root_path
+        self._tree_info.loads(data)
+
     def load_url(self, url, proxies, sslverify, sslcert, headers):
         """Load URL link.
 
@@ -81,7 +94,7 @@ class InstallTreeMetadata(object):
         xdelay = util.xprogressive_delay()
         response = None
         ret_code = [None, None]
-        session = util.requests_session()
+        session = get_shared_session(proxies, sslverify, sslcert)
 
         for retry_count in range(0, MAX_TREEINFO_DOWNLOAD_RETRIES + 1):
             if retry_count > 0:
@@ -89,16 +102,14 @@ class InstallTreeMetadata(object):
             # Downloading .treeinfo
             log.info("Trying to download '.treeinfo'")
             (response, ret_code[0]) = self._download_treeinfo_file(session, url, ".treeinfo",
-                                                                   headers, proxies,
-                                                                   sslverify, sslcert)
+                                                                   headers)
             if response:
                 break
 
             # Downloading treeinfo
             log.info("Trying to download 'treeinfo'")
             (response, ret_code[1]) = self._download_treeinfo_file(session, url, "treeinfo",
-                                                                   headers, proxies,
-                                                                   sslverify, sslcert)
+                                                                   headers)
             if response:
                 break
 
@@ -131,28 +142,19 @@ class InstallTreeMetadata(object):
         return False
 
     @staticmethod
-    def _download_treeinfo_file(session, url, file_name, headers, proxies, verify, cert):
+    def _download_treeinfo_file(session, url, file_name, headers):
+        # The proxies and the TLS settings are set up in the session.
+        # The cached file is revalidated, because the tree can change.
         try:
-            result = session.get("%s/%s" % (url, file_name), headers=headers,
-                                 proxies=proxies, verify=verify, cert=cert,
-                                 timeout=constants.NETWORK_CONNECTION_TIMEOUT)
-
-            status_code = result.status_code
-
-            # Server returned HTTP 4XX or 5XX codes
-            if 400 <= status_code < 600:
-                log.info("Server returned %i code", status_code)
-                result_text = None
-            else:
-                result_text = result.text
-
-            result.close()
-        except requests.exceptions.RequestException as e:
+            result_text = get_remote_cache().load_to_str(
+                "%s/%s" % (url, file_name), session=session, headers=headers, revalidate=True
+            )
+        except RemoteResourceError as e:
             log.info("Error downloading '%s': %s", file_name, e)
-            return None, None
+            return None, e.status_code
 
         log.debug("Retrieved '%s' from %s", file_name, url)
-        return result_text, status_code
+        return result_text, 200
 
     def _clear(self):
         """Clear metadata repositories."""
@@ -0,0 +1,301 @@
+#
+# iso9660.py: Reader of ISO 9660 images.
+#
+# Copyright (C) 2026  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import struct
+from collections import namedtuple
+
+__all__ = ["ISO9660Error", "ISO9660Entry", "ISO9660Image"]
+
+# The size of a sector of the image.
+ISO9660_SECTOR_SIZE = 2048
+
+# The first sector with a volume descriptor.
+ISO9660_FIRST_DESCRIPTOR = 16
+
+# The maximal number of volume descriptors.
+ISO9660_MAX_DESCRIPTORS = 64
+
+# Types of the volume descriptors.
+ISO9660_PRIMARY_DESCRIPTOR = 1
+ISO9660_SUPPLEMENTARY_DESCRIPTOR = 2
+ISO9660_TERMINATOR = 255
+
+# Escape sequences of the Joliet extension.
+JOLIET_ESCAPE_SEQUENCES = (b"%/@", b"%/C", b"%/E")
+
+# The maximal size of a file that can be read.
+ISO9660_MAX_FILE_SIZE = 1024 * 1024
+
+# An entry of a directory.
+ISO9660Entry = namedtuple("ISO9660Entry", ["name", "extent", "size", "is_dir"])
+
+
+class ISO9660Error(Exception):
+    """The image can't be read."""
+
+
+class ISO9660Image(object):
+    """Reader of an ISO 9660 image.
+
+    The reader finds and reads files of the image without mounting it.
+    Only the sectors with the volume descriptors, the directories on the
+    path and the content of the read file are read. The long file names
+    are provided by the Rock Ridge or the Joliet extension.
+    """
+
+    def __init__(self, path):
+        """Create a new reader.
+
+        :param path: a path to the image or to the device
+        """
+        self._path = path
+        self._file = None
+        self._block_size = ISO9660_SECTOR_SIZE
+        self._root = None
+        self._rock_ridge = False
+        self._directories = {}
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def open(self):
+        """Open the image.
+
+        :raise: OSError if the image can't be opened
+        :raise: ISO9660Error if the image is not supported
+        """
+        self._file = open(self._path, "rb")
+
+        try:
+            self._read_volume_descriptors()
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        """Close the image."""
+        if self._file:
+            self._file.close()
+            self._file = None
+
+        self._directories = {}
+
+    def _read(self, block, size):
+        """Read data from the given logical block."""
+        self._file.seek(block * self._block_size)
+        data = self._file.read(size)
+
+        if len(data) != size:
+            raise ISO9660Error("Unexpected end of the image {}.".format(self._path))
+
+        return data
+
+    def _read_volume_descriptors(self):
+        """Find the root directory with long file names."""
+        primary = None
+        joliet = None
+
+        for sector in range(ISO9660_FIRST_DESCRIPTOR,
+                            ISO9660_FIRST_DESCRIPTOR + ISO9660_MAX_DESCRIPTORS):
+            self._file.seek(sector * ISO9660_SECTOR_SIZE)
+            data = self._file.read(ISO9660_SECTOR_SIZE)
+
+            if len(data) != ISO9660_SECTOR_SIZE or data[1:6] != b"CD001":
+                break
+
+            if data[0] == ISO9660_PRIMARY_DESCRIPTOR and not primary:
+                primary = data
+            elif data[0] == ISO9660_SUPPLEMENTARY_DESCRIPTOR and not joliet \
+                    and data[88:91] in JOLIET_ESCAPE_SEQUENCES:
+                joliet = data
+            elif data[0] == ISO9660_TERMINATOR:
+                break
+
+        if not primary:
+            raise ISO9660Error("No primary volume descriptor in {}.".format(self._path))
+
+        self._block_size = struct.unpack_from("<H", primary, 128)[0] or ISO9660_SECTOR_SIZE
+        self._root = self._parse_record(primary[156:190], joliet=False)
+
+        # Prefer the Rock Ridge names, the same as the kernel.
+        if self._has_rock_ridge(self._root):
+            self._rock_ridge = True
+            return
+
+        if joliet:
+            self._root = self._parse_record(joliet[156:190], joliet=True)
+            return
+
+        raise ISO9660Error("No long file names in {}.".format(self._path))
+
+    def _has_rock_ridge(self, root):
+        """Does the root directory have the Rock Ridge extension?
+
+        The first record of the root directory starts with the SP entry.
+        """
+        data = self._read(root.extent, ISO9660_SECTOR_SIZE)
+        name_length = data[32]
+        offset = 33 + name_length + (1 - name_length % 2)
+        return data[offset:offset + 2] == b"SP" and data[offset + 4:offset + 6] == b"\xbe\xef"
+
+    def _parse_record(self, data, joliet):
+        """Parse a directory record.
+
+        :return: an instance of ISO9660Entry
+        """
+        if len(data) < 34:
+            raise ISO9660Error("Invalid directory record in {}.".format(self._path))
+
+        extent, size = struct.unpack_from("<I4xI", data, 2)
+        is_dir = bool(data[25] & 0x02)
+        name_length = data[32]
+        raw_name = data[33:33 + name_length]
+
+        if raw_name in (b"\x00", b"\x01"):
+            return ISO9660Entry(raw_name.decode(), extent, size, is_dir)
+
+        if self._rock_ridge:
+            system_use = data[33 + name_length + (1 - name_length % 2):]
+            name = self._get_rock_ridge_name(system_use)
+
+            if name is not None:
+                return ISO9660Entry(name, extent, size, is_dir)
+
+        if joliet:
+            name = raw_name.decode("utf-16-be", errors="replace")
+        else:
+            name = raw_name.decode("ascii", errors="replace")
+
+        # Remove the version of the file.
+        if not is_dir:
+            name = name.split(";")[0]
+
+        return ISO9660Entry(name, extent, size, is_dir)
+
+    @staticmethod
+    def _get_rock_ridge_name(system_use):
+        """Get the name from the NM entries of the system use area."""
+        parts = []
+        offset = 0
+
+        while offset + 4 <= len(system_use):
+            signature = system_use[offset:offset + 2]
+            length = system_use[offset + 2]
+
+            if length < 4:
+                break
+
+            if signature == b"NM" and length >= 5:
+                parts.append(system_use[offset + 5:offset + length])
+
+                if not system_use[offset + 4] & 0x01:
+                    break
+
+            offset += length
+
+        if not parts:
+            return None
+
+        return b"".join(parts).decode("utf-8", errors="replace")
+
+    def _read_directory(self, entry):
+        """Read entries of the directory.
+
+        :param entry: an instance of ISO9660Entry
+        :return: a dictionary of names and entries
+        """
+        if entry.extent in self._directories:
+            return self._directories[entry.extent]
+
+        data = self._read(entry.extent, entry.size)
+        joliet = not self._rock_ridge
+        entries = {}
+        offset = 0
+
+        while offset < len(data):
+            length = data[offset]
+
+            # The records don't cross the sectors.
+            if length == 0:
+                offset = (offset // self._block_size + 1) * self._block_size
+                continue
+
+            record = self._parse_record(data[offset:offset + length], joliet)
+            offset += length
+
+            if record.name in ("\x00", "\x01"):
+                continue
+
+            entries.setdefault(record.name, record)
+
+        self._directories[entry.extent] = entries
+        return entries
+
+    def find(self, path):
+        """Find an entry of the image.
+
+        :param path: a path relative to the root of the image
+        :return: an instance of ISO9660Entry or None
+        """
+        entry = self._root
+
+        for name in path.split("/"):
+            if name in ("", "."):
+                continue
+
+            if not entry.is_dir:
+                return None
+
+            entry = self._read_directory(entry).get(name)
+
+            if entry is None:
+                return None
+
+        return entry
+
+    def exists(self, path):
+        """Does the path exist in the image?"""
+        return self.find(path) is not None
+
+    def is_dir(self, path):
+        """Is the path a directory in the image?"""
+        entry = self.find(path)
+        return entry is not None and entry.is_dir
+
+    def read_file(self, path, max_size=ISO9660_MAX_FILE_SIZE):
+        """Read a file of the image.
+
+        :param path: a path relative to the root of the image
+        :param max_size: the maximal size of the file in bytes
+        :return: bytes or None if the file doesn't exist
+        :raise: ISO9660Error if the file is too big
+        """
+        entry = self.find(path)
+
+        if entry is None or entry.is_dir:
+            return None
+
+        if entry.size > max_size:
+            raise ISO9660Error("The file {} is too big.".format(path))
+
+        return self._read(entry.extent, entry.size)
@@ -56,6 +56,7 @@ class DownloadProgress(object):
         self._pct = pct
         progressQ.send_message(_("Downloading %(url)s (%(pct)d%%)") %
                                {"url": self.url, "pct": pct})
+        progressQ.send_download(bytes_read, self.size)
 
     def end(self, bytes_read):
         """ Download complete
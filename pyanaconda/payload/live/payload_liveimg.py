@@ -146,33 +146,34 @@ class LiveImagePayload(BaseLivePayload):
             log.info("Starting image download")
             with open(self.image_path, "wb") as f:
                 ssl_verify = not self.data.liveimg.noverifyssl
-                response = self._session.get(
+                with self._session.get(
                     self.data.liveimg.url,
                     proxies=self._proxies,
                     verify=ssl_verify,
                     stream=True,
                     timeout=NETWORK_CONNECTION_TIMEOUT
-                )
-                total_length = response.headers.get('content-length')
-                if total_length is None:  # no content length header
-                    # just download the file in one go and fake the progress reporting once done
-                    log.warning("content-length header is missing for the installation image, "
-                                "download progress reporting will not be available")
-                    f.write(response.content)
-                    size = f.tell()
-                    progress.start(self.data.liveimg.url, size)
-                    progress.end(size)
-                else:
-                    # requests return headers as strings, so convert total_length to int
-                    progress.start(self.data.liveimg.url, int(total_length))
-                    bytes_read = 0
-                    for buf in response.iter_content(1024 * 1024):  # 1 MB chunks
-                        if buf:
-                            f.write(buf)
-                            f.flush()
-                            bytes_read += len(buf)
-                            progress.update(bytes_read)
-                    progress.end(bytes_read)
+                ) as response:
+                    total_length = response.headers.get('content-length')
+                    if total_length is None:  # no content length header
+                        # just download the file in one go and fake the progress
+                        # reporting once done
+                        log.warning("content-length header is missing for the installation image, "
+                                    "download progress reporting will not be available")
+                        f.write(response.content)
+                        size = f.tell()
+                        progress.start(self.data.liveimg.url, size)
+                        progress.end(size)
+                    else:
+                        # requests return headers as strings, so convert total_length to int
+                        progress.start(self.data.liveimg.url, int(total_length))
+                        bytes_read = 0
+                        for buf in response.iter_content(1024 * 1024):  # 1 MB chunks
+                            if buf:
+                                f.write(buf)
+                                f.flush()
+                                bytes_read += len(buf)
+                                progress.update(bytes_read)
+                        progress.end(bytes_read)
                 log.info("Image download finished")
         except requests.exceptions.RequestException as e:
             log.error("Error downloading liveimg: %s", e)
@@ -66,6 +66,10 @@ class PayloadManager(object):
     WAITING_NETWORK will immediately run the code being added
     for WAITING_NETWORK.
 
+    The waiting for the storage is skipped if the payload doesn't depend
+    on it. For example, the metadata of a network source are downloaded
+    while the storage is still being discovered.
+
     The payload thread data should be accessed using the payloadMgr object,
     and the running thread can be accessed using threadMgr with the
     THREAD_PAYLOAD constant, if you need to wait for it or something. The
@@ -152,7 +156,8 @@ class PayloadManager(object):
         threadMgr.add(AnacondaThread(
             name=THREAD_PAYLOAD,
             target=self._run_thread,
-            args=(payload, fallback, checkmount, onlyOnChange)
+            args=(payload, fallback, checkmount, onlyOnChange),
+            pooled=True
         ))
 
     def _set_state(self, event_id):
@@ -167,15 +172,28 @@ class PayloadManager(object):
             for func in self._event_listeners[event_id]:
                 func()
 
+    @staticmethod
+    def _needs_storage(payload, checkmount):
+        """Should the payload thread wait for the storage?"""
+        try:
+            return payload.needs_storage(checkmount)
+        except DBusError as e:
+            log.debug("Failed to check the storage requirement: %s", e)
+            return True
+
     def _run_thread(self, payload, fallback, checkmount, onlyOnChange):
         # This is the thread entry
         # Set the initial state
         self._error = None
         self._set_state(PayloadState.STARTED)
 
-        # Wait for storage
-        self._set_state(PayloadState.WAITING_STORAGE)
-        threadMgr.wait(THREAD_STORAGE)
+        # Wait for storage if the payload needs it. The network sources
+        # can download the metadata while the storage is being discovered.
+        if self._needs_storage(payload, checkmount):
+            self._set_state(PayloadState.WAITING_STORAGE)
+            threadMgr.wait(THREAD_STORAGE)
+        else:
+            log.debug("The payload doesn't need storage, not waiting for it.")
 
         # Wait for network
         self._set_state(PayloadState.WAITING_NETWORK)
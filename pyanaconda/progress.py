@@ -37,6 +37,8 @@ progressQ.addMessage("step", 0)
 progressQ.addMessage("message", 1)          # message
 progressQ.addMessage("complete", 0)
 progressQ.addMessage("quit", 1)             # exit_code
+progressQ.addMessage("packages", 2)         # packages_done, packages_total
+progressQ.addMessage("download", 2)         # bytes_done, bytes_total
 
 
 def progress_message(message):
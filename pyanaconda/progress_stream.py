@@ -0,0 +1,242 @@
+#
+# progress_stream.py: machine-readable stream of the installation progress
+#
+# Copyright (C) 2026  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import json
+import os
+import threading
+import time
+
+from pyanaconda.progress import progressQ
+
+from pyanaconda.anaconda_loggers import get_module_logger
+log = get_module_logger(__name__)
+
+__all__ = ["ProgressStream", "start_progress_stream", "get_progress_stream"]
+
+# The minimal time between two events of the same counter in seconds.
+PROGRESS_COUNTER_INTERVAL = 1.0
+
+# The running progress stream.
+_progress_stream = None
+
+
+class ProgressStream(object):
+    """Machine-readable stream of the installation progress.
+
+    The events are written to a file as JSON objects, one per line. Every
+    event has a timestamp, a type and the current step, queue and task, so
+    a collector can read any line without knowing the previous ones.
+    """
+
+    def __init__(self, path, counter_interval=PROGRESS_COUNTER_INTERVAL):
+        """Create a new stream.
+
+        :param path: a path to the file with the stream
+        :param counter_interval: the minimal number of seconds between two
+                                 events of the package or download counter
+        """
+        self._path = path
+        self._counter_interval = counter_interval
+        self._lock = threading.Lock()
+        self._file = None
+        self._steps = 0
+        self._step = 0
+        self._queues = []
+        self._task = None
+        self._counters = {}
+
+    @property
+    def path(self):
+        """A path to the file with the stream."""
+        return self._path
+
+    def open(self):
+        """Open the stream.
+
+        :return: True if the stream is open, otherwise False
+        """
+        try:
+            os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
+            self._file = open(self._path, "a", buffering=1)
+        except OSError as e:
+            log.error("Failed to open the progress stream %s: %s", self._path, e)
+            return False
+
+        log.debug("Writing the installation progress to %s.", self._path)
+        return True
+
+    def close(self):
+        """Close the stream."""
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+    def write_event(self, event, **data):
+        """Write an event to the stream.
+
+        :param event: a type of the event
+        :param data: additional data of the event
+        """
+        with self._lock:
+            self._write_event(event, data)
+
+    def _write_event(self, event, data):
+        if not self._file:
+            return
+
+        record = {
+            "timestamp": round(time.time(), 3),
+            "event": event,
+            "step": self._step,
+            "steps": self._steps,
+            "queue": self._queues[-1] if self._queues else None,
+            "task": self._task,
+        }
+        record.update(data)
+
+        try:
+            self._file.write(json.dumps(record) + "\n")
+        except (OSError, TypeError, ValueError) as e:
+            # Never break the installation because of the stream.
+            log.error("Failed to write to the progress stream: %s", e)
+            self._file.close()
+            self._file = None
+
+    def watch_progress_queue(self, queue_factory):
+        """Write events for messages of the progress queue.
+
+        :param queue_factory: an instance of QueueFactory with progress messages
+        """
+        queue_factory.message_sent.connect(
+            lambda code, args: self._progress_message_sent(queue_factory, code, args)
+        )
+
+    def _progress_message_sent(self, q, code, args):
+        with self._lock:
+            if code == q.PROGRESS_CODE_INIT:
+                self._steps = args[0]
+                self._step = 0
+                self._write_event("init", {})
+            elif code == q.PROGRESS_CODE_STEP:
+                self._step += 1
+                self._write_event("step", {})
+            elif code == q.PROGRESS_CODE_MESSAGE:
+                self._write_event("message", {"message": args[0]})
+            elif code == q.PROGRESS_CODE_PACKAGES:
+                self._write_counter_event("packages", *args)
+            elif code == q.PROGRESS_CODE_DOWNLOAD:
+                self._write_counter_event("download", *args)
+            elif code == q.PROGRESS_CODE_COMPLETE:
+                self._write_event("complete", {})
+            elif code == q.PROGRESS_CODE_QUIT:
+                self._write_event("quit", {"exit_code": args[0]})
+
+    def _write_counter_event(self, event, done, total):
+        """Write an event of a counter.
+
+        The counters can be updated many times per second, so write
+        only one event per interval and the final one.
+        """
+        now = time.monotonic()
+        last = self._counters.get(event)
+
+        if done < total and last is not None and now - last < self._counter_interval:
+            return
+
+        self._counters[event] = now
+        self._write_event(event, {"done": done, "total": total})
+
+    def watch_task_queue(self, task_queue):
+        """Write events for signals of the task queue.
+
+        :param task_queue: an instance of TaskQueue
+        """
+        task_queue.queue_started.connect(self._queue_started)
+        task_queue.queue_completed.connect(self._queue_completed)
+        task_queue.task_started.connect(self._task_started)
+        task_queue.task_completed.connect(self._task_completed)
+
+    def _queue_started(self, task_queue):
+        with self._lock:
+            self._queues.append(task_queue.name)
+            self._write_event("queue_started", {})
+
+    def _queue_completed(self, task_queue):
+        with self._lock:
+            self._write_event("queue_completed", {"queue": task_queue.name})
+
+            if task_queue.name in self._queues:
+                self._queues.remove(task_queue.name)
+
+    def _task_started(self, task):
+        # Report the progress of DBus tasks.
+        if hasattr(task, "progress_changed"):
+            task.progress_changed.connect(self._task_progress_changed)
+
+        with self._lock:
+            self._task = task.name
+            self._write_event("task_started", {})
+
+    def _task_progress_changed(self, task, step, message):
+        self.write_event("task_progress", task=task.name, task_step=step, message=message)
+
+    def _task_completed(self, task):
+        if hasattr(task, "progress_changed"):
+            task.progress_changed.disconnect(self._task_progress_changed)
+
+        with self._lock:
+            self._write_event("task_completed", {
+                "task": task.name,
+                "elapsed_time": task.elapsed_time
+            })
+            self._task = None
+
+    def report_error(self, exception):
+        """Write an event for the given error.
+
+        :param exception: an exception that stopped the installation
+        """
+        self.write_event("error", error=type(exception).__name__, message=str(exception))
+
+
+def start_progress_stream(path):
+    """Start to write the progress of the installation to the given file.
+
+    :param path: a path to the file with the stream
+    :return: an instance of ProgressStream or None
+    """
+    global _progress_stream
+
+    stream = ProgressStream(path)
+
+    if not stream.open():
+        return None
+
+    stream.watch_progress_queue(progressQ)
+    _progress_stream = stream
+    return stream
+
+
+def get_progress_stream():
+    """Get the running progress stream.
+
+    :return: an instance of ProgressStream or None if it is not enabled
+    """
+    return _progress_stream
@@ -17,6 +17,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import queue
+from pyanaconda.core.signal import Signal
 from pyanaconda.core.util import lowerASCII, upperASCII
 
 
@@ -40,6 +41,10 @@ class QueueFactory(object):
        that takes one argument.
 
        Reusing names within the same class is not allowed.
+
+       Every message put into the queue is also emitted by the message_sent
+       signal, so other consumers can observe the messages without taking
+       them from the queue.
     """
     def __init__(self, name):
         self.name = name
@@ -48,6 +53,7 @@ class QueueFactory(object):
         self.__names = []
 
         self.q = queue.Queue()
+        self.message_sent = Signal()
 
     def _makeMethod(self, constant, methodName, argc):
         def __method(*args):
@@ -56,6 +62,7 @@ class QueueFactory(object):
                                 (methodName, argc, len(args)))
 
             self.q.put((constant, args))
+            self.message_sent.emit(constant, args)
 
         __method.__name__ = methodName
         return __method
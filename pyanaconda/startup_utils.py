@@ -20,22 +20,18 @@
 import sys
 import time
 import os
-import blivet
 
-from pyanaconda import product, ntp
+from pyanaconda import product
 from pyanaconda import anaconda_logging
-from pyanaconda import network
-from pyanaconda import safe_dbus
-from pyanaconda import kickstart
 from pyanaconda.anaconda_loggers import get_stdout_logger, get_storage_logger, \
     get_packaging_logger, get_module_logger
 from pyanaconda.core import util, constants
 from pyanaconda.core.configuration.anaconda import conf
 from pyanaconda.core.i18n import _
 from pyanaconda.flags import flags
-from pyanaconda.screensaver import inhibit_screensaver
-from pyanaconda.modules.common.structures.timezone import TimeSourceData
-from pyanaconda.modules.common.constants.services import TIMEZONE
+
+# This module is imported early during the startup, so heavy modules
+# are imported only by the functions that need them.
 
 stdout_log = get_stdout_logger()
 log = get_module_logger(__name__)
@@ -188,7 +184,10 @@ def prompt_for_ssh(options):
     :param options: Anaconda command line/boot options
     :return: True if the prompt is printed, otherwise False
     """
-    if not blivet.arch.is_s390():
+    from blivet.arch import is_s390
+    from pyanaconda import network
+
+    if not is_s390():
         return False
 
     if not conf.target.is_hardware:
@@ -280,7 +279,9 @@ def print_startup_note(options):
     if not options.images and not options.dirinstall:
         print(logs_note)
         # no fancy stuff like TTYs on a s390...
-        if not blivet.arch.is_s390():
+        from blivet.arch import is_s390
+
+        if not is_s390():
             if "TMUX" in os.environ and os.environ.get("TERM") == "screen":
                 print(shell_and_tmux_note)
             else:
@@ -300,6 +301,9 @@ def live_startup(anaconda):
 
     :param anaconda: instance of the Anaconda class
     """
+    from pyanaconda import safe_dbus
+    from pyanaconda.screensaver import inhibit_screensaver
+
     try:
         anaconda.dbus_session_connection = safe_dbus.get_new_session_connection()
     except safe_dbus.DBusCallError as e:
@@ -353,6 +357,8 @@ def run_pre_scripts(ks):
 
     :param ks: a path to a kickstart file or None
     """
+    from pyanaconda import kickstart
+
     if ks is not None:
         kickstart.preScriptPass(ks)
 
@@ -365,6 +371,8 @@ def parse_kickstart(ks, addon_paths, strict_mode=False):
     :param strict_mode: process warnings as errors if True
     :returns: kickstart parsed to a data model
     """
+    from pyanaconda import kickstart
+
     ksdata = kickstart.AnacondaKSHandler(addon_paths["ks"])
 
     if ks is not None:
@@ -379,6 +387,10 @@ def start_chronyd():
 
     Set up NTP servers and start NTP daemon if not requested otherwise.
     """
+    from pyanaconda import ntp
+    from pyanaconda.modules.common.structures.timezone import TimeSourceData
+    from pyanaconda.modules.common.constants.services import TIMEZONE
+
     if not conf.system.can_set_time_synchronization:
         log.debug("Skip the time synchronization.")
         return
@@ -18,8 +18,14 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 #
 
+import heapq
+import itertools
+import os
 import threading
+import time
+from concurrent.futures import Future
 
+from pyanaconda.core.constants import THREAD_PRIORITY_NORMAL
 from pyanaconda.anaconda_loggers import get_module_logger
 log = get_module_logger(__name__)
 
@@ -27,6 +33,11 @@ log = get_module_logger(__name__)
 _WORKER_THREAD_PREFIX = "AnaWorkerThread"
 
 
+def _get_default_max_workers():
+    """Get the default maximal number of running pooled threads."""
+    return max(2, os.cpu_count() or 1)
+
+
 class ThreadManager(object):
     """A singleton class for managing threads and processes.
 
@@ -38,12 +49,21 @@ class ThreadManager(object):
        names are unique and meaningful.  This is an okay assumption for us
        to make given that anaconda is only ever going to have a handful of
        special purpose threads.
+
+       Pooled threads share a limited number of workers. If all workers are
+       busy, a new pooled thread is registered, but it is started only after
+       one of the running pooled threads exits. The waiting threads are
+       started by their priority and then in the order they were added.
     """
-    def __init__(self):
+    def __init__(self, max_workers=None):
         self._objs = {}
         self._objs_lock = threading.RLock()
         self._errors = {}
         self._errors_lock = threading.RLock()
+        self._max_workers = max_workers or _get_default_max_workers()
+        self._workers = set()
+        self._pending = []
+        self._pending_counter = itertools.count()
 
     def __call__(self):
         return self
@@ -60,10 +80,55 @@ class ThreadManager(object):
                 raise KeyError("Cannot add thread '%s', a thread with the same name already running" % obj.name)
 
             self._objs[obj.name] = obj
-            obj.start()
+
+            if getattr(obj, "pooled", False) and len(self._workers) >= self._max_workers:
+                log.debug("Thread %s is waiting for a free worker.", obj.name)
+                entry = (obj.priority, next(self._pending_counter), obj)
+                heapq.heappush(self._pending, entry)
+            else:
+                self._start(obj)
 
         return obj.name
 
+    def _start(self, obj):
+        """Start the given object.
+
+        The object is dropped if its future was cancelled.
+        """
+        future = getattr(obj, "future", None)
+
+        if future and not future.set_running_or_notify_cancel():
+            log.debug("Thread %s was cancelled.", obj.name)
+
+            if self._objs.get(obj.name) is obj:
+                self._objs.pop(obj.name)
+
+            return
+
+        if getattr(obj, "pooled", False):
+            self._workers.add(obj.name)
+
+        obj.start()
+
+    def _start_pending(self):
+        """Start the waiting pooled threads if there are free workers."""
+        while self._pending and len(self._workers) < self._max_workers:
+            _priority, _counter, obj = heapq.heappop(self._pending)
+            self._start(obj)
+
+    def _pop_pending(self, name):
+        """Remove the waiting pooled thread with the given name.
+
+        :return: the thread or None
+        """
+        for index, (_priority, _counter, obj) in enumerate(self._pending):
+            if obj.name == name:
+                self._pending.pop(index)
+                heapq.heapify(self._pending)
+                return obj
+
+        return None
+
     def remove(self, name):
         """Removes a thread from the list of known objects.  This should only
            be called when a thread exits, or there will be no way to get a
@@ -72,6 +137,42 @@ class ThreadManager(object):
         with self._objs_lock:
             self._objs.pop(name)
 
+            # Give the free worker to a waiting thread.
+            if name in self._workers:
+                self._workers.discard(name)
+                self._start_pending()
+
+    def cancel(self, name):
+        """Cancel a pooled thread that is waiting for a free worker.
+
+        Running threads can't be cancelled.
+
+        :param name: a name of the thread
+        :return: True if the thread was cancelled, otherwise False
+        """
+        with self._objs_lock:
+            obj = self._pop_pending(name)
+
+            if not obj:
+                return False
+
+            obj.future.cancel()
+            self._objs.pop(name)
+
+        log.debug("Thread %s was cancelled.", name)
+        return True
+
+    @property
+    def max_workers(self):
+        """The maximal number of running pooled threads."""
+        return self._max_workers
+
+    @max_workers.setter
+    def max_workers(self, value):
+        with self._objs_lock:
+            self._max_workers = value
+            self._start_pending()
+
     def exists(self, name):
         """Determine if a thread or process exists with the given name."""
 
@@ -101,6 +202,14 @@ class ThreadManager(object):
 
         ret_val = True
 
+        # Don't wait for a free worker if the thread is waited for.
+        with self._objs_lock:
+            obj = self._pop_pending(name)
+
+            if obj:
+                log.debug("Thread %s is waited for, starting it now.", name)
+                self._start(obj)
+
         # we don't need a lock here,
         # because get() acquires it itself
         try:
@@ -218,6 +327,13 @@ class AnacondaThread(threading.Thread):
 
        (3) All created threads are made daemonic, which means anaconda will quit
            when the main process is killed.
+
+       (4) Report the result of the thread in a future and log the wall and
+           CPU time of the thread.
+
+       A thread created with pooled=True is started by the thread manager
+       only if there is a free worker. Pooled threads with a lower priority
+       value are started first.
     """
 
     # class-wide dictionary ensuring unique thread names
@@ -244,17 +360,45 @@ class AnacondaThread(threading.Thread):
         self._target_stopped_callback = kwargs.pop("target_stopped", None)
         self._target_failed_callback = kwargs.pop("target_failed", None)
 
+        self._pooled = kwargs.pop("pooled", False)
+        self._priority = kwargs.pop("priority", THREAD_PRIORITY_NORMAL)
+        self._future = Future()
+        self._created_time = time.monotonic()
+        self._start_time = None
+        self._start_cpu_time = None
+
         super().__init__(*args, **kwargs)
         self.daemon = True
 
+    @property
+    def pooled(self):
+        """Should the thread wait for a free worker?"""
+        return self._pooled
+
+    @property
+    def priority(self):
+        """The priority of the pooled thread."""
+        return self._priority
+
+    @property
+    def future(self):
+        """A future with the result of the thread."""
+        return self._future
+
     def _target_started(self):
-        log.info("Running Thread: %s (%s)", self.name, self.ident)
+        self._start_time = time.monotonic()
+        self._start_cpu_time = time.thread_time()
+
+        log.info("Running Thread: %s (%s) (waited %.2f s)", self.name, self.ident,
+                 self._start_time - self._created_time)
 
         if self._target_started_callback:
             self._target_started_callback()
 
     def _target_stopped(self):
-        log.info("Thread Done: %s (%s)", self.name, self.ident)
+        log.info("Thread Done: %s (%s) (wall %.2f s, CPU %.2f s)", self.name, self.ident,
+                 time.monotonic() - self._start_time,
+                 time.thread_time() - self._start_cpu_time)
 
         if self._target_stopped_callback:
             self._target_stopped_callback()
@@ -275,16 +419,24 @@ class AnacondaThread(threading.Thread):
         # http://bugs.python.org/issue1230540#msg25696
         import sys
 
+        exc_info = None
+
         try:
             self._target_started()
             threading.Thread.run(self)
 
         except:  # pylint: disable=bare-except
-            self._target_failed(*sys.exc_info())
+            exc_info = sys.exc_info()
+            self._target_failed(*exc_info)
 
         finally:
             threadMgr.remove(self.name)
             self._target_stopped()
 
+            if exc_info:
+                self._future.set_exception(exc_info[1])
+            else:
+                self._future.set_result(None)
+
 
 threadMgr = ThreadManager()
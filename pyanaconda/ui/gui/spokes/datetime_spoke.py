@@ -621,16 +621,13 @@ class DatetimeSpoke(FirstbootSpokeMixIn, NormalSpoke):
             except ntp.NTPconfigError:
                 log.warning("Failed to load NTP servers configuration")
 
-        self._ntp_servers_states = NTPServerStatusCache()
         has_active_network = self._network_module.Connected
 
         if not has_active_network:
             self._show_no_network_warning()
         else:
             self.clear_info()
-
-            for server in self._ntp_servers:
-                self._ntp_servers_states.check_status(server)
+            self._ntp_servers_states.check_statuses(self._ntp_servers)
 
         if conf.system.can_set_time_synchronization:
             ntp_working = has_active_network and util.service_running(NTP_SERVICE)
@@ -18,7 +18,6 @@ import sys
 
 from pyanaconda.anaconda_loggers import get_module_logger
 from pyanaconda.core.i18n import _, C_
-from pyanaconda.core.timer import Timer
 from pyanaconda.product import productName
 from pyanaconda.flags import flags
 from pyanaconda.core import util
@@ -29,6 +28,7 @@ from pykickstart.constants import KS_SHUTDOWN, KS_REBOOT
 from pyanaconda.ui.gui.hubs.summary import SummaryHub
 from pyanaconda.ui.gui.spokes import StandaloneSpoke
 from pyanaconda.ui.gui.utils import gtk_call_once
+from pyanaconda.ui.lib.progress import ProgressChannel, get_progress_rate_text
 
 log = get_module_logger(__name__)
 
@@ -50,9 +50,7 @@ class ProgressSpoke(StandaloneSpoke):
 
     def __init__(self, data, storage, payload):
         super().__init__(data, storage, payload)
-        self._totalSteps = 0
-        self._currentStep = 0
-        self._update_progress_timer = Timer()
+        self._progress_channel = ProgressChannel()
 
         self._progressBar = self.builder.get_object("progressBar")
         self._progressLabel = self.builder.get_object("progressLabel")
@@ -68,48 +66,32 @@ class ProgressSpoke(StandaloneSpoke):
         """There is nothing to apply."""
         pass
 
-    def _update_progress(self, callback=None):
-        from pyanaconda.progress import progressQ
-        import queue
-
-        q = progressQ.q
-
-        # Grab all messages may have appeared since last time this method ran.
-        while True:
-            # Attempt to get a message out of the queue for how we should update
-            # the progress bar.  If there's no message, don't error out.
-            try:
-                (code, args) = q.get(False)
-            except queue.Empty:
-                break
-
-            if code == progressQ.PROGRESS_CODE_INIT:
-                self._init_progress_bar(args[0])
-            elif code == progressQ.PROGRESS_CODE_STEP:
-                self._step_progress_bar()
-            elif code == progressQ.PROGRESS_CODE_MESSAGE:
-                self._update_progress_message(args[0])
-            elif code == progressQ.PROGRESS_CODE_COMPLETE:
-                q.task_done()
-
-                # we are done, stop the progress indication
-                gtk_call_once(self._progressBar.set_fraction, 1.0)
-                gtk_call_once(self._progressLabel.set_text, _("Complete!"))
-                gtk_call_once(self._spinner.stop)
-                gtk_call_once(self._spinner.hide)
-
-                if callback:
-                    callback()
-
-                # There shouldn't be any more progress bar updates, so return False
-                # to indicate this method should be removed from the idle loop.
-                return False
-            elif code == progressQ.PROGRESS_CODE_QUIT:
-                sys.exit(args[0])
-
-            q.task_done()
-
-        return True
+    def _update_progress(self, state):
+        """Update the progress indication.
+
+        :param state: an instance of ProgressState
+        """
+        if state.exit_code is not None:
+            sys.exit(state.exit_code)
+
+        if state.complete:
+            # we are done, stop the progress indication
+            self._progressBar.set_fraction(1.0)
+            self._progressLabel.set_text(_("Complete!"))
+            self._spinner.stop()
+            self._spinner.hide()
+            self._installation_done()
+            return
+
+        self._progressBar.set_fraction(state.fraction)
+
+        if state.steps and state.message:
+            rate = get_progress_rate_text(state)
+
+            if rate:
+                self._progressLabel.set_text("{}\n{}".format(state.message, rate))
+            else:
+                self._progressLabel.set_text(state.message)
 
     def _installation_done(self):
         log.debug("The installation has finished.")
@@ -171,11 +153,7 @@ class ProgressSpoke(StandaloneSpoke):
         from pyanaconda.threading import threadMgr, AnacondaThread
         super().refresh()
 
-        self._update_progress_timer.timeout_msec(
-            250,
-            self._update_progress,
-            self._installation_done
-        )
+        self._progress_channel.watch(self._update_progress, gtk_call_once)
 
         threadMgr.add(AnacondaThread(
             name=THREAD_INSTALL,
@@ -184,22 +162,3 @@ class ProgressSpoke(StandaloneSpoke):
         )
 
         log.debug("The installation has started.")
-
-    def _init_progress_bar(self, steps):
-        self._totalSteps = steps
-        self._currentStep = 0
-
-        gtk_call_once(self._progressBar.set_fraction, 0.0)
-
-    def _step_progress_bar(self):
-        if not self._totalSteps:
-            return
-
-        self._currentStep += 1
-        gtk_call_once(self._progressBar.set_fraction, self._currentStep/self._totalSteps)
-
-    def _update_progress_message(self, message):
-        if not self._totalSteps:
-            return
-
-        gtk_call_once(self._progressLabel.set_text, message)
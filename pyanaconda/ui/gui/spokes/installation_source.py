@@ -35,7 +35,7 @@ from pyanaconda.flags import flags
 from pyanaconda.core.i18n import _, N_, CN_
 from pyanaconda.modules.common.structures.payload import RepoConfigurationData
 from pyanaconda.payload.image import find_optical_install_media, find_potential_hdiso_sources, \
-    get_hdiso_source_info, get_hdiso_source_description
+    get_hdiso_sources_info, get_hdiso_source_description
 from pyanaconda.core.payload import ProxyString, ProxyStringError, parse_nfs_url, create_nfs_url
 from pyanaconda.core.util import cmp_obj_attrs, id_generator
 from pyanaconda.ui.communication import hubQ
@@ -891,8 +891,10 @@ class SourceSpoke(NormalSpoke, GUISpokeInputCheckHandler, SourceSwitchHandler):
             device_spec = source_proxy.Partition
             active_name = self._get_device_name(device_spec)
 
-        for device_name in find_potential_hdiso_sources():
-            device_info = get_hdiso_source_info(self._device_tree, device_name)
+        device_names = find_potential_hdiso_sources()
+        devices_info = get_hdiso_sources_info(self._device_tree, device_names)
+
+        for device_name, device_info in zip(device_names, devices_info):
 
             # With the label in here, the combo box can appear really long thus pushing
             # the "pick an image" and the "verify" buttons off the screen.
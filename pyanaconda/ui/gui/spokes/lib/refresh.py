@@ -84,7 +84,9 @@ class RefreshDialog(GUIObject):
         # And now to fire up the storage reinitialization.
         threadMgr.add(AnacondaThread(name=constants.THREAD_STORAGE,
                                      target=reset_storage,
-                                     kwargs={"scan_all": True}))
+                                     kwargs={"scan_all": True},
+                                     pooled=True,
+                                     priority=constants.THREAD_PRIORITY_HIGH))
 
         self._elapsed = 0
 
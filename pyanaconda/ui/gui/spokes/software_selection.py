@@ -214,7 +214,9 @@ class SoftwareSelectionSpoke(NormalSpoke):
         hubQ.send_not_ready(self.__class__.__name__)
         hubQ.send_not_ready("SourceSpoke")
         threadMgr.add(AnacondaThread(name=constants.THREAD_CHECK_SOFTWARE,
-                                     target=self.checkSoftwareSelection))
+                                     target=self.checkSoftwareSelection,
+                                     pooled=True,
+                                     priority=constants.THREAD_PRIORITY_HIGH))
 
     def apply(self):
         self._apply()
@@ -0,0 +1,262 @@
+#
+# Copyright (C) 2026  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import copy
+import queue
+import threading
+import time
+from datetime import timedelta
+
+from blivet.size import Size
+
+from pyanaconda.core.constants import THREAD_PROGRESS_CHANNEL
+from pyanaconda.core.i18n import _
+from pyanaconda.progress import progressQ
+
+from pyanaconda.anaconda_loggers import get_module_logger
+log = get_module_logger(__name__)
+
+__all__ = ["ProgressRate", "ProgressState", "ProgressChannel", "get_progress_rate_text"]
+
+# The minimal time between two updates of the user interface in seconds.
+PROGRESS_FRAME_INTERVAL = 0.1
+
+
+class ProgressRate(object):
+    """Rate and remaining time of a progress counter."""
+
+    def __init__(self, smoothing=0.3):
+        """Create a new counter.
+
+        :param smoothing: a weight of the latest rate in the moving average
+        """
+        self._smoothing = smoothing
+        self._last_update = None
+        self.done = 0
+        self.total = 0
+        self.rate = 0.0
+
+    def update(self, done, total, timestamp=None):
+        """Update the counter.
+
+        :param done: a number of processed units
+        :param total: a total number of units
+        :param timestamp: a monotonic time of the update or None for now
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+
+        if self._last_update is not None:
+            last_timestamp, last_done = self._last_update
+            elapsed = timestamp - last_timestamp
+
+            if elapsed > 0 and done >= last_done:
+                current_rate = (done - last_done) / elapsed
+
+                if self.rate:
+                    current_rate = self._smoothing * current_rate \
+                        + (1 - self._smoothing) * self.rate
+
+                self.rate = current_rate
+
+        self._last_update = (timestamp, done)
+        self.done = done
+        self.total = total
+
+    @property
+    def active(self):
+        """Is the counter running?"""
+        return self._last_update is not None and self.done < self.total
+
+    @property
+    def eta(self):
+        """Estimated remaining time in seconds or None."""
+        if not self.active or self.rate <= 0:
+            return None
+
+        return (self.total - self.done) / self.rate
+
+
+class ProgressState(object):
+    """Coalesced state of the installation progress."""
+
+    def __init__(self):
+        self.steps = 0
+        self.step = 0
+        self.message = ""
+        # The status messages received since the last copy of the state.
+        self.messages = []
+        self.complete = False
+        self.exit_code = None
+        self.packages = ProgressRate()
+        self.download = ProgressRate()
+
+    @property
+    def fraction(self):
+        """Fraction of the finished steps."""
+        if self.complete:
+            return 1.0
+
+        if not self.steps:
+            return 0.0
+
+        return min(self.step / self.steps, 1.0)
+
+    @property
+    def finished(self):
+        """Is the installation finished or quitting?"""
+        return self.complete or self.exit_code is not None
+
+
+def get_progress_rate_text(state):
+    """Get a text with the rate of the running counter.
+
+    :param state: an instance of ProgressState
+    :return: a translated string or an empty string
+    """
+    if state.packages.active and state.packages.eta is not None:
+        return _("%(rate).1f packages/s, %(eta)s remaining") % {
+            "rate": state.packages.rate,
+            "eta": timedelta(seconds=int(state.packages.eta))
+        }
+
+    if state.download.active and state.download.eta is not None:
+        return _("%(rate)s/s, %(eta)s remaining") % {
+            "rate": Size(int(state.download.rate)),
+            "eta": timedelta(seconds=int(state.download.eta))
+        }
+
+    return ""
+
+
+class ProgressChannel(object):
+    """Reader of the progress queue that coalesces messages.
+
+    The messages are read from the progress queue as they come and folded
+    into a ProgressState, so a burst of messages results in one update of
+    the user interface instead of one update per message.
+    """
+
+    def __init__(self, queue_factory=progressQ):
+        """Create a new channel.
+
+        :param queue_factory: an instance of QueueFactory with progress messages
+        """
+        self._queue_factory = queue_factory
+        self._state = ProgressState()
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        """A copy of the current progress state.
+
+        The copy takes the status messages received since the last copy,
+        so every message is handed out only once.
+        """
+        with self._lock:
+            state = copy.copy(self._state)
+            state.packages = copy.copy(self._state.packages)
+            state.download = copy.copy(self._state.download)
+            self._state.messages = []
+            return state
+
+    def read(self, timeout=None):
+        """Read all available messages.
+
+        Block until at least one message is available.
+
+        :param timeout: a number of seconds to wait or None to wait forever
+        :return: True if a message was read, otherwise False
+        """
+        q = self._queue_factory.q
+
+        try:
+            messages = [q.get(timeout=timeout)]
+        except queue.Empty:
+            return False
+
+        while True:
+            try:
+                messages.append(q.get(block=False))
+            except queue.Empty:
+                break
+
+        with self._lock:
+            for code, args in messages:
+                self._process_message(code, args)
+                q.task_done()
+
+        return True
+
+    def _process_message(self, code, args):
+        """Fold the message into the progress state."""
+        q = self._queue_factory
+        state = self._state
+
+        if code == q.PROGRESS_CODE_INIT:
+            state.steps = args[0]
+            state.step = 0
+        elif code == q.PROGRESS_CODE_STEP:
+            state.step += 1
+        elif code == q.PROGRESS_CODE_MESSAGE:
+            state.message = args[0]
+            state.messages.append(args[0])
+        elif code == q.PROGRESS_CODE_PACKAGES:
+            state.packages.update(*args)
+        elif code == q.PROGRESS_CODE_DOWNLOAD:
+            state.download.update(*args)
+        elif code == q.PROGRESS_CODE_COMPLETE:
+            state.complete = True
+        elif code == q.PROGRESS_CODE_QUIT:
+            state.exit_code = args[0]
+
+    def watch(self, callback, schedule, interval=PROGRESS_FRAME_INTERVAL):
+        """Watch the progress in a separate thread.
+
+        The callback is scheduled with a copy of the progress state every time
+        new messages arrive, but not more often than once per interval. The
+        thread stops when the installation is finished.
+
+        The thread is not managed by the thread manager, because the
+        installation waits for all managed threads to finish.
+
+        :param callback: a function that accepts a progress state
+        :param schedule: a function that schedules the callback with arguments
+        :param interval: the minimal number of seconds between two callbacks
+        :return: an instance of the watching thread
+        """
+        thread = threading.Thread(
+            name=THREAD_PROGRESS_CHANNEL,
+            target=self._watch,
+            args=(callback, schedule, interval),
+            daemon=True
+        )
+        thread.start()
+        return thread
+
+    def _watch(self, callback, schedule, interval):
+        while True:
+            self.read()
+            state = self.state
+            schedule(callback, state)
+
+            if state.finished:
+                log.debug("The installation progress is finished.")
+                return
+
+            # Let the messages accumulate until the next frame.
+            time.sleep(interval)
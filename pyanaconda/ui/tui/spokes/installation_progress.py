@@ -27,6 +27,7 @@ from pyanaconda.core.configuration.anaconda import conf
 
 from pyanaconda.ui.tui.spokes import StandaloneTUISpoke
 from pyanaconda.ui.tui.hubs.summary import SummaryHub
+from pyanaconda.ui.lib.progress import ProgressChannel
 
 from simpleline import App
 from simpleline.render.prompt import Prompt
@@ -58,60 +59,59 @@ class ProgressSpoke(StandaloneTUISpoke):
 
     def _update_progress(self):
         """Handle progress updates from install thread."""
+        channel = ProgressChannel()
+        state = channel.state
+
+        while not state.finished:
+            # Wait for new messages, but process the events of the loop at
+            # least once a second, so we can react to async events (like a
+            # thread throwing an exception).
+            try:
+                if not channel.read(timeout=1):
+                    continue
+            finally:
+                loop = App.get_event_loop()
+                loop.process_signals()
+
+            state = self._print_progress(state, channel.state)
+
+        if state.exit_code is not None:
+            sys.exit(state.exit_code)
+
+        if self._stepped:
+            print('')
 
-        from pyanaconda.progress import progressQ
-        import queue
-
-        q = progressQ.q
-
-        # Grab all messages may have appeared since last time this method ran.
-        while True:
-            # Attempt to get a message out of the queue for how we should update
-            # the progress bar.  If there's no message, don't error out.
-            # Also flush the communication Queue at least once a second and
-            # process it's events so we can react to async evens (like a thread
-            # throwing an exception)
-            while True:
-                try:
-                    (code, args) = q.get(timeout=1)
-                    break
-                except queue.Empty:
-                    pass
-                finally:
-                    loop = App.get_event_loop()
-                    loop.process_signals()
-
-            if code == progressQ.PROGRESS_CODE_INIT:
-                # Text mode doesn't have a finite progress bar
-                pass
-            elif code == progressQ.PROGRESS_CODE_STEP:
-                # Instead of updating a progress bar, we just print a pip
-                # but print it without a new line.
-                sys.stdout.write('.')
-                sys.stdout.flush()
-                # Use _stepped as an indication to if we need a newline before
-                # the next message
-                self._stepped = True
-            elif code == progressQ.PROGRESS_CODE_MESSAGE:
-                # This should already be translated
-                if self._stepped:
-                    # Get a new line in case we've done a step before
-                    self._stepped = False
-                    print('')
-                print(args[0])
-            elif code == progressQ.PROGRESS_CODE_COMPLETE:
-                # There shouldn't be any more progress updates, so return
-                q.task_done()
-
-                if self._stepped:
-                    print('')
-                return True
-            elif code == progressQ.PROGRESS_CODE_QUIT:
-                sys.exit(args[0])
-
-            q.task_done()
         return True
 
+    def _print_progress(self, old_state, new_state):
+        """Print the changes of the progress state.
+
+        :param old_state: the last printed state
+        :param new_state: the current state
+        :return: the current state
+        """
+        if new_state.step > old_state.step:
+            # Instead of updating a progress bar, we just print pips
+            # but print them without a new line.
+            sys.stdout.write('.' * (new_state.step - old_state.step))
+            sys.stdout.flush()
+            # Use _stepped as an indication to if we need a newline before
+            # the next message
+            self._stepped = True
+
+        if new_state.messages:
+            # This should already be translated
+            if self._stepped:
+                # Get a new line in case we've done a step before
+                self._stepped = False
+                print('')
+
+            # Print all new messages in the order they were sent.
+            for message in new_state.messages:
+                print(message)
+
+        return new_state
+
     def show_all(self):
         super().show_all()
         from pyanaconda.installation import run_installation
@@ -31,7 +31,7 @@ from pyanaconda.payload import utils as payload_utils
 from pyanaconda.payload.manager import payloadMgr, PayloadState
 from pyanaconda.core.i18n import N_, _, C_
 from pyanaconda.payload.image import find_potential_hdiso_sources, \
-    get_hdiso_source_info, get_hdiso_source_description
+    get_hdiso_sources_info, get_hdiso_source_description
 
 from pyanaconda.core.constants import THREAD_SOURCE_WATCHER, THREAD_PAYLOAD, PAYLOAD_TYPE_DNF, \
     SOURCE_TYPE_URL, SOURCE_TYPE_NFS
@@ -388,8 +388,10 @@ class SelectDeviceSpoke(NormalTUISpoke):
     def _get_mountable_devices(self):
         disks = []
 
-        for device_name in find_potential_hdiso_sources():
-            device_info = get_hdiso_source_info(self._device_tree, device_name)
+        device_names = find_potential_hdiso_sources()
+        devices_info = get_hdiso_sources_info(self._device_tree, device_names)
+
+        for device_name, device_info in zip(device_names, devices_info):
             device_desc = get_hdiso_source_description(device_info)
             disks.append([device_name, device_desc])
 
@@ -26,7 +26,7 @@ from pyanaconda.core.i18n import N_, _, C_
 from pyanaconda.core.configuration.anaconda import conf
 
 from pyanaconda.core.constants import THREAD_PAYLOAD, THREAD_CHECK_SOFTWARE, \
-    THREAD_SOFTWARE_WATCHER, PAYLOAD_TYPE_DNF
+    THREAD_SOFTWARE_WATCHER, PAYLOAD_TYPE_DNF, THREAD_PRIORITY_HIGH
 
 from simpleline.render.containers import ListColumnContainer
 from simpleline.render.screen import InputState
@@ -331,7 +331,9 @@ class SoftwareSpoke(NormalTUISpoke):
         # Check the software selection
         if changed or self._kickstarted:
             threadMgr.add(AnacondaThread(name=THREAD_CHECK_SOFTWARE,
-                                         target=self.check_software_selection))
+                                         target=self.check_software_selection,
+                                         pooled=True,
+                                         priority=THREAD_PRIORITY_HIGH))
 
     def check_software_selection(self):
         """ Depsolving """
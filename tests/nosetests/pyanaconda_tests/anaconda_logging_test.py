@@ -0,0 +1,132 @@
+#
+# Copyright (C) 2026  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import io
+import logging
+import threading
+import unittest
+
+from pyanaconda.anaconda_logging import AnacondaLogWriter, AnacondaQueueHandler, \
+    AnacondaStreamHandler, setHandlersLevel
+
+
+class AnacondaLogWriterTestCase(unittest.TestCase):
+    """Test the asynchronous logging."""
+
+    def setUp(self):
+        self.writer = AnacondaLogWriter()
+        self.stream = io.StringIO()
+
+        self.target = AnacondaStreamHandler(self.stream)
+        self.target.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+        self.target.setLevel(logging.INFO)
+
+        self.handler = AnacondaQueueHandler(self.writer)
+        self.handler.targets.append(self.target)
+
+        self.logger = logging.getLogger("anaconda.test.async")
+        self.logger.propagate = False
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.addHandler(self.handler)
+
+    def tearDown(self):
+        self.writer.stop(timeout=10)
+        self.logger.removeHandler(self.handler)
+
+    def synchronous_test(self):
+        """Test the logging without the writer thread."""
+        self.assertFalse(self.writer.is_running)
+        self.logger.info("Message %s", 1)
+        self.assertEqual(self.stream.getvalue(), "INFO Message 1\n")
+
+    def asynchronous_test(self):
+        """Test the logging with the writer thread."""
+        self.writer.start()
+        self.assertTrue(self.writer.is_running)
+
+        for i in range(1000):
+            self.logger.info("Message %s", i)
+
+        self.assertTrue(self.writer.flush(timeout=10))
+        lines = self.stream.getvalue().splitlines()
+        self.assertEqual(lines, ["INFO Message %s" % i for i in range(1000)])
+
+    def level_test(self):
+        """Test the levels of the target handlers."""
+        self.writer.start()
+        self.logger.debug("Debug")
+        self.logger.warning("Warning")
+
+        self.assertTrue(self.writer.flush(timeout=10))
+        self.assertEqual(self.stream.getvalue(), "WARNING Warning\n")
+
+        self.target.autoSetLevel = True
+        setHandlersLevel(self.logger, logging.DEBUG)
+        self.assertEqual(self.target.level, logging.DEBUG)
+
+    def arguments_test(self):
+        """Test that the arguments are formatted on the thread of the caller."""
+        self.writer.start()
+
+        data = ["a"]
+        self.logger.info("Data: %s", data)
+        data.append("b")
+
+        self.assertTrue(self.writer.flush(timeout=10))
+        self.assertEqual(self.stream.getvalue(), "INFO Data: ['a']\n")
+
+    def exception_test(self):
+        """Test the logging of exceptions."""
+        self.writer.start()
+
+        try:
+            raise ValueError("Invalid value!")
+        except ValueError:
+            self.logger.exception("Failed")
+
+        self.assertTrue(self.writer.flush(timeout=10))
+        output = self.stream.getvalue()
+        self.assertTrue(output.startswith("ERROR Failed\nTraceback"))
+        self.assertIn("ValueError: Invalid value!", output)
+        self.assertEqual(output.count("Traceback"), 1)
+
+    def stop_test(self):
+        """Test that the queue is flushed on stop."""
+        self.writer.start()
+
+        for i in range(100):
+            self.logger.info("Message %s", i)
+
+        self.writer.stop()
+        self.assertFalse(self.writer.is_running)
+        self.assertEqual(len(self.stream.getvalue().splitlines()), 100)
+
+        # The records are written synchronously now.
+        self.logger.info("Last message")
+        self.assertTrue(self.stream.getvalue().endswith("INFO Last message\n"))
+
+    def blocked_handler_test(self):
+        """Test the flush with a blocked target handler."""
+        unblocked = threading.Event()
+        self.target.flush = unblocked.wait
+        self.writer.start()
+
+        self.logger.info("Message")
+        self.assertFalse(self.writer.flush(timeout=0.1))
+
+        unblocked.set()
+        self.assertTrue(self.writer.flush(timeout=10))
@@ -0,0 +1,169 @@
+#
+# Copyright (C) 2026  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from pyanaconda.core.constants import GEOLOC_PROVIDER_FEDORA_GEOIP, GEOLOC_PROVIDER_HOSTIP
+from pyanaconda.geoloc import GeolocationBackend, HedgedGeolocationProvider, \
+    LocationResult, Geolocation
+
+
+class FakeProvider(GeolocationBackend):
+    """A fake geolocation provider."""
+
+    def __init__(self, name, result=None, event=None):
+        super().__init__()
+        self._name = name
+        self._lookup_result = result
+        self._event = event
+
+    @property
+    def name(self):
+        return self._name
+
+    def _refresh(self):
+        if self._event:
+            self._event.wait(timeout=10)
+
+        if self._lookup_result:
+            self._set_result(self._lookup_result)
+
+
+def _run_thread(thread):
+    """Run the thread synchronously in a new thread."""
+    thread = threading.Thread(target=thread._target, args=thread._args)
+    thread.start()
+
+
+class GeolocationTestCase(unittest.TestCase):
+    """Test the geolocation module."""
+
+    def setUp(self):
+        self._cache_dir = tempfile.TemporaryDirectory()
+        self._cache_file = os.path.join(self._cache_dir.name, "geoloc.json")
+
+        patcher = patch("pyanaconda.geoloc.constants.GEOLOC_CACHE_FILE", self._cache_file)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = patch("pyanaconda.geoloc.threadMgr")
+        thread_manager = patcher.start()
+        thread_manager.add.side_effect = _run_thread
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self._cache_dir.cleanup()
+
+    def provider_option_test(self):
+        """Test the parsing of the geoloc option."""
+        with patch.object(Geolocation, "_check_if_geolocation_should_be_used", return_value=True):
+            geolocation = Geolocation()
+
+        parse = geolocation._get_provider_ids_from_option
+
+        self.assertEqual(parse("provider_hostip"), [GEOLOC_PROVIDER_HOSTIP])
+        self.assertEqual(parse("invalid"), [])
+        self.assertEqual(
+            parse("provider_fedora_geoip, provider_hostip,invalid,provider_hostip"),
+            [GEOLOC_PROVIDER_FEDORA_GEOIP, GEOLOC_PROVIDER_HOSTIP]
+        )
+
+    def hedged_result_test(self):
+        """Test that the first valid result is used."""
+        event = threading.Event()
+        slow = FakeProvider("slow", LocationResult(territory_code="US"), event)
+        invalid = FakeProvider("invalid", LocationResult())
+        fast = FakeProvider("fast", LocationResult(territory_code="CZ", timezone="Europe/Prague"))
+
+        hedged = HedgedGeolocationProvider([slow, invalid, fast])
+        hedged.refresh()
+
+        self.assertEqual(hedged.result.territory_code, "CZ")
+        self.assertEqual(hedged.result.timezone, "Europe/Prague")
+        self.assertTrue(slow.cancelled)
+        self.assertTrue(invalid.cancelled)
+        self.assertFalse(fast.cancelled)
+
+        # The result of the cancelled lookup is ignored.
+        event.set()
+        self.assertEqual(hedged.result.territory_code, "CZ")
+
+    def hedged_saved_result_test(self):
+        """Test that only the hedged result is saved."""
+        hedged = HedgedGeolocationProvider([
+            FakeProvider("first", LocationResult(territory_code="CZ")),
+            FakeProvider("second", LocationResult(territory_code="US")),
+        ])
+
+        with patch.object(GeolocationBackend, "_save_result", autospec=True) as save_result:
+            hedged.refresh()
+
+        save_result.assert_called_once_with(hedged)
+
+        hedged.refresh()
+        self.assertEqual(os.listdir(self._cache_dir.name), ["geoloc.json"])
+
+        provider = FakeProvider("provider")
+        self.assertTrue(provider.load_cached_result())
+        self.assertEqual(provider.result.territory_code, hedged.result.territory_code)
+
+    def save_result_error_test(self):
+        """Test that the errors of saving the result are not raised."""
+        provider = FakeProvider("provider", LocationResult(territory_code="CZ"))
+
+        with patch("pyanaconda.geoloc.os.replace", side_effect=OSError("Fake!")), \
+                patch("pyanaconda.geoloc.os.unlink", side_effect=OSError("Fake!")) as unlink:
+            provider.refresh()
+
+        unlink.assert_called_once()
+        self.assertFalse(os.path.exists(self._cache_file))
+
+    def hedged_no_result_test(self):
+        """Test the hedged lookup without valid results."""
+        hedged = HedgedGeolocationProvider([
+            FakeProvider("first", LocationResult()),
+            FakeProvider("second", None)
+        ])
+        hedged.refresh()
+
+        self.assertFalse(hedged.result.is_valid)
+        self.assertFalse(os.path.exists(self._cache_file))
+
+    def cached_result_test(self):
+        """Test the cached result."""
+        provider = FakeProvider("provider", LocationResult(territory_code="CZ", city="Brno"))
+        self.assertFalse(provider.load_cached_result())
+
+        provider.refresh()
+        self.assertTrue(os.path.exists(self._cache_file))
+
+        provider = FakeProvider("provider")
+        self.assertTrue(provider.load_cached_result())
+        self.assertEqual(provider.result.territory_code, "CZ")
+        self.assertIsNone(provider.result.city)
+
+    def invalid_cached_result_test(self):
+        """Test an invalid cached result."""
+        with open(self._cache_file, "w") as f:
+            f.write("invalid")
+
+        provider = FakeProvider("provider")
+        self.assertFalse(provider.load_cached_result())
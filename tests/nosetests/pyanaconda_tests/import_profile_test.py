@@ -0,0 +1,202 @@
+#
+# Copyright (C) 2026  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import ast
+import importlib.abc
+import importlib.util
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from pyanaconda.core.import_profile import ImportProfiler
+
+# Modules that shouldn't be imported before the display is set up.
+# The kickstart and network modules are needed to parse the kickstart
+# file and to initialize the network before the display, so they are
+# not listed here.
+STARTUP_LAZY_MODULES = [
+    "pyanaconda.ntp",
+    "pyanaconda.safe_dbus",
+    "pyanaconda.screensaver",
+    "gi.repository.Gtk",
+]
+
+
+class ImportProfilerTestCase(unittest.TestCase):
+    """Test the import profiler."""
+
+    @patch.dict("sys.modules")
+    def profile_test(self):
+        """Test the profile of imported modules."""
+        with tempfile.TemporaryDirectory() as d:
+            with open(os.path.join(d, "anaconda_profiled_a.py"), "w") as f:
+                f.write("import anaconda_profiled_b\n")
+
+            with open(os.path.join(d, "anaconda_profiled_b.py"), "w") as f:
+                f.write("B = 1\n")
+
+            profiler = ImportProfiler()
+            sys.path.insert(0, d)
+
+            try:
+                profiler.start()
+                import anaconda_profiled_a  # pylint: disable=import-error,unused-import
+            finally:
+                profiler.stop()
+                sys.path.remove(d)
+
+        self.assertNotIn(profiler, sys.meta_path)
+
+        # The loaders are restored.
+        loader = sys.modules["anaconda_profiled_a"].__spec__.loader
+        self.assertNotIn("exec_module", vars(loader))
+
+        times = profiler.times
+        self.assertIn("anaconda_profiled_a", times)
+        self.assertIn("anaconda_profiled_b", times)
+
+        self_time, cumulative = times["anaconda_profiled_a"]
+        self.assertLessEqual(self_time, cumulative)
+        self.assertGreaterEqual(cumulative, times["anaconda_profiled_b"][1])
+
+        report = profiler.get_report(limit=1)
+        self.assertEqual(len(report), 2)
+        self.assertTrue(report[0].startswith("Imported 2 modules in"))
+        self.assertTrue(report[1].endswith("anaconda_profiled_a"))
+
+
+    @patch.dict("sys.modules")
+    def shared_loader_test(self):
+        """Test the profile of modules with a shared loader."""
+        loader = _SharedLoader()
+        finder = _SharedFinder(loader)
+        profiler = ImportProfiler()
+        sys.meta_path.append(finder)
+
+        try:
+            profiler.start()
+            import anaconda_shared_a  # pylint: disable=import-error,unused-import
+            import anaconda_shared_b  # pylint: disable=import-error,unused-import
+        finally:
+            profiler.stop()
+            sys.meta_path.remove(finder)
+
+        self.assertEqual(loader.executed, ["anaconda_shared_a", "anaconda_shared_b"])
+        self.assertIn("anaconda_shared_a", profiler.times)
+        self.assertIn("anaconda_shared_b", profiler.times)
+        self.assertNotIn("exec_module", vars(loader))
+
+
+class _SharedLoader(importlib.abc.Loader):
+    """Loader shared by multiple modules."""
+
+    def __init__(self):
+        self.executed = []
+
+    def create_module(self, spec):
+        return None
+
+    def exec_module(self, module):
+        self.executed.append(module.__name__)
+
+
+class _SharedFinder(importlib.abc.MetaPathFinder):
+    """Finder of modules with a shared loader."""
+
+    def __init__(self, loader):
+        self._loader = loader
+
+    def find_spec(self, fullname, path, target=None):
+        if not fullname.startswith("anaconda_shared_"):
+            return None
+
+        return importlib.util.spec_from_loader(fullname, self._loader)
+
+
+def _get_startup_imports(path):
+    """Get modules imported by anaconda.py before the display is set up.
+
+    :param path: a path to anaconda.py
+    :return: a list of module names and names imported from modules
+    """
+    with open(path, "r") as f:
+        tree = ast.parse(f.read())
+
+    names = []
+
+    for node in tree.body:
+        if not isinstance(node, ast.If):
+            continue
+
+        for statement in node.body:
+            if "setup_display" in ast.dump(statement):
+                return names
+
+            for child in ast.walk(statement):
+                if isinstance(child, ast.Import):
+                    names.extend(alias.name for alias in child.names)
+                elif isinstance(child, ast.ImportFrom):
+                    names.append(child.module)
+                    names.extend(child.module + "." + alias.name for alias in child.names)
+
+    return names
+
+
+class StartupImportsTestCase(unittest.TestCase):
+    """Test the imports of the startup."""
+
+    def _check_imports(self, modules):
+        """Import the modules in a clean interpreter and check the result."""
+        code = "\n".join([
+            "import importlib",
+            "import sys",
+            "for name in {}:".format(modules),
+            "    try:",
+            "        importlib.import_module(name)",
+            "    except ModuleNotFoundError as e:",
+            "        # The name is not a module or the module is optional.",
+            "        if e.name != name:",
+            "            raise",
+            "print('\\n'.join(sys.modules))"
+        ])
+
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(sys.path)
+
+        output = subprocess.check_output([sys.executable, "-c", code], env=env)
+        imported = output.decode().split()
+
+        for name in STARTUP_LAZY_MODULES:
+            self.assertNotIn(name, imported, "The startup shouldn't import {}.".format(name))
+
+    def anaconda_imports_test(self):
+        """Test the imports of anaconda.py before the display is set up."""
+        # top_srcdir should have been set by nosetests.sh. If it wasn't, the KeyError
+        # will fail the test.
+        path = os.path.join(os.environ["top_srcdir"], "anaconda.py")
+        modules = _get_startup_imports(path)
+
+        self.assertIn("pyanaconda.startup_utils", modules)
+        self.assertIn("pyanaconda.display", modules)
+        self._check_imports(modules)
+
+    def startup_utils_imports_test(self):
+        """Test the imports of the startup utilities."""
+        self._check_imports(["pyanaconda.startup_utils"])
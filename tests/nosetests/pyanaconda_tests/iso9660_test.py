@@ -0,0 +1,195 @@
+#
+# Copyright (C) 2026  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import os
+import struct
+import tempfile
+import unittest
+
+from pyanaconda.payload.iso9660 import ISO9660Image, ISO9660Error
+
+SECTOR_SIZE = 2048
+
+DISCINFO = b"1587584254.021611\nFedora 32\nx86_64\n"
+REPOMD = b"<repomd/>\n"
+
+# A tree of the image with the short and the long names.
+TREE = [
+    ("DISCINFO.;1", ".discinfo", DISCINFO),
+    ("REPODATA", "repodata", [
+        ("REPOMD.XML;1", "repomd.xml", REPOMD),
+    ]),
+]
+
+
+class ImageBuilder(object):
+    """Builder of small ISO 9660 images."""
+
+    def __init__(self, rock_ridge=False, joliet=False):
+        self._rock_ridge = rock_ridge
+        self._joliet = joliet
+        self._sectors = {}
+        self._next_sector = 19
+
+    def _allocate(self, data):
+        sector = self._next_sector
+        self._sectors[sector] = data
+        self._next_sector += max(1, -(-len(data) // SECTOR_SIZE))
+        return sector
+
+    def _record(self, extent, size, name, is_dir=False, system_use=b""):
+        padding = b"\x00" if len(name) % 2 == 0 else b""
+        length = 33 + len(name) + len(padding) + len(system_use)
+
+        if length % 2:
+            system_use += b"\x00"
+            length += 1
+
+        header = struct.pack("<BBI4xI4x7xBxx4xB", length, 0, extent, size,
+                             0x02 if is_dir else 0x00, len(name))
+        return header + name + padding + system_use
+
+    def _name(self, short_name, long_name, joliet):
+        if joliet:
+            return long_name.encode("utf-16-be"), b""
+
+        if self._rock_ridge:
+            name = long_name.encode()
+            return short_name.encode(), b"NM" + bytes([5 + len(name), 1, 0]) + name
+
+        return short_name.encode(), b""
+
+    def _write_directory(self, tree, joliet, root=False):
+        records = []
+
+        for short_name, long_name, content in tree:
+            name, system_use = self._name(short_name, long_name, joliet)
+
+            if isinstance(content, list):
+                extent = self._write_directory(content, joliet)
+                records.append(self._record(extent, SECTOR_SIZE, name, True, system_use))
+            else:
+                extent = self._allocate(content)
+                records.append(self._record(extent, len(content), name, False, system_use))
+
+        extent = self._next_sector
+        system_use = b"SP\x07\x01\xbe\xef\x00" if root and self._rock_ridge and not joliet else b""
+        records.insert(0, self._record(extent, SECTOR_SIZE, b"\x00", True, system_use))
+        records.insert(1, self._record(extent, SECTOR_SIZE, b"\x01", True))
+        return self._allocate(b"".join(records))
+
+    def _descriptor(self, descriptor_type, root, escape_sequence=b""):
+        data = bytearray(SECTOR_SIZE)
+        data[0:7] = bytes([descriptor_type]) + b"CD001\x01"
+        data[88:88 + len(escape_sequence)] = escape_sequence
+        data[128:130] = struct.pack("<H", SECTOR_SIZE)
+        data[156:156 + len(root)] = root
+        return bytes(data)
+
+    def build(self, path, tree):
+        root = self._write_directory(tree, joliet=False, root=True)
+        self._sectors[16] = self._descriptor(1, self._record(root, SECTOR_SIZE, b"\x00", True))
+
+        if self._joliet:
+            root = self._write_directory(tree, joliet=True, root=True)
+            self._sectors[17] = self._descriptor(2, self._record(root, SECTOR_SIZE, b"\x00", True),
+                                                 escape_sequence=b"%/E")
+        else:
+            self._sectors[17] = self._descriptor(2, b"")
+
+        self._sectors[18] = bytes([255]) + b"CD001\x01"
+
+        with open(path, "wb") as f:
+            for sector, data in self._sectors.items():
+                f.seek(sector * SECTOR_SIZE)
+                f.write(data)
+
+            f.truncate(self._next_sector * SECTOR_SIZE)
+
+
+class ISO9660ImageTestCase(unittest.TestCase):
+    """Test the reader of ISO 9660 images."""
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp_dir.name, "image.iso")
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def _check_image(self, image):
+        self.assertEqual(image.read_file(".discinfo"), DISCINFO)
+        self.assertEqual(image.read_file("repodata/repomd.xml"), REPOMD)
+        self.assertEqual(image.read_file("/repodata/repomd.xml"), REPOMD)
+
+        self.assertTrue(image.exists("repodata/repomd.xml"))
+        self.assertTrue(image.is_dir("repodata"))
+        self.assertFalse(image.is_dir(".discinfo"))
+
+        self.assertIsNone(image.read_file(".treeinfo"))
+        self.assertIsNone(image.read_file("repodata"))
+        self.assertIsNone(image.read_file(".discinfo/repodata"))
+        self.assertFalse(image.exists("repodata/primary.xml.gz"))
+
+    def rock_ridge_test(self):
+        """Test an image with the Rock Ridge extension."""
+        ImageBuilder(rock_ridge=True).build(self.path, TREE)
+
+        with ISO9660Image(self.path) as image:
+            self._check_image(image)
+
+    def joliet_test(self):
+        """Test an image with the Joliet extension."""
+        ImageBuilder(joliet=True).build(self.path, TREE)
+
+        with ISO9660Image(self.path) as image:
+            self._check_image(image)
+
+    def rock_ridge_and_joliet_test(self):
+        """Test an image with both extensions."""
+        ImageBuilder(rock_ridge=True, joliet=True).build(self.path, TREE)
+
+        with ISO9660Image(self.path) as image:
+            self._check_image(image)
+
+    def short_names_test(self):
+        """Test an image without long file names."""
+        ImageBuilder().build(self.path, TREE)
+
+        with self.assertRaises(ISO9660Error):
+            ISO9660Image(self.path).open()
+
+    def invalid_image_test(self):
+        """Test an invalid image."""
+        with open(self.path, "wb") as f:
+            f.write(b"\x00" * SECTOR_SIZE * 20)
+
+        with self.assertRaises(ISO9660Error):
+            ISO9660Image(self.path).open()
+
+        with self.assertRaises(OSError):
+            ISO9660Image(self.path + ".missing").open()
+
+    def max_size_test(self):
+        """Test the maximal size of a read file."""
+        ImageBuilder(joliet=True).build(self.path, TREE)
+
+        with ISO9660Image(self.path) as image:
+            self.assertEqual(image.read_file(".discinfo", max_size=len(DISCINFO)), DISCINFO)
+
+            with self.assertRaises(ISO9660Error):
+                image.read_file(".discinfo", max_size=len(DISCINFO) - 1)
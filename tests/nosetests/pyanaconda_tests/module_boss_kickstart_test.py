@@ -22,6 +22,8 @@ from contextlib import contextmanager
 from unittest.mock import Mock
 
 from pyanaconda.modules.boss.kickstart_manager import KickstartManager
+from pyanaconda.modules.boss.kickstart_manager.element import KickstartElement, \
+    TrackedKickstartElements
 from pyanaconda.modules.boss.module_manager.module_observer import ModuleObserver
 from pyanaconda.modules.common.structures.kickstart import KickstartReport, KickstartMessage
 
@@ -342,6 +344,31 @@ network --device=ens3
             "[Errno 2] No such file or directory: 'missing_include.cfg'"
         )
 
+    def get_elements_test(self):
+        """Test the selection of kickstart elements."""
+        e1 = KickstartElement(["network"], ["network\n"], 1, "ks.cfg")
+        e2 = KickstartElement(["%packages"], ["vim\n"], 2, "ks.cfg")
+        e3 = KickstartElement(["%addon", "pony"], [], 5, "ks.cfg")
+        e4 = KickstartElement(["firewall"], ["firewall\n"], 7, "ks.cfg")
+        e5 = KickstartElement(["network"], ["network\n"], 8, "ks.cfg")
+
+        elements = TrackedKickstartElements()
+
+        for element in [e1, e2, e3, e4, e5]:
+            elements.append(element)
+
+        self.assertEqual(elements.get_elements(), [])
+        self.assertEqual(elements.get_elements(commands=["network"]), [e1, e5])
+        self.assertEqual(elements.get_elements(commands=["packages"]), [])
+        self.assertEqual(elements.get_elements(sections=["packages"]), [e2])
+        self.assertEqual(
+            elements.get_elements(commands=["network", "firewall", "network"], addons=["pony"]),
+            [e1, e3, e4, e5]
+        )
+
+        elements.get_and_process_elements(sections=["packages"], addons=["pony"])
+        self.assertEqual(elements.unprocessed_elements, [e1, e4, e5])
+
 
 class TestModule(object):
 
@@ -305,6 +305,27 @@ class DeviceTreeInterfaceTestCase(unittest.TestCase):
             'description': get_variant(Str, 'LUKS'),
         })
 
+    def get_devices_data_test(self):
+        """Test GetDevicesData and GetFormatsData."""
+        self.assertEqual(self.interface.GetDevicesData([]), [])
+        self.assertEqual(self.interface.GetFormatsData([]), [])
+
+        self._add_device(StorageDevice("dev1", fmt=get_format("ext4"), size=Size("10 GiB")))
+        self._add_device(StorageDevice("dev2", fmt=get_format("swap"), size=Size("1 GiB")))
+
+        self.assertEqual(
+            self.interface.GetDevicesData(["dev2", "dev1"]),
+            [self.interface.GetDeviceData("dev2"), self.interface.GetDeviceData("dev1")]
+        )
+
+        self.assertEqual(
+            self.interface.GetFormatsData(["dev2", "dev1"]),
+            [self.interface.GetFormatData("dev2"), self.interface.GetFormatData("dev1")]
+        )
+
+        with self.assertRaises(UnknownDeviceError):
+            self.interface.GetDevicesData(["dev1", "dev3"])
+
     def get_format_type_data_test(self):
         """Test GetFormatTypeData."""
         self.assertEqual(self.interface.GetFormatTypeData("swap"), {
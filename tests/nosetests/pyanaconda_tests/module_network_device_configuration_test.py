@@ -0,0 +1,175 @@
+#
+# Copyright (C) 2026  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import unittest
+from unittest.mock import Mock, patch
+
+from pyanaconda.modules.network.device_configuration import DeviceConfigurations
+
+
+class DeviceConfigurationsTestCase(unittest.TestCase):
+    """Test the device configurations."""
+
+    def setUp(self):
+        self.nm_client = Mock()
+        self.nm_client.get_devices.return_value = []
+        self.nm_client.get_connections.return_value = []
+
+        self.changes = []
+        self.device_configurations = DeviceConfigurations(self.nm_client)
+        self.device_configurations.configurations_changed.connect(self.changes.extend)
+        self.device_configurations.reload()
+
+    def _get_device(self, iface):
+        device = Mock()
+        device.get_iface.return_value = iface
+        return device
+
+    def _get_connection(self, uuid):
+        connection = Mock()
+        connection.get_uuid.return_value = uuid
+        return connection
+
+    def lookup_test(self):
+        """Test the lookup of the configurations."""
+        dc = self.device_configurations
+        dc.add(device_name="ens3", connection_uuid="uuid-1")
+        dc.add(device_name="ens4")
+        dc.add(connection_uuid="uuid-3")
+        dc.add(connection_uuid="uuid-3")
+
+        self.assertEqual([c.device_name for c in dc.get_all()], ["ens3", "ens4", "", ""])
+        self.assertEqual([c.connection_uuid for c in dc.get_for_device("ens3")], ["uuid-1"])
+        self.assertEqual([c.device_name for c in dc.get_for_uuid("uuid-1")], ["ens3"])
+        self.assertEqual(len(dc.get_for_uuid("uuid-3")), 2)
+        self.assertEqual(dc.get_for_device("ens5"), [])
+        self.assertEqual(dc.get_for_uuid("uuid-5"), [])
+
+    def attach_test(self):
+        """Test the lookup of attached configurations."""
+        dc = self.device_configurations
+        dc.add(device_name="ens3")
+        dc.add(connection_uuid="uuid-2")
+        cfg = dc.get_for_uuid("uuid-2")[0]
+
+        dc.attach(cfg, device_name="ens4")
+        self.assertEqual(dc.get_for_device("ens4"), [cfg])
+        self.assertEqual(dc.get_for_device(""), [])
+
+        dc.attach(dc.get_for_device("ens3")[0], connection_uuid="uuid-1")
+        self.assertEqual([c.device_name for c in dc.get_for_uuid("uuid-1")], ["ens3"])
+        self.assertEqual([c.device_name for c in dc.get_all()], ["ens3", "ens4"])
+
+    def unattached_connections_test(self):
+        """Test the lookup of many configurations without a device."""
+        dc = self.device_configurations
+
+        for i in range(100):
+            dc.add(connection_uuid="uuid-{}".format(i))
+
+        configurations = dc.get_for_device("")
+        self.assertEqual(configurations, dc.get_all())
+
+        for i, cfg in enumerate(configurations[:50]):
+            dc.attach(cfg, device_name="team{}".format(i))
+
+        self.assertEqual(dc.get_for_device(""), configurations[50:])
+        self.assertEqual(dc.get_for_device("team10"), [configurations[10]])
+        self.assertEqual(dc.get_for_uuid("uuid-60"), [configurations[60]])
+
+        dc._connection_removed_cb(self.nm_client, self._get_connection("uuid-60"))
+        self.assertEqual(len(dc.get_for_device("")), 49)
+        self.assertEqual(dc.get_for_uuid("uuid-60"), [])
+
+    @patch("pyanaconda.modules.network.device_configuration.virtual_device_types", [15])
+    def device_removed_test(self):
+        """Test the lookup after a removed device."""
+        dc = self.device_configurations
+        dc.add(device_name="ens3", connection_uuid="uuid-1", device_type=1)
+        dc.add(device_name="team0", connection_uuid="uuid-2", device_type=15)
+
+        dc._device_removed_cb(self.nm_client, self._get_device("ens3"))
+        self.assertEqual(dc.get_for_device("ens3"), [])
+        self.assertEqual(dc.get_for_uuid("uuid-1"), [])
+
+        dc._device_removed_cb(self.nm_client, self._get_device("team0"))
+        self.assertEqual(dc.get_for_device("team0"), [])
+        self.assertEqual([c.device_name for c in dc.get_for_uuid("uuid-2")], [""])
+        self.assertEqual(len(dc.get_all()), 1)
+
+    def connection_removed_test(self):
+        """Test the lookup after a removed connection."""
+        dc = self.device_configurations
+        dc.add(device_name="ens3", connection_uuid="uuid-1")
+        dc.add(connection_uuid="uuid-2")
+
+        dc._connection_removed_cb(self.nm_client, self._get_connection("uuid-1"))
+        self.assertEqual(dc.get_for_uuid("uuid-1"), [])
+        self.assertEqual([c.connection_uuid for c in dc.get_for_device("ens3")], [""])
+
+        dc._connection_removed_cb(self.nm_client, self._get_connection("uuid-2"))
+        self.assertEqual(dc.get_for_uuid("uuid-2"), [])
+        self.assertEqual([c.device_name for c in dc.get_all()], ["ens3"])
+
+    def changes_test(self):
+        """Test the reported changes."""
+        dc = self.device_configurations
+        dc.add(device_name="ens3")
+        self.assertEqual(len(self.changes), 1)
+
+        old_cfg, new_cfg = self.changes[0]
+        self.assertEqual(old_cfg.device_name, "")
+        self.assertEqual(new_cfg.device_name, "ens3")
+
+    def reload_test(self):
+        """Test the reported changes of a reload."""
+        dc = self.device_configurations
+        callback = Mock()
+        dc.configurations_changed.connect(callback)
+
+        def add_device(device):
+            dc.add(device_name=device.get_iface())
+
+        def add_connection(connection):
+            cfg = dc.get_for_device("ens3")[0]
+            dc.attach(cfg, connection_uuid=connection.get_uuid())
+
+        self.nm_client.get_devices.return_value = [
+            self._get_device("ens3"),
+            self._get_device("ens4"),
+        ]
+        self.nm_client.get_connections.return_value = [
+            self._get_connection("uuid-1")
+        ]
+
+        with patch.object(dc, "add_device", side_effect=add_device), \
+                patch.object(dc, "add_connection", side_effect=add_connection):
+            dc.reload()
+
+        # The changes are reported at once.
+        callback.assert_called_once()
+        changes = callback.call_args[0][0]
+        self.assertEqual(len(changes), 3)
+
+        # The reported configurations are not changed later.
+        self.assertEqual(changes[0][1].device_name, "ens3")
+        self.assertEqual(changes[0][1].connection_uuid, "")
+        self.assertEqual(changes[2][0].connection_uuid, "")
+        self.assertEqual(changes[2][1].connection_uuid, "uuid-1")
+
+        self.assertEqual([c.device_name for c in dc.get_for_uuid("uuid-1")], ["ens3"])
+        self.assertEqual(len(dc.get_all()), 2)
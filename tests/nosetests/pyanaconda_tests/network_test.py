@@ -17,7 +17,10 @@
 # Red Hat, Inc.
 
 from pyanaconda import network
+import threading
+import time
 import unittest
+from unittest.mock import patch, Mock
 
 
 class NetworkTests(unittest.TestCase):
@@ -251,3 +254,65 @@ class NetworkTests(unittest.TestCase):
         cmdline = {"ip": "[fd00:10:100::84:5]::[fd00:10:100::86:49]:80::ens50:none"
                          "ens3:dhcp 10.34.102.244::10.34.102.54:255.255.255.0:myhostname:ens9:none"}
         self.assertEqual(network.hostname_from_cmdline(cmdline), "myhostname")
+
+
+class NetworkStateWatcherTestCase(unittest.TestCase):
+    """Test the watcher of the network state."""
+
+    def setUp(self):
+        self.watcher = network.NetworkStateWatcher()
+        self.proxy = Mock()
+
+        with patch("pyanaconda.network.NETWORK") as network_module:
+            network_module.get_proxy.return_value = self.proxy
+            self.assertEqual(self.watcher.proxy, self.proxy)
+
+        self.proxy.PropertiesChanged.connect.assert_called_once()
+        self.state_changed = self.proxy.PropertiesChanged.connect.call_args[0][0]
+
+    def wait_passed_test(self):
+        """Test a wait that passes immediately."""
+        self.assertTrue(self.watcher.wait(lambda: True, timeout=10, interval=10))
+
+    def wait_timeout_test(self):
+        """Test a wait that times out."""
+        check = Mock(return_value=False)
+        self.assertFalse(self.watcher.wait(check, timeout=0.2, interval=0.05))
+        self.assertGreater(check.call_count, 1)
+
+    def wait_signal_test(self):
+        """Test a wait that is woken up by a signal."""
+        connected = threading.Event()
+
+        def connect():
+            connected.set()
+            self.state_changed("org.fedoraproject.Anaconda.Modules.Network", {}, [])
+
+        timer = threading.Timer(0.1, connect)
+        timer.start()
+
+        start = time.monotonic()
+        result = self.watcher.wait(connected.is_set, timeout=30, interval=30)
+        timer.join()
+
+        self.assertTrue(result)
+        self.assertLess(time.monotonic() - start, 10)
+
+    def wait_for_connected_NM_test(self):
+        """Test the wait for connected NM."""
+        self.proxy.Connected = False
+        self.proxy.IsConnecting.return_value = False
+
+        with patch("pyanaconda.network._network_state_watcher", self.watcher):
+            self.assertFalse(network.wait_for_connected_NM(only_connecting=True))
+
+            self.proxy.Connected = True
+            self.assertTrue(network.wait_for_connected_NM(only_connecting=True))
+
+    def wait_for_network_devices_test(self):
+        """Test the wait for network devices."""
+        self.proxy.GetActivatedInterfaces.return_value = ["ens3", "ens4"]
+
+        with patch("pyanaconda.network._network_state_watcher", self.watcher):
+            self.assertTrue(network.wait_for_network_devices(["ens3"], timeout=1))
+            self.assertFalse(network.wait_for_network_devices(["ens5"], timeout=0))
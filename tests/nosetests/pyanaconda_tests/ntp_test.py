@@ -0,0 +1,211 @@
+#
+# Copyright (C) 2026  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import socket
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from pyanaconda.core.constants import NTP_SERVER_OK, NTP_SERVER_NOK, NTP_SERVER_QUERY
+from pyanaconda.modules.common.structures.timezone import TimeSourceData
+from pyanaconda.threading import threadMgr
+from pyanaconda.ntp import check_ntp_servers, NTPServerStatusCache, _create_ntp_request, \
+    _is_valid_ntp_response
+
+
+def _create_server(hostname, nts=False):
+    server = TimeSourceData()
+    server.hostname = hostname
+    server.options = ["iburst"]
+
+    if nts:
+        server.options.append("nts")
+
+    return server
+
+
+def _create_ntp_response(request, header=0x24, stratum=2):
+    """Create a response of a synchronized NTP server."""
+    return bytes([header, stratum]) + bytes(22) + request[40:48] + bytes(16)
+
+
+class LocalNTPResponder(object):
+    """A local UDP responder to SNTP requests."""
+
+    def __init__(self, respond=True):
+        self._respond = respond
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.bind(("127.0.0.1", 0))
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self.requests = 0
+
+    @property
+    def port(self):
+        return self._socket.getsockname()[1]
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._socket.close()
+
+    def _run(self):
+        while True:
+            try:
+                request, address = self._socket.recvfrom(1024)
+            except OSError:
+                return
+
+            self.requests += 1
+
+            if self._respond:
+                self._socket.sendto(_create_ntp_response(request), address)
+
+
+class NTPProbeTestCase(unittest.TestCase):
+    """Test the in-process NTP probe."""
+
+    def response_validation_test(self):
+        """Test the validation of the NTP response."""
+        request = _create_ntp_request()
+        self.assertEqual(len(request), 48)
+        self.assertEqual(request[0], 0x23)
+
+        response = _create_ntp_response(request)
+        self.assertTrue(_is_valid_ntp_response(request, response))
+
+        # Short packet.
+        self.assertFalse(_is_valid_ntp_response(request, response[:40]))
+
+        # Not a server response.
+        response = _create_ntp_response(request, header=0x23)
+        self.assertFalse(_is_valid_ntp_response(request, response))
+
+        # Unsynchronized server.
+        response = _create_ntp_response(request, header=0xe4)
+        self.assertFalse(_is_valid_ntp_response(request, response))
+
+        # Kiss-o'-death packet.
+        response = _create_ntp_response(request, stratum=0)
+        self.assertFalse(_is_valid_ntp_response(request, response))
+
+        # Response to a different request.
+        response = _create_ntp_response(_create_ntp_request())
+        self.assertFalse(_is_valid_ntp_response(request, response))
+
+    def working_server_test(self):
+        """Test a working NTP server."""
+        server = _create_server("127.0.0.1")
+
+        with LocalNTPResponder() as responder:
+            results = check_ntp_servers([server], timeout=5, ntp_port=responder.port)
+
+        self.assertEqual(results, {("127.0.0.1", False): True})
+        self.assertEqual(responder.requests, 1)
+
+    def silent_server_test(self):
+        """Test an NTP server that doesn't respond."""
+        server = _create_server("127.0.0.1")
+
+        with LocalNTPResponder(respond=False) as responder:
+            start = time.monotonic()
+            results = check_ntp_servers([server], timeout=0.5, ntp_port=responder.port)
+            elapsed = time.monotonic() - start
+
+        self.assertEqual(results, {("127.0.0.1", False): False})
+        self.assertLess(elapsed, 5)
+
+    @patch("socket.getaddrinfo")
+    def invalid_server_test(self, getaddrinfo):
+        """Test an NTP server that can't be resolved."""
+        getaddrinfo.side_effect = socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+        server = _create_server("invalid.hostname.test")
+
+        results = check_ntp_servers([server], timeout=5)
+        self.assertEqual(results, {("invalid.hostname.test", False): False})
+        self.assertEqual(getaddrinfo.call_args[0][0], "invalid.hostname.test")
+
+    def concurrent_servers_test(self):
+        """Test that the NTP servers are checked concurrently."""
+        servers = [_create_server("127.0.0.1"), _create_server("localhost")]
+
+        with LocalNTPResponder(respond=False) as silent:
+            start = time.monotonic()
+            results = check_ntp_servers(servers, timeout=1, ntp_port=silent.port)
+            elapsed = time.monotonic() - start
+
+        self.assertEqual(set(results.values()), {False})
+        self.assertLess(elapsed, 2)
+
+    def nts_server_test(self):
+        """Test the check of an NTS server."""
+        server = _create_server("127.0.0.1", nts=True)
+
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as listener:
+            listener.bind(("127.0.0.1", 0))
+            listener.listen(1)
+            port = listener.getsockname()[1]
+
+            results = check_ntp_servers([server], timeout=5, nts_port=port)
+            self.assertEqual(results, {("127.0.0.1", True): True})
+
+        results = check_ntp_servers([server], timeout=5, nts_port=port)
+        self.assertEqual(results, {("127.0.0.1", True): False})
+
+
+class NTPServerStatusCacheTestCase(unittest.TestCase):
+    """Test the cache of NTP server states."""
+
+    def _run_check(self, cache, servers, results):
+        with patch("pyanaconda.ntp.check_ntp_servers") as check:
+            check.return_value = results
+            cache.check_statuses(servers)
+            threadMgr.wait_all()
+            return check.called
+
+    def status_test(self):
+        """Test the status of NTP servers."""
+        cache = NTPServerStatusCache()
+        server_1 = _create_server("ntp.example.com")
+        server_2 = _create_server("ntp.example.com", nts=True)
+
+        self.assertEqual(cache.get_status(server_1), NTP_SERVER_QUERY)
+        self.assertEqual(cache.get_status(server_2), NTP_SERVER_QUERY)
+
+        self.assertTrue(self._run_check(cache, [server_1, server_2], {
+            ("ntp.example.com", False): True,
+            ("ntp.example.com", True): False,
+        }))
+
+        self.assertEqual(cache.get_status(server_1), NTP_SERVER_OK)
+        self.assertEqual(cache.get_status(server_2), NTP_SERVER_NOK)
+
+    def ttl_test(self):
+        """Test the time to live of the NTP server states."""
+        cache = NTPServerStatusCache(ttl=60)
+        server = _create_server("ntp.example.com")
+        results = {("ntp.example.com", False): True}
+
+        self.assertTrue(self._run_check(cache, [server], results))
+        self.assertFalse(self._run_check(cache, [server], results))
+        self.assertEqual(cache.get_status(server), NTP_SERVER_OK)
+
+        cache = NTPServerStatusCache(ttl=0)
+        self.assertTrue(self._run_check(cache, [server], results))
+        self.assertTrue(self._run_check(cache, [server], results))
@@ -0,0 +1,95 @@
+#
+# Copyright (C) 2026  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import unittest
+from unittest.mock import Mock
+
+from pyanaconda.payload.dnf.comps import CompsIndex
+
+
+class CompsIndexTestCase(unittest.TestCase):
+    """Test the index of comps."""
+
+    def _get_option(self, name, default=False):
+        option = Mock()
+        option.name = name
+        option.default = default
+        return option
+
+    def _get_comps_object(self, id_, name, option_ids=()):
+        obj = Mock()
+        obj.id = id_
+        obj.name = name
+        obj.option_ids = list(option_ids)
+        return obj
+
+    def _get_comps(self):
+        comps = Mock()
+        comps.environments = [
+            self._get_comps_object("server", "Server", [
+                self._get_option("debugging", default=True),
+                self._get_option("web-server")
+            ]),
+            self._get_comps_object("minimal", "Minimal Install"),
+        ]
+        comps.groups_iter.return_value = iter([
+            self._get_comps_object("core", "Core"),
+            self._get_comps_object("debugging", "Debugging Tools"),
+            self._get_comps_object("web-server", "Web Server"),
+        ])
+        comps.environment_by_pattern.return_value = None
+        comps.group_by_pattern.return_value = None
+        return comps
+
+    def ids_test(self):
+        """Test the ids of environments and groups."""
+        index = CompsIndex(self._get_comps())
+        self.assertEqual(index.environments, ["server", "minimal"])
+        self.assertEqual(index.groups, ["core", "debugging", "web-server"])
+
+    def find_test(self):
+        """Test the lookups of environments and groups."""
+        comps = self._get_comps()
+        index = CompsIndex(comps)
+
+        self.assertEqual(index.find_environment("server").id, "server")
+        self.assertEqual(index.find_environment("Minimal Install").id, "minimal")
+        self.assertEqual(index.find_group("core").id, "core")
+        self.assertEqual(index.find_group("Web Server").id, "web-server")
+        comps.environment_by_pattern.assert_not_called()
+        comps.group_by_pattern.assert_not_called()
+
+        # Fall back to the pattern lookups of comps.
+        self.assertIsNone(index.find_environment("serv*"))
+        comps.environment_by_pattern.assert_called_once_with("serv*")
+
+        self.assertIsNone(index.find_group("web*"))
+        comps.group_by_pattern.assert_called_once_with("web*")
+
+    def options_test(self):
+        """Test the optional groups of environments."""
+        index = CompsIndex(self._get_comps())
+        self.assertEqual(index.get_options("server"), {"debugging": True, "web-server": False})
+        self.assertEqual(index.get_options("minimal"), {})
+        self.assertEqual(index.get_options("unknown"), {})
+
+    def is_index_of_test(self):
+        """Test the check of the indexed comps."""
+        comps = self._get_comps()
+        index = CompsIndex(comps)
+        self.assertTrue(index.is_index_of(comps))
+        self.assertFalse(index.is_index_of(self._get_comps()))
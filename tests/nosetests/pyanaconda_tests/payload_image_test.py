@@ -0,0 +1,304 @@
+#
+# Copyright (C) 2026  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import threading
+import time
+import unittest
+from unittest.mock import patch, Mock, MagicMock
+
+from blivet.size import Size
+
+from pyanaconda.modules.common.structures.storage import DeviceData, DeviceFormatData
+from pyanaconda.payload.image import find_optical_install_media, get_hdiso_sources_info, \
+    get_hdiso_source_info, get_hdiso_source_description, _probe_optical_media, \
+    _is_valid_optical_media, _OpticalMediaCancellation
+
+
+def _get_device_data(name, parents=(), size=0, attrs=None):
+    data = DeviceData()
+    data.name = name
+    data.path = "/dev/" + name
+    data.parents = list(parents)
+    data.size = size
+    data.attrs = attrs or {}
+    return data
+
+
+def _get_format_data(description, attrs=None):
+    data = DeviceFormatData()
+    data.description = description
+    data.attrs = attrs or {}
+    return data
+
+
+class OpticalMediaTestCase(unittest.TestCase):
+    """Test the search for optical install media."""
+
+    def setUp(self):
+        self.device_tree = Mock()
+        self.device_tree.FindOpticalMedia.return_value = ["sr0", "sr1", "sr2"]
+        self.device_tree.GetDevicesData.side_effect = lambda names: DeviceData.to_structure_list(
+            [_get_device_data(name) for name in names]
+        )
+
+        # The probes are finished when this event is set.
+        self.finished = threading.Event()
+        self.addCleanup(self.finished.set)
+
+        for target, kwargs in [
+            ("pyanaconda.payload.image.STORAGE.get_proxy", {"return_value": self.device_tree}),
+            ("pyanaconda.payload.image.OPTICAL_MEDIA_CANCEL_TIMEOUT", {"new": 5}),
+        ]:
+            patcher = patch(target, **kwargs)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _find_media(self, probes, timeout=5):
+        """Find the optical media with fake probes.
+
+        :param probes: a dictionary of device names and tuples of delays and results
+        :return: a device name and a number of seconds spent
+        """
+        def _probe(device_name, device_path, cancellation):
+            self.assertEqual(device_path, "/dev/" + device_name)
+            delay, result = probes[device_name]
+
+            if delay is None:
+                self.finished.wait()
+            else:
+                time.sleep(delay)
+
+            return result
+
+        with patch("pyanaconda.payload.image._probe_optical_media", side_effect=_probe):
+            start = time.monotonic()
+            device_name = find_optical_install_media(timeout=timeout)
+            return device_name, time.monotonic() - start
+
+    def no_media_test(self):
+        """Test the search without optical media."""
+        self.device_tree.FindOpticalMedia.return_value = []
+        self.assertIsNone(find_optical_install_media())
+        self.device_tree.GetDevicesData.assert_not_called()
+
+    def invalid_media_test(self):
+        """Test the search without a valid media."""
+        device_name, _duration = self._find_media({
+            "sr0": (0, False), "sr1": (0.1, False), "sr2": (0, False)
+        })
+        self.assertIsNone(device_name)
+
+    def order_test(self):
+        """Test that the first valid media is found in the order of the devices."""
+        device_name, _duration = self._find_media({
+            "sr0": (0, False), "sr1": (0.2, True), "sr2": (0, True)
+        })
+        self.assertEqual(device_name, "sr1")
+
+    def first_media_test(self):
+        """Test that the search doesn't wait for the following devices."""
+        device_name, duration = self._find_media({
+            "sr0": (0, True), "sr1": (0.1, False), "sr2": (5, True)
+        })
+        self.assertEqual(device_name, "sr0")
+        self.assertLess(duration, 1)
+
+    def timeout_test(self):
+        """Test that the devices not probed before the timeout are skipped."""
+        device_name, duration = self._find_media({
+            "sr0": (None, True), "sr1": (0, False), "sr2": (0, True)
+        }, timeout=0.2)
+        self.assertEqual(device_name, "sr2")
+        self.assertLess(duration, 1)
+
+        device_name, _duration = self._find_media({
+            "sr0": (None, True), "sr1": (0, False), "sr2": (0, False)
+        }, timeout=0.2)
+        self.assertIsNone(device_name)
+
+    def cancelled_probes_test(self):
+        """Test that the remaining probes are cancelled."""
+        cancellations = []
+
+        def _probe(device_name, device_path, cancellation):
+            cancellations.append(cancellation)
+            self.finished.wait()
+            return True
+
+        self.device_tree.FindOpticalMedia.return_value = ["sr0"]
+
+        with patch("pyanaconda.payload.image._probe_optical_media", side_effect=_probe):
+            start = time.monotonic()
+            self.assertIsNone(find_optical_install_media(timeout=0.2))
+            self.assertLess(time.monotonic() - start, 1)
+
+        # The cancelled probe can't mount the device.
+        self.assertEqual(len(cancellations), 1)
+        self.assertFalse(cancellations[0].start_mount("sr0"))
+
+    def mounting_probes_test(self):
+        """Test that the mounting probes are waited for."""
+        unmounted = threading.Event()
+
+        def _probe(device_name, device_path, cancellation):
+            if device_name == "sr0":
+                time.sleep(0.2)
+                return True
+
+            if device_name == "sr1":
+                cancellation.start_mount(device_name)
+                time.sleep(0.5)
+                unmounted.set()
+                return False
+
+            self.finished.wait()
+            return False
+
+        with patch("pyanaconda.payload.image._probe_optical_media", side_effect=_probe):
+            start = time.monotonic()
+            self.assertEqual(find_optical_install_media(), "sr0")
+            self.assertLess(time.monotonic() - start, 4)
+
+        self.assertTrue(unmounted.is_set())
+
+    @patch("pyanaconda.modules.payloads.source.utils.is_valid_install_disk", return_value=True)
+    @patch("pyanaconda.payload.image.payload_utils")
+    @patch("pyanaconda.payload.image._is_valid_optical_media", side_effect=OSError("Fake!"))
+    def probe_test(self, is_valid_optical_media, payload_utils, is_valid_install_disk):
+        """Test the probe of an optical media that can't be read."""
+        cancellation = _OpticalMediaCancellation()
+        self.assertTrue(_probe_optical_media("sr0", "/dev/sr0", cancellation))
+        is_valid_optical_media.assert_called_once_with("/dev/sr0")
+        payload_utils.mount_device.assert_called_once()
+        payload_utils.unmount_device.assert_called_once()
+        is_valid_install_disk.assert_called_once()
+
+        # The mounted device is reported on cancel.
+        self.assertEqual(cancellation.cancel(), {"sr0"})
+
+        # The cancelled probe doesn't mount the media.
+        payload_utils.reset_mock()
+        self.assertFalse(_probe_optical_media("sr1", "/dev/sr1", cancellation))
+        payload_utils.mount_device.assert_not_called()
+        self.assertEqual(cancellation.cancel(), {"sr0"})
+
+    @patch("pyanaconda.payload.image._arch", "x86_64")
+    @patch("pyanaconda.payload.image._load_disc_arch")
+    @patch("pyanaconda.payload.image.ISO9660Image")
+    def valid_media_test(self, image_class, load_disc_arch):
+        """Test the check of the .discinfo file of an optical media."""
+        image = MagicMock()
+        image_class.return_value.__enter__.return_value = image
+        image.read_file.return_value = b"1234\nFake 1.0\nx86_64\n"
+
+        load_disc_arch.return_value = "x86_64"
+        self.assertTrue(_is_valid_optical_media("/dev/sr0"))
+        image_class.assert_called_once_with("/dev/sr0")
+        image.read_file.assert_called_once_with(".discinfo")
+        load_disc_arch.assert_called_once_with("1234\nFake 1.0\nx86_64\n")
+
+        load_disc_arch.return_value = "ppc64le"
+        self.assertFalse(_is_valid_optical_media("/dev/sr0"))
+
+        load_disc_arch.return_value = None
+        self.assertFalse(_is_valid_optical_media("/dev/sr0"))
+
+        load_disc_arch.reset_mock()
+        image.read_file.return_value = None
+        self.assertFalse(_is_valid_optical_media("/dev/sr0"))
+        load_disc_arch.assert_not_called()
+
+
+class HDISOSourcesTestCase(unittest.TestCase):
+    """Test the info about potential HDISO sources."""
+
+    def setUp(self):
+        self.devices = {
+            "sda": _get_device_data("sda", attrs={"model": "Fake_Disk"}),
+            "sda1": _get_device_data("sda1", ["sda"], 1024 ** 3),
+            "sda2": _get_device_data("sda2", ["sda"], 2 * 1024 ** 3),
+            "sdb": _get_device_data("sdb"),
+            "sdb1": _get_device_data("sdb1", ["sdb"], 1024 ** 2),
+        }
+        self.formats = {
+            "sda1": _get_format_data("ext4", {"label": "data", "uuid": "1234"}),
+            "sda2": _get_format_data("xfs", {"uuid": "5678"}),
+            "sdb1": _get_format_data("vfat"),
+        }
+
+        self.device_tree = Mock()
+        self.device_tree.GetDevicesData.side_effect = lambda names: DeviceData.to_structure_list(
+            [self.devices[name] for name in names]
+        )
+        self.device_tree.GetFormatsData.side_effect = \
+            lambda names: DeviceFormatData.to_structure_list(
+                [self.formats[name] for name in names]
+            )
+
+    def sources_info_test(self):
+        """Test the info about more sources."""
+        devices_info = get_hdiso_sources_info(self.device_tree, ["sda1", "sdb1", "sda2"])
+
+        self.assertEqual(devices_info, [
+            {
+                "model": "Fake Disk",
+                "path": "/dev/sda1",
+                "size": Size("1 GiB"),
+                "format": "ext4",
+                "label": "data",
+            },
+            {
+                "model": "",
+                "path": "/dev/sdb1",
+                "size": Size("1 MiB"),
+                "format": "vfat",
+                "label": "",
+            },
+            {
+                "model": "Fake Disk",
+                "path": "/dev/sda2",
+                "size": Size("2 GiB"),
+                "format": "xfs",
+                "label": "5678",
+            },
+        ])
+
+        # The data are requested at once.
+        self.assertEqual(self.device_tree.GetDevicesData.call_count, 2)
+        self.device_tree.GetDevicesData.assert_called_with(["sda", "sdb"])
+        self.device_tree.GetFormatsData.assert_called_once_with(["sda1", "sdb1", "sda2"])
+
+        self.assertEqual(
+            get_hdiso_source_description(devices_info[0]),
+            "Fake Disk /dev/sda1 (1 GiB) ext4 data"
+        )
+
+    def source_info_test(self):
+        """Test the info about one source."""
+        self.assertEqual(get_hdiso_source_info(self.device_tree, "sdb1"), {
+            "model": "",
+            "path": "/dev/sdb1",
+            "size": Size("1 MiB"),
+            "format": "vfat",
+            "label": "",
+        })
+
+    def no_sources_test(self):
+        """Test the info about no sources."""
+        self.assertEqual(get_hdiso_sources_info(self.device_tree, []), [])
+        self.device_tree.GetDevicesData.assert_not_called()
+        self.device_tree.GetFormatsData.assert_not_called()
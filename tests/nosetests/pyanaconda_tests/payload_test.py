@@ -23,22 +23,29 @@ import tempfile
 import os
 import hashlib
 import shutil
+import threading
 import gi
 
 import pyanaconda.core.payload as util
 
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from tempfile import TemporaryDirectory
-from unittest.mock import patch, Mock, call
+from unittest.mock import patch, Mock, MagicMock, call
 
 from blivet.size import Size
+from dnf.exceptions import DepsolveError
 
 from pyanaconda.core.configuration.anaconda import conf
+from pyanaconda.core.constants import PAYLOAD_TYPE_LIVE_OS, PAYLOAD_TYPE_DNF, THREAD_STORAGE, \
+    THREAD_WAIT_FOR_CONNECTING_NM
 from pyanaconda.modules.common.structures.requirement import Requirement
 from pyanaconda.payload.dnf import utils
+from pyanaconda.payload.dnf.payload import DNFPayload
 from pyanaconda.payload.flatpak import FlatpakPayload
-from pyanaconda.payload.dnf.repomd import RepoMDMetaHash
+from pyanaconda.payload.dnf.repomd import RepoMDMetaHash, verify_repoMD_hashes
 from pyanaconda.payload.requirement import PayloadRequirements
-from pyanaconda.payload.errors import PayloadRequirementsMissingApply
+from pyanaconda.payload.errors import PayloadRequirementsMissingApply, DependencyError
+from pyanaconda.payload.manager import PayloadManager, PayloadState
 
 gi.require_version("Flatpak", "1.0")
 from gi.repository.Flatpak import RefKind
@@ -98,6 +105,53 @@ class PickLocation(unittest.TestCase):
         self.assertEqual(mpoint, None)
 
 
+class MetadataCacheTestCase(unittest.TestCase):
+    """Test the metadata cache of DNF."""
+
+    def _create_entry(self, cache_dir, name, size, mtime):
+        path = os.path.join(cache_dir, name)
+        os.makedirs(os.path.join(path, "repodata"))
+
+        with open(os.path.join(path, "repodata", "primary.xml.gz"), "wb") as f:
+            f.write(b"x" * size)
+
+        os.utime(path, (mtime, mtime))
+        return path
+
+    def prune_metadata_cache_test(self):
+        """Test the pruning of the metadata cache."""
+        with TemporaryDirectory() as cache_dir:
+            old = self._create_entry(cache_dir, "old-1234", 100, 1000)
+            new = self._create_entry(cache_dir, "new-5678", 100, 3000)
+            used = self._create_entry(cache_dir, "used-abcd", 100, 2000)
+
+            self.assertEqual(utils.prune_metadata_cache(cache_dir, 1000), [])
+            self.assertEqual(utils.prune_metadata_cache(cache_dir, 250), [old])
+            self.assertEqual(utils.prune_metadata_cache(cache_dir, 100), [used])
+            self.assertEqual(os.listdir(cache_dir), [os.path.basename(new)])
+
+    def prune_missing_metadata_cache_test(self):
+        """Test the pruning of a missing metadata cache."""
+        with TemporaryDirectory() as cache_dir:
+            path = os.path.join(cache_dir, "missing")
+            self.assertEqual(utils.prune_metadata_cache(path, 0), [])
+
+    def prune_metadata_cache_error_test(self):
+        """Test the pruning of a file that can't be removed."""
+        with TemporaryDirectory() as cache_dir:
+            path = os.path.join(cache_dir, "file.solv")
+
+            with open(path, "wb") as f:
+                f.write(b"x" * 100)
+
+            with patch("pyanaconda.payload.dnf.utils.os.unlink") as unlink:
+                unlink.side_effect = PermissionError("Fake error!")
+                self.assertEqual(utils.prune_metadata_cache(cache_dir, 0), [])
+
+            unlink.assert_called_once_with(path)
+            self.assertEqual(utils.prune_metadata_cache(cache_dir, 0), [path])
+
+
 class DummyRepo(object):
     def __init__(self):
         self.id = "anaconda"
@@ -152,6 +206,373 @@ or it should be. Nah it's just a test!
         os.remove(self._md_file)
         self.assertFalse(r.verify_repoMD())
 
+    def first_working_url_test(self):
+        """Test that the first working URL is used."""
+        self._dummyRepo.baseurl = [
+            "file://" + self._temp_dir + "/missing",
+            "file://" + self._temp_dir,
+        ]
+
+        r = RepoMDMetaHash(self._dummyRepo, None)
+        r.store_repoMD_hash()
+        self.assertEqual(
+            r.repoMD_hash,
+            hashlib.sha256(self._content_repomd.encode()).digest()
+        )
+        self.assertTrue(r.verify_repoMD())
+
+        # no working URL
+        self._dummyRepo.baseurl = ["file://" + self._temp_dir + "/missing"]
+        r = RepoMDMetaHash(self._dummyRepo, None)
+        r.store_repoMD_hash()
+        self.assertEqual(r.repoMD_hash, "")
+        self.assertFalse(r.verify_repoMD())
+
+    def different_mirrors_test(self):
+        """Test the verification with mirrors of different content."""
+        mirror = os.path.join(self._temp_dir, "mirror")
+        os.makedirs(os.path.join(mirror, "repodata"))
+
+        with open(os.path.join(mirror, "repodata", "repomd.xml"), "w") as f:
+            f.write("Content of an outdated mirror")
+
+        self._dummyRepo.baseurl = [
+            "file://" + self._temp_dir,
+            "file://" + mirror,
+        ]
+
+        r = RepoMDMetaHash(self._dummyRepo, None)
+        r.store_repoMD_hash()
+
+        # Any mirror with the stored content is enough.
+        for _i in range(10):
+            self.assertTrue(r.verify_repoMD())
+
+    def verify_repositories_test(self):
+        """Test verification of multiple repositories."""
+        r1 = RepoMDMetaHash(self._dummyRepo, None)
+        r1.store_repoMD_hash()
+
+        r2 = RepoMDMetaHash(self._dummyRepo, None)
+        r2.store_repoMD_hash()
+
+        self.assertTrue(verify_repoMD_hashes([]))
+        self.assertTrue(verify_repoMD_hashes([r1, r2]))
+
+        r3 = Mock(id="broken")
+        r3.verify_repoMD.return_value = False
+        self.assertFalse(verify_repoMD_hashes([r1, r3, r2]))
+
+    def conditional_request_test(self):
+        """Test the verification with conditional requests."""
+        handler = _RepoMDRequestHandler
+        handler.content = self._content_repomd.encode()
+        handler.requests = []
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        try:
+            self._dummyRepo.baseurl = [
+                "http://127.0.0.1:{}".format(server.server_address[1])
+            ]
+
+            r = RepoMDMetaHash(self._dummyRepo, None)
+            r.store_repoMD_hash()
+            self.assertEqual(handler.requests, [None])
+
+            # the server should reply with 304
+            self.assertTrue(r.verify_repoMD())
+            self.assertEqual(handler.requests, [None, '"1"'])
+
+            # the content has changed
+            handler.content = b"changed"
+            self.assertFalse(r.verify_repoMD())
+            self.assertEqual(handler.requests, [None, '"1"', '"1"'])
+
+            # the stored hash wasn't updated
+            self.assertFalse(r.verify_repoMD())
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+    def unexpected_not_modified_test(self):
+        """Test the verification with an unexpected 304 code."""
+        url = "http://server/repo"
+        response = Mock(status_code=304)
+        session = MagicMock()
+        session.get.return_value.__enter__.return_value = response
+
+        r = RepoMDMetaHash(self._dummyRepo, None)
+        self.assertIsNone(r._fetch_repoMD(session, None, url))
+
+        r._validators[url] = (None, None)
+        self.assertIsNone(r._fetch_repoMD(session, None, url))
+
+        r._validators[url] = ('"1"', None)
+        self.assertEqual(r._fetch_repoMD(session, None, url), (r.repoMD_hash, ('"1"', None)))
+
+
+class _RepoMDRequestHandler(BaseHTTPRequestHandler):
+    """Serve the repomd.xml file with an ETag."""
+
+    protocol_version = "HTTP/1.1"
+    content = b""
+    requests = []
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        etag = '"2"' if self.content == b"changed" else '"1"'
+
+        self.requests.append(self.headers.get("If-None-Match"))
+
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(self.content)))
+        self.end_headers()
+        self.wfile.write(self.content)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+class DNFPayloadSelectionTestCase(unittest.TestCase):
+    """Test the check of the software selection."""
+
+    def setUp(self):
+        self.specs = (["@core"], [])
+        self.repos = [self._get_repo("anaconda")]
+
+        self.payload = DNFPayload.__new__(DNFPayload)
+        self.payload.data = Mock()
+        self.payload.data.module.dataList.return_value = []
+        self.payload.data.packages.handleMissing = 0
+        self.payload.tx_id = None
+        self.payload._checked_selection = None
+        self.payload._repos_lock = threading.RLock()
+        self.payload._repoMD_list = []
+        self.payload._dnf_proxy = Mock()
+        self.payload._base = MagicMock()
+        self.payload._base.conf.strict = True
+        self.payload._base.transaction = []
+        self.payload._base.repos.iter_enabled.side_effect = lambda: iter(self.repos)
+
+        for name, kwargs in [
+            ("_get_selection_specs", {"side_effect": lambda: self.specs}),
+            ("_process_module_command", {}),
+            ("_apply_selections", {}),
+            ("_configure_proxy", {}),
+            ("reset_additional_repos", {}),
+            ("space_required", {"new": Size(0)}),
+        ]:
+            patcher = patch.object(DNFPayload, name, **kwargs)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _get_repo(self, repo_id):
+        repo = Mock()
+        repo.id = repo_id
+        return repo
+
+    def _check_selection(self, resolved):
+        """Check the software selection and the number of depsolves."""
+        self.payload.check_software_selection()
+        self.assertEqual(self.payload._base.resolve.call_count, resolved)
+
+    def same_selection_test(self):
+        """Test the check of an unchanged software selection."""
+        self._check_selection(resolved=1)
+        self._check_selection(resolved=1)
+        self.assertEqual(self.payload.tx_id, 1)
+
+    def dependency_error_test(self):
+        """Test the check of a software selection with a dependency error."""
+        self.payload._base.resolve.side_effect = DepsolveError("Fake error!")
+
+        for _i in range(2):
+            with self.assertRaises(DependencyError) as cm:
+                self.payload.check_software_selection()
+
+            self.assertEqual(str(cm.exception), "Fake error!")
+            self.assertEqual(self.payload._base.resolve.call_count, 1)
+
+    def changed_repositories_test(self):
+        """Test the check of a software selection with changed repositories."""
+        self._check_selection(resolved=1)
+
+        self.repos.append(self._get_repo("updates"))
+        self._check_selection(resolved=2)
+
+        self.repos.pop()
+        self._check_selection(resolved=3)
+        self._check_selection(resolved=3)
+
+    def changed_specs_test(self):
+        """Test the check of a software selection with changed specs."""
+        self._check_selection(resolved=1)
+
+        self.specs = (["@core", "vim"], [])
+        self._check_selection(resolved=2)
+
+        self.specs = (["@core", "vim"], ["nano"])
+        self._check_selection(resolved=3)
+        self._check_selection(resolved=3)
+
+        # The order of the specs doesn't matter.
+        self.specs = (["vim", "@core"], ["nano"])
+        self._check_selection(resolved=3)
+
+    @patch("pyanaconda.payload.dnf.payload.prune_metadata_cache")
+    @patch("pyanaconda.payload.dnf.payload.tear_down_sources")
+    def reset_test(self, tear_down_sources, prune_metadata_cache):
+        """Test the check of a software selection after a reset."""
+        self.payload._base.resolve.side_effect = DepsolveError("Fake error!")
+
+        with self.assertRaises(DependencyError):
+            self.payload.check_software_selection()
+
+        self.payload.reset()
+        tear_down_sources.assert_called_once()
+        prune_metadata_cache.assert_called_once()
+
+        self.payload._base.resolve.side_effect = None
+        self._check_selection(resolved=2)
+        self._check_selection(resolved=2)
+
+
+class DNFPayloadLocalPackagesTestCase(unittest.TestCase):
+    """Test the reuse of packages from local repositories."""
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.media_dir = os.path.join(self._tmp_dir.name, "media")
+        self.download_dir = os.path.join(self._tmp_dir.name, "download")
+        os.makedirs(self.media_dir)
+
+        self.repos = [
+            self._get_repo("media", ["file://" + self.media_dir]),
+            self._get_repo("fedora", ["http://server/fedora"]),
+        ]
+
+        self.payload = DNFPayload.__new__(DNFPayload)
+        self.payload._repos_lock = threading.RLock()
+        self.payload._base = MagicMock()
+        self.payload._base.repos.iter_enabled.side_effect = lambda: iter(self.repos)
+        self.query = self.payload._base.sack.query.return_value.available.return_value.filter
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def _get_repo(self, repo_id, baseurl, mirrorlist=None):
+        repo = Mock()
+        repo.id = repo_id
+        repo.baseurl = baseurl
+        repo.mirrorlist = mirrorlist
+        repo.metalink = None
+        return repo
+
+    def _get_package(self, reponame, name="vim", evr="8.2-1", chksum=(8, b"abc")):
+        pkg = Mock()
+        pkg.name = name
+        pkg.evr = evr
+        pkg.arch = "x86_64"
+        pkg.chksum = chksum
+        pkg.reponame = reponame
+
+        if reponame == "media":
+            path = os.path.join(self.media_dir, name + ".rpm")
+        else:
+            path = os.path.join(self.download_dir, reponame, name + ".rpm")
+
+        pkg.localPkg.return_value = path
+        return pkg
+
+    def _create_local_package(self, **kwargs):
+        pkg = self._get_package("media", **kwargs)
+
+        with open(pkg.localPkg(), "wb") as f:
+            f.write(b"rpm")
+
+        self.query.return_value = [pkg]
+        return pkg
+
+    def matching_package_test(self):
+        """Test the reuse of a package with the same NEVRA and checksum."""
+        local_pkg = self._create_local_package()
+        remote_pkg = self._get_package("fedora")
+        other_pkg = self._get_package("fedora", name="nano")
+
+        packages = [local_pkg, remote_pkg, other_pkg]
+        self.assertEqual(self.payload._reuse_local_packages(packages), [local_pkg, other_pkg])
+        self.assertFalse(os.path.islink(remote_pkg.localPkg()))
+
+        with open(remote_pkg.localPkg(), "rb") as f:
+            self.assertEqual(f.read(), b"rpm")
+
+        self.query.assert_called_once()
+        self.assertEqual(self.query.call_args[1]["reponame"], ["media"])
+        self.assertEqual(sorted(self.query.call_args[1]["name"]), ["nano", "vim"])
+
+    def different_package_test(self):
+        """Test the download of a package with a different version or checksum."""
+        self._create_local_package()
+        packages = [
+            self._get_package("fedora", evr="8.2-2"),
+            self._get_package("fedora", chksum=(8, b"def")),
+        ]
+
+        self.assertEqual(self.payload._reuse_local_packages(packages), packages)
+        self.assertFalse(os.path.exists(self.download_dir))
+
+    def no_local_repositories_test(self):
+        """Test the download without local repositories."""
+        self.repos = [
+            self._get_repo("media", ["file://" + self.media_dir], mirrorlist="http://mirrors"),
+            self._get_repo("mixed", ["file://" + self.media_dir, "http://server/mixed"]),
+            self._get_repo("fedora", ["http://server/fedora"]),
+        ]
+        packages = [self._get_package("fedora")]
+
+        self.assertEqual(self.payload._reuse_local_packages(packages), packages)
+        self.query.assert_not_called()
+
+    def copy_test(self):
+        """Test the reuse of a package that can't be hard-linked."""
+        local_pkg = self._create_local_package()
+        remote_pkg = self._get_package("fedora")
+
+        with patch("pyanaconda.payload.dnf.payload.os.link", side_effect=OSError("Fake!")):
+            self.assertEqual(self.payload._reuse_local_packages([remote_pkg]), [])
+
+        self.assertFalse(os.path.samefile(remote_pkg.localPkg(), local_pkg.localPkg()))
+
+        with open(remote_pkg.localPkg(), "rb") as f:
+            self.assertEqual(f.read(), b"rpm")
+
+    def copy_failure_test(self):
+        """Test the download of a package that can't be copied."""
+        self._create_local_package()
+        remote_pkg = self._get_package("fedora")
+
+        def _copy_file(path, target):
+            with open(target, "wb") as f:
+                f.write(b"r")
+
+            raise OSError("Fake!")
+
+        with patch("pyanaconda.payload.dnf.payload.os.link", side_effect=OSError("Fake!")), \
+                patch("pyanaconda.payload.dnf.payload.shutil.copyfile", side_effect=_copy_file):
+            self.assertEqual(self.payload._reuse_local_packages([remote_pkg]), [remote_pkg])
+
+        self.assertFalse(os.path.exists(remote_pkg.localPkg()))
+
 
 class PayloadRequirementsTestCase(unittest.TestCase):
 
@@ -665,3 +1086,82 @@ class PayloadUtilsTests(unittest.TestCase):
 
         with self.assertRaises(ValueError):
             util.split_protocol("http://ftp://ups/this/is/not/correct")
+
+
+class PayloadManagerTestCase(unittest.TestCase):
+    """Test the payload manager."""
+
+    def _run_thread(self, payload, checkmount=True, fallback=False):
+        """Run the payload thread and return the reached states."""
+        manager = PayloadManager()
+        states = []
+
+        for state in PayloadState:
+            manager.add_listener(state, lambda s=state: states.append(s))
+
+        # Drop the states reported by adding the listeners.
+        states.clear()
+
+        with patch("pyanaconda.payload.manager.threadMgr") as thread_mgr:
+            manager._run_thread(payload, fallback, checkmount, False)
+
+        waited = [c[0][0] for c in thread_mgr.wait.call_args_list]
+        return states, waited
+
+    def _get_payload(self, needs_storage, needs_network, payload_type=PAYLOAD_TYPE_LIVE_OS):
+        payload = Mock()
+        payload.type = payload_type
+        payload.needs_storage.return_value = needs_storage
+        payload.needs_network = needs_network
+        return payload
+
+    def wait_for_all_test(self):
+        """Test the payload thread that waits for storage and network."""
+        payload = self._get_payload(True, True)
+        states, waited = self._run_thread(payload)
+
+        self.assertEqual(states, [
+            PayloadState.STARTED,
+            PayloadState.WAITING_STORAGE,
+            PayloadState.WAITING_NETWORK,
+            PayloadState.FINISHED
+        ])
+        self.assertIn(THREAD_STORAGE, waited)
+        self.assertIn(THREAD_WAIT_FOR_CONNECTING_NM, waited)
+        payload.needs_storage.assert_called_once_with(True)
+
+    def network_source_test(self):
+        """Test the payload thread with a network source."""
+        payload = self._get_payload(False, True)
+        states, waited = self._run_thread(payload, checkmount=False)
+
+        self.assertNotIn(PayloadState.WAITING_STORAGE, states)
+        self.assertNotIn(THREAD_STORAGE, waited)
+        self.assertIn(THREAD_WAIT_FOR_CONNECTING_NM, waited)
+        payload.needs_storage.assert_called_once_with(False)
+
+    def local_source_test(self):
+        """Test the payload thread with a local source."""
+        payload = self._get_payload(True, False)
+        states, waited = self._run_thread(payload)
+
+        self.assertIn(PayloadState.WAITING_NETWORK, states)
+        self.assertIn(THREAD_STORAGE, waited)
+        self.assertIn(THREAD_WAIT_FOR_CONNECTING_NM, waited)
+
+    def fallback_test(self):
+        """Test the payload thread with a fallback to the closest mirror."""
+        payload = self._get_payload(True, False, PAYLOAD_TYPE_DNF)
+        waited = []
+
+        def _update_base_repo(fallback, checkmount):
+            self.assertIn(THREAD_WAIT_FOR_CONNECTING_NM, waited)
+
+        payload.update_base_repo.side_effect = _update_base_repo
+
+        with patch("pyanaconda.payload.manager.threadMgr") as thread_mgr:
+            thread_mgr.wait.side_effect = waited.append
+            PayloadManager()._run_thread(payload, True, True, False)
+
+        payload.update_base_repo.assert_called_once_with(fallback=True, checkmount=True)
+        payload.post_setup.assert_called_once_with()
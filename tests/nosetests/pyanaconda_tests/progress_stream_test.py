@@ -0,0 +1,132 @@
+#
+# Copyright (C) 2026  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from pyanaconda.core.signal import Signal
+from pyanaconda.installation_tasks import Task, TaskQueue, DBusTask
+from pyanaconda.progress_stream import ProgressStream
+from pyanaconda.queuefactory import QueueFactory
+
+
+class ProgressStreamTestCase(unittest.TestCase):
+    """Test the progress stream."""
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp_dir.name, "install", "progress.jsonl")
+        self.stream = ProgressStream(self.path, counter_interval=60)
+        self.assertEqual(self.stream.open(), True)
+
+        self.queue = QueueFactory("progress")
+        self.queue.addMessage("init", 1)
+        self.queue.addMessage("step", 0)
+        self.queue.addMessage("message", 1)
+        self.queue.addMessage("complete", 0)
+        self.queue.addMessage("quit", 1)
+        self.queue.addMessage("packages", 2)
+        self.queue.addMessage("download", 2)
+
+    def tearDown(self):
+        self.stream.close()
+        self._tmp_dir.cleanup()
+
+    def _read_events(self):
+        """Read the events from the stream."""
+        with open(self.path) as f:
+            return [json.loads(line) for line in f]
+
+    def progress_queue_test(self):
+        """Test the events of the progress queue."""
+        self.stream.watch_progress_queue(self.queue)
+
+        self.queue.send_init(2)
+        self.queue.send_step()
+        self.queue.send_message("Installing")
+        self.queue.send_packages(1, 3)
+        self.queue.send_packages(2, 3)
+        self.queue.send_packages(3, 3)
+        self.queue.send_complete()
+
+        # The queue is still usable by other consumers.
+        self.assertEqual(self.queue.q.qsize(), 7)
+
+        events = self._read_events()
+        self.assertEqual(
+            [e["event"] for e in events],
+            ["init", "step", "message", "packages", "packages", "complete"]
+        )
+
+        self.assertEqual(events[0]["steps"], 2)
+        self.assertEqual(events[1]["step"], 1)
+        self.assertEqual(events[2]["message"], "Installing")
+        self.assertEqual(events[3]["done"], 1)
+        self.assertEqual(events[4]["done"], 3)
+        self.assertEqual(events[4]["total"], 3)
+        self.assertIn("timestamp", events[5])
+
+    def task_queue_test(self):
+        """Test the events of the task queue."""
+        task_proxy = Mock()
+        task_proxy.Name = "DBus task"
+        task_proxy.ProgressChanged = Signal()
+
+        dbus_task = DBusTask(task_proxy)
+        dbus_task.run_task = lambda: dbus_task._show_message(1, "Working")
+
+        queue = TaskQueue("Main queue")
+        sub_queue = TaskQueue("Sub queue")
+        sub_queue.append(Task("Task", Mock()))
+        sub_queue.append(dbus_task)
+        queue.append(sub_queue)
+
+        self.stream.watch_progress_queue(self.queue)
+        self.stream.watch_task_queue(queue)
+        queue.start()
+
+        events = self._read_events()
+        self.assertEqual(
+            [(e["event"], e["queue"], e["task"]) for e in events],
+            [
+                ("queue_started", "Sub queue", None),
+                ("task_started", "Sub queue", "Task"),
+                ("task_completed", "Sub queue", "Task"),
+                ("task_started", "Sub queue", "DBus task"),
+                ("task_progress", "Sub queue", "DBus task"),
+                ("task_completed", "Sub queue", "DBus task"),
+                ("queue_completed", "Sub queue", None),
+            ]
+        )
+
+        self.assertEqual(events[4]["task_step"], 1)
+        self.assertEqual(events[4]["message"], "Working")
+
+    def error_test(self):
+        """Test the error event."""
+        self.stream.report_error(RuntimeError("Fake error."))
+        self.stream.close()
+        self.stream.report_error(RuntimeError("Ignored error."))
+
+        events = self._read_events()
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]["event"], "error")
+        self.assertEqual(events[0]["error"], "RuntimeError")
+        self.assertEqual(events[0]["message"], "Fake error.")
@@ -0,0 +1,193 @@
+#
+# Copyright (C) 2026  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from pykickstart.version import makeVersion
+from requests import RequestException
+
+from pyanaconda.core.kickstart.sources import find_remote_includes, CachingKickstartParser
+from pyanaconda.core.remote_cache import RemoteResourceCache, RemoteResourceError
+
+URL = "http://server/ks.cfg"
+
+
+class RemoteResourceCacheTestCase(unittest.TestCase):
+    """Test the cache of remote resources."""
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = RemoteResourceCache(os.path.join(self._tmp_dir.name, "remote"))
+        self.session = Mock()
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def _set_response(self, status_code=200, content=b"", headers=None):
+        response = Mock()
+        response.status_code = status_code
+        response.ok = status_code < 400
+        response.content = content
+        response.headers = headers or {}
+        self.session.get.return_value = response
+
+    def fetch_test(self):
+        """Test the fetching of a resource."""
+        self.assertIsNone(self.cache.get_cached_path(URL))
+        self._set_response(content=b"text\n")
+
+        path = self.cache.fetch(URL, self.session)
+        self.assertEqual(self.cache.get_cached_path(URL), path)
+        self.assertEqual(self.cache.load_to_str(URL, self.session), "text\n")
+
+        # The cached resource is used.
+        self.session.get.assert_called_once()
+
+    def revalidate_test(self):
+        """Test the revalidation of a resource."""
+        self._set_response(content=b"old", headers={"etag": "1", "last-modified": "today"})
+        self.assertEqual(self.cache.load_to_str(URL, self.session), "old")
+
+        self._set_response(status_code=304)
+        self.assertEqual(self.cache.load_to_str(URL, self.session, revalidate=True), "old")
+
+        headers = self.session.get.call_args[1]["headers"]
+        self.assertEqual(headers, {"If-None-Match": "1", "If-Modified-Since": "today"})
+
+        self._set_response(content=b"new", headers={"etag": "2"})
+        self.assertEqual(self.cache.load_to_str(URL, self.session, revalidate=True), "new")
+
+        self._set_response(status_code=304)
+        self.cache.load_to_str(URL, self.session, revalidate=True)
+        headers = self.session.get.call_args[1]["headers"]
+        self.assertEqual(headers, {"If-None-Match": "2"})
+
+    def headers_test(self):
+        """Test the additional headers."""
+        self._set_response(content=b"text")
+        self.cache.fetch(URL, self.session, headers={"X-Test": "yes"})
+
+        headers = self.session.get.call_args[1]["headers"]
+        self.assertEqual(headers, {"X-Test": "yes"})
+
+    def errors_test(self):
+        """Test the errors of fetching."""
+        self._set_response(status_code=404)
+
+        with self.assertRaises(RemoteResourceError) as cm:
+            self.cache.fetch(URL, self.session)
+
+        self.assertEqual(cm.exception.status_code, 404)
+        self.assertIsNone(self.cache.get_cached_path(URL))
+
+        self.session.get.side_effect = RequestException("Fake error!")
+
+        with self.assertRaises(RemoteResourceError) as cm:
+            self.cache.fetch(URL, self.session)
+
+        self.assertIsNone(cm.exception.status_code)
+
+    def store_error_test(self):
+        """Test the errors of storing a resource."""
+        self._set_response(content=b"text")
+
+        with patch("pyanaconda.core.remote_cache.os.replace", side_effect=OSError("Fake!")), \
+                patch("pyanaconda.core.remote_cache.os.unlink", side_effect=OSError("Other!")):
+            with self.assertRaises(RemoteResourceError) as cm:
+                self.cache.fetch(URL, self.session)
+
+        self.assertIn("Fake!", str(cm.exception))
+        self.assertIsNone(self.cache.get_cached_path(URL))
+
+    def local_file_test(self):
+        """Test the local files."""
+        path = os.path.join(self._tmp_dir.name, "ks.cfg")
+
+        with open(path, "w") as f:
+            f.write("text")
+
+        self.assertEqual(self.cache.fetch("file://" + path, self.session), path)
+        self.assertEqual(self.cache.load_to_str("file://" + path, self.session), "text")
+        self.session.get.assert_not_called()
+
+        with self.assertRaises(RemoteResourceError) as cm:
+            self.cache.fetch("file://" + path + ".missing", self.session)
+
+        self.assertEqual(cm.exception.status_code, 404)
+
+    def shared_cache_test(self):
+        """Test the cache shared by more instances."""
+        self._set_response(content=b"text")
+        self.cache.fetch(URL, self.session)
+
+        session = Mock()
+        cache = RemoteResourceCache(self.cache.cache_dir)
+        self.assertEqual(cache.load_to_str(URL, session), "text")
+        session.get.assert_not_called()
+
+    def prefetch_test(self):
+        """Test the prefetching of resources."""
+        self._set_response(content=b"text")
+        self.cache.prefetch([URL, URL, "file:///ks.cfg"], self.session)
+
+        for _i in range(100):
+            if self.cache.get_cached_path(URL):
+                break
+
+            time.sleep(0.05)
+
+        self.assertEqual(self.cache.load_to_str(URL, self.session), "text")
+        self.session.get.assert_called_once()
+
+        # The cached resources are not fetched again.
+        self.cache.prefetch([URL], self.session)
+        self.session.get.assert_called_once()
+
+    def find_remote_includes_test(self):
+        """Test the search for remote includes."""
+        content = "\n".join([
+            "%include http://server/one.cfg",
+            "  %include ftp://server/two.cfg  # comment",
+            "%include /tmp/local.cfg",
+            "%include file:///tmp/local.cfg",
+            "# %include http://server/three.cfg",
+            "url --url=http://server/tree",
+            "%include 'http://server/four.cfg",
+        ])
+
+        self.assertEqual(find_remote_includes(content), [
+            "http://server/one.cfg",
+            "ftp://server/two.cfg",
+        ])
+
+    def kickstart_parser_test(self):
+        """Test the kickstart parser with cached sources."""
+        self._set_response(content=b"network --device=ens3\n")
+        self.cache.fetch(URL, self.session)
+
+        parser = CachingKickstartParser(makeVersion())
+
+        with patch("pyanaconda.core.kickstart.sources.get_remote_cache") as get_cache:
+            get_cache.return_value = self.cache
+            parser.readKickstart(URL)
+
+        self.assertEqual(parser.handler.network.network[0].device, "ens3")
+        self.session.get.assert_called_once()
@@ -0,0 +1,123 @@
+#
+# Copyright (C) 2026  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from pyanaconda.core.session_pool import SessionPool, SessionStatistics, PooledHTTPAdapter, \
+    get_shared_session
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Reply to GET requests with 100 bytes."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        body = b"x" * 100
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+class SessionPoolTestCase(unittest.TestCase):
+    """Test the shared pool of sessions."""
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _RequestHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.url = "http://127.0.0.1:{}/file".format(self.server.server_address[1])
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def shared_session_test(self):
+        """Test that the sessions are shared."""
+        pool = SessionPool()
+        session = pool.get_session()
+
+        self.assertIs(session, pool.get_session())
+        self.assertIs(session, pool.get_session(proxies={}, verify=True))
+        self.assertIsNot(session, pool.get_session(verify=False))
+        self.assertIsNot(session, pool.get_session(proxies={"https": "http://proxy"}))
+        self.assertIs(
+            pool.get_session(cert=["cert", "key"]),
+            pool.get_session(cert=("cert", "key"))
+        )
+        self.assertIs(get_shared_session(), get_shared_session())
+
+    def session_settings_test(self):
+        """Test the settings of the session."""
+        pool = SessionPool()
+        session = pool.get_session(proxies={"https": "http://proxy"}, verify=False, cert="cert")
+
+        self.assertEqual(session.proxies, {"https": "http://proxy"})
+        self.assertEqual(session.verify, False)
+        self.assertEqual(session.cert, "cert")
+
+    def statistics_test(self):
+        """Test the statistics of the sessions."""
+        pool = SessionPool()
+        session = pool.get_session()
+
+        for _i in range(5):
+            response = session.get(self.url)
+            self.assertEqual(response.status_code, 200)
+
+        response = session.get(self.url, stream=True)
+        self.assertEqual(len(response.content), 100)
+
+        # The connection is kept alive.
+        self.assertEqual(pool.statistics.requests, 6)
+        self.assertEqual(pool.statistics.bytes, 600)
+        self.assertEqual(pool.statistics.connections, 1)
+        self.assertGreaterEqual(pool.statistics.connection_time, 0)
+        self.assertIn("6 requests, 600 bytes, 1 connections", str(pool.statistics))
+
+    def pool_timeout_test(self):
+        """Test the time of waiting for a free connection."""
+        session = requests.Session()
+        adapter = PooledHTTPAdapter(SessionStatistics(), connections_per_host=1, pool_timeout=0.1)
+        session.mount("http://", adapter)
+
+        # The streamed response keeps the only connection.
+        response = session.get(self.url, stream=True)
+
+        with self.assertRaises(requests.ConnectionError):
+            session.get(self.url)
+
+        # The closed response releases the connection.
+        response.close()
+        self.assertEqual(session.get(self.url).status_code, 200)
+
+    def close_test(self):
+        """Test the close of the sessions."""
+        pool = SessionPool()
+        session = pool.get_session()
+        session.get(self.url)
+
+        pool.close()
+        self.assertIsNot(session, pool.get_session())
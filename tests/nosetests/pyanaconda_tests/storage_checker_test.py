@@ -19,6 +19,8 @@
 # Red Hat Author(s): Vendula Poncova <vponcova@redhat.com>
 #
 import unittest
+from unittest.mock import Mock, PropertyMock
+
 import pyanaconda.modules.storage.checker.utils as checks
 
 from blivet.size import Size
@@ -274,3 +276,113 @@ class StorageCheckerTests(unittest.TestCase):
             checks.verify_mounted_partitions,
             checks.verify_lvm_destruction,
         ])
+
+    def _get_device(self, name, mountpoint=None):
+        device = Mock(parents=[], children=[])
+        device.name = name
+        device.format.mountpoint = mountpoint
+        return device
+
+    def snapshot_test(self):
+        """Test the snapshot of the storage."""
+        storage = Mock()
+        mountpoints = PropertyMock(return_value={"/": self._get_device("root", "/")})
+        type(storage).mountpoints = mountpoints
+
+        checker = StorageChecker()
+
+        def check(storage, constraints, report_error, report_warning):
+            report_warning(sorted(storage.mountpoints))
+            report_warning(storage.bootloader is storage_bootloader)
+
+        storage_bootloader = storage.bootloader
+        checker.add_check(check)
+        checker.add_check(check)
+
+        report = checker.check(storage)
+        self.assertEqual(report.warnings, [["/"], True, ["/"], True])
+        mountpoints.assert_called_once_with()
+
+    def incremental_test(self):
+        """Test the incremental mode."""
+        root = self._get_device("root", "/")
+        home = self._get_device("home", "/home")
+        storage = Mock(mountpoints={"/": root})
+
+        checker = StorageChecker()
+        calls = []
+
+        @checks.depends_on(checks.CHECK_INPUT_MOUNTPOINTS)
+        def mountpoints_check(storage, constraints, report_error, report_warning):
+            calls.append("mountpoints")
+            report_error("Mount points: {}".format(sorted(storage.mountpoints)))
+
+        def other_check(storage, constraints, report_error, report_warning):
+            calls.append("other")
+            report_warning("other")
+
+        checker.add_check(mountpoints_check)
+        checker.add_check(other_check)
+
+        # Run all checks.
+        report = checker.check(storage, incremental=True)
+        self.assertEqual(calls, ["mountpoints", "other"])
+        self.assertEqual(report.errors, ["Mount points: ['/']"])
+        self.assertEqual(report.warnings, ["other"])
+
+        # Reuse the result of the mount points check.
+        calls.clear()
+        report = checker.check(storage, incremental=True)
+        self.assertEqual(calls, ["other"])
+        self.assertEqual(report.errors, ["Mount points: ['/']"])
+        self.assertEqual(report.warnings, ["other"])
+        self.assertIn("Reused sanity check mountpoints_check.", report.info)
+
+        # The mount points have changed.
+        calls.clear()
+        storage.mountpoints = {"/": root, "/home": home}
+        report = checker.check(storage, incremental=True)
+        self.assertEqual(calls, ["mountpoints", "other"])
+        self.assertEqual(report.errors, ["Mount points: ['/', '/home']"])
+
+        # The format of a device has changed.
+        calls.clear()
+        home.format.mountpoint = "/var"
+        storage.mountpoints = {"/": root, "/var": home}
+        report = checker.check(storage, incremental=True)
+        self.assertEqual(calls, ["mountpoints", "other"])
+
+        # The constraints have changed.
+        calls.clear()
+        checker.add_constraint("x", 1)
+        checker.check(storage, incremental=True)
+        self.assertEqual(calls, ["mountpoints", "other"])
+
+        # Don't reuse results in the default mode.
+        calls.clear()
+        checker.check(storage)
+        self.assertEqual(calls, ["mountpoints", "other"])
+
+    def bootloader_fingerprint_test(self):
+        """Test the fingerprint of the bootloader."""
+        disk = self._get_device("sda")
+        stage2 = self._get_device("sda1", "/boot")
+
+        def get_fingerprint(**kwargs):
+            bootloader = Mock(skip_bootloader=False, stage1_device=disk,
+                              stage2_device=stage2, stage1_disk=disk)
+            bootloader.configure_mock(**kwargs)
+
+            snapshot = checks.StorageCheckerSnapshot(Mock(bootloader=bootloader))
+            return snapshot.get_fingerprint(checks.CHECK_INPUT_BOOTLOADER)
+
+        # The same configuration of a different instance.
+        self.assertEqual(get_fingerprint(), get_fingerprint())
+
+        # A different configuration.
+        self.assertNotEqual(get_fingerprint(), get_fingerprint(stage1_device=stage2))
+        self.assertNotEqual(get_fingerprint(), get_fingerprint(stage2_device=None))
+        self.assertIsNone(get_fingerprint(skip_bootloader=True))
+
+        # The bootloader check updates the bootloader errors, so it always runs.
+        self.assertIsNone(getattr(checks.verify_bootloader, "inputs", None))
@@ -0,0 +1,101 @@
+#
+# Copyright (C) 2026  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import unittest
+
+from dasbus.structure import DBusStructureError, compare_data
+from dasbus.typing import *  # pylint: disable=wildcard-import
+
+from pyanaconda.modules.common.structures.codec import get_structure_codec
+from pyanaconda.modules.common.structures.payload import RepoConfigurationData
+from pyanaconda.modules.common.structures.storage import DeviceActionData, DeviceData
+
+
+class StructureCodecTestCase(unittest.TestCase):
+    """Test the compiled codecs of DBus structures."""
+
+    def _get_action_data(self, number):
+        """Get an instance of DeviceActionData."""
+        data = DeviceActionData()
+        data.action_type = "create"
+        data.action_description = "create device"
+        data.object_type = "device"
+        data.object_description = "partition"
+        data.device_name = "dev{}".format(number)
+        data.device_description = "Partition {}".format(number)
+        data.attrs = {"mount-point": "/mnt/{}".format(number)}
+        return data
+
+    def cache_test(self):
+        """Test the cache of codecs."""
+        codec = get_structure_codec(DeviceData)
+        self.assertIs(codec, get_structure_codec(DeviceData))
+        self.assertEqual(codec.data_type, DeviceData)
+
+    def to_structure_test(self):
+        """Test the conversion to a DBus structure."""
+        codec = get_structure_codec(DeviceActionData)
+        data = self._get_action_data(1)
+
+        self.assertEqual(codec.to_structure(data), DeviceActionData.to_structure(data))
+
+        with self.assertRaises(TypeError):
+            codec.to_structure(DeviceData())
+
+    def from_structure_test(self):
+        """Test the conversion from a DBus structure."""
+        codec = get_structure_codec(DeviceActionData)
+        data = self._get_action_data(1)
+        structure = DeviceActionData.to_structure(data)
+
+        self.assertTrue(compare_data(codec.from_structure(structure), data))
+
+        with self.assertRaises(TypeError):
+            codec.from_structure([])
+
+        with self.assertRaises(DBusStructureError):
+            codec.from_structure({"unknown": get_variant(Str, "")})
+
+    def nested_structure_test(self):
+        """Test the conversion of a nested DBus structure."""
+        codec = get_structure_codec(RepoConfigurationData)
+        data = RepoConfigurationData()
+        data.name = "my-repo"
+        data.url = "http://my/repo"
+        data.ssl_configuration.ca_cert_path = "/my/ca.crt"
+
+        structure = codec.to_structure(data)
+        self.assertEqual(structure, RepoConfigurationData.to_structure(data))
+
+        result = codec.from_structure(structure)
+        self.assertTrue(compare_data(result, data))
+        self.assertEqual(result.ssl_configuration.ca_cert_path, "/my/ca.crt")
+
+    def structure_list_test(self):
+        """Test the conversion of a list of DBus structures."""
+        codec = get_structure_codec(DeviceActionData)
+        objects = [self._get_action_data(i) for i in range(100)]
+
+        structures = codec.to_structure_list(objects)
+        self.assertEqual(structures, DeviceActionData.to_structure_list(objects))
+
+        result = codec.from_structure_list(structures)
+        self.assertEqual(len(result), 100)
+        self.assertTrue(all(map(compare_data, result, objects)))
+
+        with self.assertRaises(TypeError):
+            codec.from_structure_list({})
@@ -0,0 +1,114 @@
+#
+# Copyright (C) 2026  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import threading
+import unittest
+
+from pyanaconda.core.constants import THREAD_PRIORITY_HIGH, THREAD_PRIORITY_LOW
+from pyanaconda.threading import threadMgr, AnacondaThread
+
+
+class ThreadPoolTestCase(unittest.TestCase):
+    """Test the pooled threads of the thread manager."""
+
+    def setUp(self):
+        self._max_workers = threadMgr.max_workers
+        threadMgr.max_workers = 1
+
+        self.event = threading.Event()
+        self.order = []
+
+    def tearDown(self):
+        self.event.set()
+        threadMgr.max_workers = self._max_workers
+
+    def _add_thread(self, name, priority=THREAD_PRIORITY_LOW, wait=False):
+        """Add a pooled thread."""
+        def _target():
+            if wait:
+                self.event.wait()
+
+            self.order.append(name)
+
+        thread = AnacondaThread(name=name, target=_target, pooled=True, priority=priority)
+        threadMgr.add(thread)
+        return thread
+
+    def priority_test(self):
+        """Test the priorities of the pooled threads."""
+        first = self._add_thread("AnaTestFirst", wait=True)
+        low = self._add_thread("AnaTestLow")
+        high = self._add_thread("AnaTestHigh", priority=THREAD_PRIORITY_HIGH)
+
+        self.assertEqual(first.is_alive(), True)
+        self.assertEqual(low.ident, None)
+        self.assertEqual(high.ident, None)
+        self.assertEqual(threadMgr.exists("AnaTestLow"), True)
+
+        self.event.set()
+        low.future.result(timeout=10)
+
+        self.assertEqual(self.order, ["AnaTestFirst", "AnaTestHigh", "AnaTestLow"])
+        self.assertEqual(threadMgr.exists("AnaTestLow"), False)
+
+    def wait_test(self):
+        """Test waiting for a pending thread."""
+        self._add_thread("AnaTestFirst", wait=True)
+        self._add_thread("AnaTestSecond")
+
+        # The waited thread doesn't wait for a free worker.
+        threadMgr.wait("AnaTestSecond")
+        self.assertEqual(self.order, ["AnaTestSecond"])
+
+        self.event.set()
+        threadMgr.wait("AnaTestFirst")
+        self.assertEqual(self.order, ["AnaTestSecond", "AnaTestFirst"])
+
+    def cancel_test(self):
+        """Test cancelling of a pending thread."""
+        first = self._add_thread("AnaTestFirst", wait=True)
+        second = self._add_thread("AnaTestSecond")
+
+        self.assertEqual(threadMgr.cancel("AnaTestFirst"), False)
+        self.assertEqual(threadMgr.cancel("AnaTestSecond"), True)
+        self.assertEqual(threadMgr.exists("AnaTestSecond"), False)
+        self.assertEqual(second.future.cancelled(), True)
+
+        # A cancelled future is skipped.
+        third = self._add_thread("AnaTestThird")
+        third.future.cancel()
+
+        self.event.set()
+        first.future.result(timeout=10)
+        threadMgr.wait("AnaTestThird")
+
+        self.assertEqual(self.order, ["AnaTestFirst"])
+        self.assertEqual(threadMgr.exists("AnaTestThird"), False)
+
+    def future_test(self):
+        """Test the future of a failed thread."""
+        def _fail():
+            raise ValueError("Fake error.")
+
+        thread = AnacondaThread(name="AnaTestFailed", target=_fail, fatal=False, pooled=True)
+        threadMgr.add(thread)
+
+        with self.assertRaises(ValueError):
+            thread.future.result(timeout=10)
+
+        with self.assertRaises(ValueError):
+            threadMgr.raise_if_error("AnaTestFailed")
@@ -0,0 +1,189 @@
+#
+# Copyright (C) 2026  Red Hat, Inc.
+#
+# This copyrighted material is made available to anyone wishing to use,
+# modify, copy, or redistribute it subject to the terms and conditions of
+# the GNU General Public License v.2, or (at your option) any later version.
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY expressed or implied, including the implied warranties of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+# Public License for more details.  You should have received a copy of the
+# GNU General Public License along with this program; if not, write to the
+# Free Software Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301, USA.  Any Red Hat trademarks that are incorporated in the
+# source code or documentation are not subject to the GNU General Public
+# License and may only be used or replicated with the express permission of
+# Red Hat, Inc.
+#
+import unittest
+from unittest.mock import Mock
+
+from pyanaconda.core.constants import THREAD_PROGRESS_CHANNEL
+from pyanaconda.queuefactory import QueueFactory
+from pyanaconda.threading import threadMgr
+from pyanaconda.ui.lib.progress import ProgressRate, ProgressChannel, ProgressState, \
+    get_progress_rate_text
+
+
+def _create_queue_factory():
+    """Create a queue factory with the progress messages."""
+    q = QueueFactory("progress")
+    q.addMessage("init", 1)
+    q.addMessage("step", 0)
+    q.addMessage("message", 1)
+    q.addMessage("complete", 0)
+    q.addMessage("quit", 1)
+    q.addMessage("packages", 2)
+    q.addMessage("download", 2)
+    return q
+
+
+class ProgressRateTestCase(unittest.TestCase):
+    """Test the progress rate."""
+
+    def rate_test(self):
+        """Test the rate and the remaining time."""
+        rate = ProgressRate(smoothing=0.5)
+        self.assertEqual(rate.active, False)
+        self.assertEqual(rate.eta, None)
+
+        rate.update(0, 100, timestamp=0)
+        self.assertEqual(rate.active, True)
+        self.assertEqual(rate.eta, None)
+
+        rate.update(10, 100, timestamp=1)
+        self.assertEqual(rate.rate, 10)
+        self.assertEqual(rate.eta, 9)
+
+        rate.update(40, 100, timestamp=2)
+        self.assertEqual(rate.rate, 20)
+        self.assertEqual(rate.eta, 3)
+
+        rate.update(100, 100, timestamp=3)
+        self.assertEqual(rate.active, False)
+        self.assertEqual(rate.eta, None)
+
+    def rate_text_test(self):
+        """Test the text with the rate."""
+        state = ProgressState()
+        self.assertEqual(get_progress_rate_text(state), "")
+
+        state.packages.update(0, 10, timestamp=0)
+        state.packages.update(5, 10, timestamp=2)
+        self.assertEqual(get_progress_rate_text(state), "2.5 packages/s, 0:00:02 remaining")
+
+
+class ProgressChannelTestCase(unittest.TestCase):
+    """Test the progress channel."""
+
+    def setUp(self):
+        self.queue = _create_queue_factory()
+        self.channel = ProgressChannel(self.queue)
+
+    def read_timeout_test(self):
+        """Test reading of an empty queue."""
+        self.assertEqual(self.channel.read(timeout=0), False)
+        self.assertEqual(self.channel.state.messages, [])
+
+    def read_test(self):
+        """Test reading of the messages."""
+        self.queue.send_init(4)
+        self.queue.send_step()
+        self.queue.send_message("First")
+        self.queue.send_step()
+        self.queue.send_message("Second")
+        self.queue.send_packages(1, 10)
+
+        self.assertEqual(self.channel.read(timeout=0), True)
+        self.assertEqual(self.queue.q.empty(), True)
+
+        state = self.channel.state
+        self.assertEqual(state.steps, 4)
+        self.assertEqual(state.step, 2)
+        self.assertEqual(state.fraction, 0.5)
+        self.assertEqual(state.message, "Second")
+        self.assertEqual(state.messages, ["First", "Second"])
+        self.assertEqual(state.packages.done, 1)
+        self.assertEqual(state.packages.total, 10)
+        self.assertEqual(state.finished, False)
+
+        self.queue.send_complete()
+        self.assertEqual(self.channel.read(timeout=0), True)
+
+        state = self.channel.state
+        self.assertEqual(state.fraction, 1.0)
+        self.assertEqual(state.finished, True)
+        self.assertEqual(state.message, "Second")
+        self.assertEqual(state.messages, [])
+
+    def messages_test(self):
+        """Test that every status message is handed out only once."""
+        self.queue.send_message("First")
+        self.channel.read(timeout=0)
+        self.queue.send_packages(1, 10)
+        self.channel.read(timeout=0)
+
+        state = self.channel.state
+        self.assertEqual(state.messages, ["First"])
+        self.assertEqual(state.packages.done, 1)
+
+        self.queue.send_message("Second")
+        self.queue.send_packages(2, 10)
+        self.channel.read(timeout=0)
+
+        self.assertEqual(state.messages, ["First"])
+        self.assertEqual(state.packages.done, 1)
+
+        state = self.channel.state
+        self.assertEqual(state.message, "Second")
+        self.assertEqual(state.messages, ["Second"])
+        self.assertEqual(state.packages.done, 2)
+        self.assertEqual(self.channel.state.messages, [])
+
+    def quit_test(self):
+        """Test the quit message."""
+        self.queue.send_quit(1)
+        self.channel.read(timeout=0)
+
+        state = self.channel.state
+        self.assertEqual(state.exit_code, 1)
+        self.assertEqual(state.complete, False)
+        self.assertEqual(state.finished, True)
+
+    def watch_test(self):
+        """Test watching of the progress."""
+        callback = Mock()
+        schedule = Mock()
+
+        self.queue.send_init(1)
+        self.queue.send_step()
+        self.queue.send_complete()
+
+        self.channel._watch(callback, schedule, 0)
+
+        schedule.assert_called_once()
+        func, state = schedule.call_args[0]
+        self.assertEqual(func, callback)
+        self.assertEqual(state.step, 1)
+        self.assertEqual(state.complete, True)
+
+    def watch_thread_test(self):
+        """Test that the installation doesn't wait for the watching thread."""
+        callback = Mock()
+        schedule = Mock()
+
+        thread = self.channel.watch(callback, schedule, interval=0)
+        self.assertEqual(thread.is_alive(), True)
+
+        # The installation waits for all threads of the thread manager.
+        self.assertNotIn(THREAD_PROGRESS_CHANNEL, threadMgr.names)
+        threadMgr.wait_all()
+        self.assertEqual(thread.is_alive(), True)
+
+        # The thread stops when the installation is finished.
+        self.queue.send_complete()
+        thread.join(timeout=5)
+        self.assertEqual(thread.is_alive(), False)
+
+        _func, state = schedule.call_args[0]
+        self.assertEqual(state.complete, True)
@@ -855,3 +855,37 @@ class MiscTests(unittest.TestCase):
         )
         self.assertEqual(get_anaconda_version_string(), "1.0")
         self.assertEqual(get_anaconda_version_string(build_time_version=True), "1.0-1")
+
+    @patch.dict('sys.modules')
+    def collect_test(self):
+        """Test the collect function."""
+        path = os.path.join(ANACONDA_TEST_DIR, "collect")
+        os.makedirs(path)
+
+        with open(os.path.join(path, "classes.py"), "w") as f:
+            f.write("class A(object):\n    pass\n\nclass B(A):\n    pass\n\nC = 1\n")
+
+        module_pattern = "anaconda_collect_test.%s"
+
+        with patch("pyanaconda.core.util._collect_classes",
+                   wraps=util._collect_classes) as collect_classes:
+            classes = util.collect(module_pattern, path, lambda obj: True)
+            self.assertEqual([c.__name__ for c in classes], ["A", "B"])
+
+            # The directory is traversed only once.
+            classes = util.collect(module_pattern, path, lambda obj: obj.__name__ == "B")
+            self.assertEqual([c.__name__ for c in classes], ["B"])
+            collect_classes.assert_called_once_with(module_pattern, path)
+
+            # The directory is traversed again if it is modified.
+            with open(os.path.join(path, "other.py"), "w") as f:
+                f.write("class D(object):\n    pass\n")
+
+            os.utime(path, ns=(0, 0))
+
+            classes = util.collect(module_pattern, path, lambda obj: True)
+            self.assertEqual(sorted(c.__name__ for c in classes), ["A", "B", "D"])
+            self.assertEqual(collect_classes.call_count, 2)
+
+        # A missing directory has no classes.
+        self.assertEqual(util.collect(module_pattern, "/nonexistent/path", lambda obj: True), [])